@@ -0,0 +1,141 @@
+"""Generator of the input files for the import and edit benchmarks."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import json
+
+from tests.tools.jira_stub_server import JiraStubDataset, STUB_PROJECT_KEY
+
+################################################################################
+# Variables
+################################################################################
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def write_import_file(file_path: str, issues: int, subtasks: int, dataset: JiraStubDataset) -> int:
+    """ Write an import file with issues, sub-issues and components,
+        which uses the custom fields of the dataset.
+
+    Args:
+        file_path (str): The path to the JSON file.
+        issues (int): The number of issues, including the sub-issues.
+        subtasks (int): The number of sub-issues per issue.
+        dataset (JiraStubDataset): The dataset providing the custom fields and components.
+
+    Returns:
+        int: The number of issues written.
+    """
+    import_issues = []
+
+    while len(import_issues) < issues:
+        parent_id = str(len(import_issues) + 1)
+        import_issues.append(_get_import_issue(parent_id, "Task", dataset))
+
+        for _ in range(min(subtasks, issues - len(import_issues))):
+            sub_issue = _get_import_issue(str(len(import_issues) + 1), "Sub-task", dataset)
+            sub_issue["parent"] = {"externalId": parent_id}
+            import_issues.append(sub_issue)
+
+    import_dict = {
+        "projectKey": {"key": STUB_PROJECT_KEY},
+        "components": [{"name": component["name"], "description": component["description"]}
+                       for component in dataset.components] +
+                      [{"name": "Benchmark", "description": "Created by the benchmark."}],
+        "issues": import_issues
+    }
+
+    with open(file_path, "w", encoding="utf-8") as import_file:
+        json.dump(import_dict, import_file, indent=4)
+
+    return len(import_issues)
+
+
+def write_edit_file(file_path: str, issues: int, dataset: JiraStubDataset) -> int:
+    """ Write an edit file which changes the summary and the custom fields
+        of the first issues of the dataset. The custom fields are referenced by name.
+
+    Args:
+        file_path (str): The path to the JSON file.
+        issues (int): The number of issues to edit.
+        dataset (JiraStubDataset): The dataset providing the issues and custom fields.
+
+    Returns:
+        int: The number of issues written.
+    """
+    edit_issues = []
+
+    for issue in dataset.issues[:issues]:
+        fields = {"Summary": f"Edited {issue['key']}"}
+
+        for field in dataset.custom_fields:
+            if "string" == field["schema"]["type"]:
+                fields[field["name"]] = f"Edited value of {field['name']}"
+
+        edit_issues.append({"key": issue["key"], "fields": fields})
+
+    with open(file_path, "w", encoding="utf-8") as edit_file:
+        json.dump({"issues": edit_issues}, edit_file, indent=4)
+
+    return len(edit_issues)
+
+
+def _get_import_issue(external_id: str, issue_type: str, dataset: JiraStubDataset) -> dict:
+    """ Get an import issue with values for the string and number custom fields. """
+    issue = {
+        "externalId": external_id,
+        "issuetype": {"name": issue_type},
+        "summary": f"Benchmark issue {external_id}",
+        "description": "Imported by the benchmark suite.",
+        "labels": ["benchmark"],
+        "components": [{"name": "Benchmark"}]
+    }
+
+    for field in dataset.custom_fields:
+        if "string" == field["schema"]["type"]:
+            issue[field["id"]] = f"Value {external_id}"
+        elif "number" == field["schema"]["type"]:
+            issue[field["id"]] = int(external_id)
+
+    return issue
+
+################################################################################
+# Main
+################################################################################
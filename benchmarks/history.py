@@ -0,0 +1,250 @@
+"""History of the benchmark runs and the detection of regressions."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+
+################################################################################
+# Variables
+################################################################################
+
+DEFAULT_THRESHOLD = 10.0  # Percent
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def add_parser(prog: str, description: str, history_file: str) -> tuple:
+    """ Add the parser with the modes 'run' and 'compare' shared by all benchmark suites.
+        The arguments of the suite are added to the returned parser of the mode 'run'.
+
+    Args:
+        prog (str): The name of the benchmark suite.
+        description (str): The description of the benchmark suite.
+        history_file (str): The default history file of the suite.
+
+    Returns:
+        tuple: The parser and the parser of the mode 'run'.
+    """
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+    subparser = parser.add_subparsers(dest="mode", required=True)
+
+    run_parser = subparser.add_parser("run", help="Run the benchmarks and add them to the history.")
+    run_parser.add_argument("--repeat", type=int, default=3,
+                            help="Repetitions per benchmark, the best time is taken. "
+                                 "Default is 3.")
+
+    compare_parser = subparser.add_parser("compare",
+                                          help="Compare two runs of the history.")
+    compare_parser.add_argument("--baseline", type=int, default=-2,
+                                help="Index of the baseline run in the history. "
+                                     "Default is -2, the run before the latest.")
+    compare_parser.add_argument("--current", type=int, default=-1,
+                                help="Index of the compared run in the history. "
+                                     "Default is -1, the latest run.")
+
+    for mode_parser in (run_parser, compare_parser):
+        mode_parser.add_argument("--history", type=str, default=history_file,
+                                 help="JSON file with the history of the runs.")
+        mode_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                 help="Tolerated increase of a metric in percent. Default is 10.")
+
+    return parser, run_parser
+
+
+def get_entry(dataset: dict, results: dict) -> dict:
+    """ Get the history entry of a run with the environment it ran in.
+
+    Args:
+        dataset (dict): The parameters of the dataset.
+        results (dict): The results by benchmark name.
+
+    Returns:
+        dict: The history entry.
+    """
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": _get_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "dataset": dataset,
+        "results": results
+    }
+
+
+def evaluate(args, run_function, metrics: list[str]) -> int:
+    """ Run the benchmarks and compare them to the latest run with the same dataset,
+        or compare two runs of the history, depending on the mode.
+
+    Args:
+        args (obj): The command line arguments.
+        run_function (callable): Runs the benchmarks with the arguments and returns the entry.
+        metrics (list[str]): The compared metrics. Lower values are better for all of them.
+
+    Returns:
+        int: 0 if no regression was found, otherwise 1.
+    """
+    history = _load_history(args.history)
+    baseline = None
+    current = None
+
+    if "run" == args.mode:
+        current = run_function(args)
+        baseline = _find_baseline(history, current["dataset"])
+        history.append(current)
+        _save_history(args.history, history)
+    elif len(history) >= 2:
+        baseline = history[args.baseline]
+        current = history[args.current]
+    else:
+        print("The history contains less than two runs.")
+
+    regressions = []
+
+    if current is not None:
+        regressions = compare(baseline, current, args.threshold, metrics)
+
+        for regression in regressions:
+            print(f"Regression: {regression}")
+
+    return 1 if regressions else 0
+
+
+def compare(baseline: dict, current: dict, threshold: float, metrics: list[str]) -> list[str]:
+    """ Compare the results of two runs and get the regressions.
+        A metric regresses if it is larger than the baseline by more than
+        the threshold. Benchmarks which failed in the current run always regress.
+
+    Args:
+        baseline (dict): The history entry of the baseline run or None.
+        current (dict): The history entry of the current run.
+        threshold (float): The tolerated increase in percent.
+        metrics (list[str]): The compared metrics.
+
+    Returns:
+        list[str]: The description of every regression.
+    """
+    regressions = []
+    baseline_results = {} if baseline is None else baseline["results"]
+
+    if (baseline is not None) and (baseline["dataset"] != current["dataset"]):
+        print("Warning: The dataset of the runs differs, the results are not comparable.")
+
+    if baseline is not None:
+        print(f"{'Benchmark':<22}{'Metric':<14}{'Baseline':>14}{'Current':>14}{'Change':>10}")
+
+    for name, result in current["results"].items():
+        baseline_result = baseline_results.get(name)
+        status = result.get("status", "RET_OK")
+
+        if "RET_OK" != status:
+            regressions.append(f"{name}: failed with {status}")
+
+        if baseline_result is None:
+            continue
+
+        for metric in metrics:
+            old_value = baseline_result.get(metric)
+            new_value = result.get(metric)
+
+            if (old_value is None) or (new_value is None):
+                continue
+
+            change = 0.0 if 0 == old_value else (new_value - old_value) * 100 / old_value
+            marker = ""
+
+            if change > threshold:
+                marker = " !"
+                regressions.append(f"{name}: {metric} increased by {change:.1f} %")
+
+            print(f"{name:<22}{metric:<14}{old_value:>14.3f}{new_value:>14.3f}"
+                  f"{change:>9.1f}%{marker}")
+
+    return regressions
+
+
+def _get_commit() -> str:
+    """ Get the current git commit or None outside of a git repository. """
+    commit = None
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                capture_output=True, check=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+
+    return commit
+
+
+def _find_baseline(history: list[dict], dataset: dict) -> dict:
+    """ Find the latest run in the history with the same dataset or None. """
+    baseline = None
+
+    for run in reversed(history):
+        if dataset == run["dataset"]:
+            baseline = run
+            break
+
+    return baseline
+
+
+def _load_history(file_path: str) -> list[dict]:
+    """ Load the history of the runs. A missing file is an empty history. """
+    history = []
+
+    if os.path.isfile(file_path):
+        with open(file_path, "r", encoding="utf-8") as history_file:
+            history = json.load(history_file)
+
+    return history
+
+
+def _save_history(file_path: str, history: list[dict]) -> None:
+    """ Save the history of the runs. """
+    with open(file_path, "w", encoding="utf-8") as history_file:
+        json.dump(history, history_file, indent=4)
+
+################################################################################
+# Main
+################################################################################
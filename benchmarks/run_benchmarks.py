@@ -0,0 +1,319 @@
+"""End-to-end benchmarks of the pyJiraCli commands against the Jira stub server."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows. The peak RSS is not recorded then.
+    resource = None
+
+from benchmarks import history
+from benchmarks.dataset import write_edit_file, write_import_file
+from tests.tools.jira_stub_server import JiraStubDataset, JiraStubServer, STUB_BOARD_NAME
+
+################################################################################
+# Variables
+################################################################################
+
+DEFAULT_HISTORY_FILE = os.path.join(os.path.dirname(__file__), "history.json")
+TOKEN = "DummyToken"
+
+# Number of single issues exported, each with its own command execution.
+EXPORT_ISSUES = 20
+
+# Upper limit of issues searched with all fields, as the worklogs are requested per issue.
+SEARCH_FULL_ISSUES = 200
+
+# Metrics compared between two runs. Lower values are better for all of them.
+COMPARED_METRICS = ["wall_time_s", "requests", "peak_rss_kb"]
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def get_scenarios(url: str, args, work_dir: str) -> dict:
+    """ Get the benchmark scenarios. Each scenario is a list of command lines
+        executed one after another and the number of items processed by them.
+
+    Args:
+        url (str): The URL of the stub server.
+        args (obj): The command line arguments of the benchmark.
+        work_dir (str): The directory for the input and output files.
+
+    Returns:
+        dict: The scenarios by name with the command lines and the number of items.
+    """
+    login = ["--server", url, "--token", TOKEN]
+    dataset = args.dataset
+    import_file = os.path.join(work_dir, "import.json")
+    edit_file = os.path.join(work_dir, "edit.json")
+    import_issues = write_import_file(import_file, args.import_issues, args.subtasks, dataset)
+    edit_issues = write_edit_file(edit_file, args.edit_issues, dataset)
+    full_issues = min(SEARCH_FULL_ISSUES, len(dataset.issues))
+    export_keys = [issue["key"] for issue in dataset.issues[:EXPORT_ISSUES]]
+
+    return {
+        "search": {
+            "commands": [["search", *login, "--max", "0",
+                          "--file", "search.json", "project = STUB"]],
+            "items": len(dataset.issues)
+        },
+        "search_print": {
+            "commands": [["search", *login, "--max", "0", "project = STUB"]],
+            "items": len(dataset.issues)
+        },
+        "search_full": {
+            "commands": [["search", *login, "--max", str(full_issues), "--full", "--translate",
+                          "--file", "search_full.json", "project = STUB ORDER BY key"]],
+            "items": full_issues
+        },
+        "export": {
+            "commands": [["export", *login, "--file", f"{key}.json", key] for key in export_keys],
+            "items": len(export_keys)
+        },
+        "export_many": {
+            "commands": [["export", *login, "--dir", "export", "--jql", "project = STUB"]],
+            "items": len(dataset.issues)
+        },
+        "import": {
+            "commands": [["import", *login, import_file]],
+            "items": import_issues
+        },
+        "edit": {
+            "commands": [["edit", *login, edit_file]],
+            "items": edit_issues
+        },
+        "get_sprints": {
+            "commands": [["get_sprints", *login, "--file", "sprints.json", STUB_BOARD_NAME]],
+            "items": len(dataset.sprints)
+        },
+        "scheme": {
+            "commands": [["scheme", *login], ["scheme", *login, "--project", "STUB"]],
+            "items": 2
+        }
+    }
+
+
+def run_scenario(commands: list[list[str]], work_dir: str) -> dict:
+    """ Execute the command lines of a scenario through the execute() function
+        of the commands. Runs in a fresh process, so the peak RSS and the class
+        level state of pyJiraCli only belong to this scenario.
+
+    Args:
+        commands (list[list[str]]): The command lines.
+        work_dir (str): The working directory for the output files.
+
+    Returns:
+        dict: The return status of the commands, the wall time and the peak RSS.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pyJiraCli.__main__ import add_parser
+    from pyJiraCli.ret import Ret
+
+    os.chdir(work_dir)
+    parser = add_parser()
+    status = Ret.CODE.RET_OK
+    output = io.StringIO()
+
+    start = time.perf_counter()
+
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        for command in commands:
+            try:
+                args = parser.parse_args(command)
+            except SystemExit:
+                status = Ret.CODE.RET_ERROR_ARGPARSE
+                break
+
+            status = args.func(args)
+
+            if Ret.CODE.RET_OK != status:
+                break
+
+    wall_time = time.perf_counter() - start
+
+    return {
+        "status": status.name,
+        "wall_time_s": wall_time,
+        "peak_rss_kb": _get_peak_rss_kb()
+    }
+
+
+def run_benchmarks(args) -> dict:
+    """ Run the selected scenarios against a stub server serving the synthetic dataset.
+
+    Args:
+        args (obj): The command line arguments of the benchmark.
+
+    Returns:
+        dict: The history entry with the environment, the dataset and the results.
+    """
+    args.dataset = JiraStubDataset(issues=args.issues,
+                                   custom_fields=args.custom_fields,
+                                   worklogs=args.worklogs,
+                                   subtasks=args.subtasks,
+                                   seed=args.seed)
+    stub = JiraStubServer(args.dataset, latency=args.latency)
+    results = {}
+    stub.start()
+
+    # Spawn a fresh interpreter per run, which does not inherit the stub server.
+    context = multiprocessing.get_context("spawn")
+
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            scenarios = get_scenarios(stub.url, args, work_dir)
+
+            for name in args.scenario or scenarios.keys():
+                results[name] = _measure(context, stub, scenarios[name], work_dir, args.repeat)
+                _print_result(name, results[name])
+    finally:
+        stub.stop()
+
+    return history.get_entry({"issues": args.issues,
+                              "custom_fields": args.custom_fields,
+                              "worklogs": args.worklogs,
+                              "subtasks": args.subtasks,
+                              "seed": args.seed,
+                              "latency_ms": args.latency,
+                              "import_issues": args.import_issues,
+                              "edit_issues": args.edit_issues},
+                             results)
+
+
+def _measure(context, stub: JiraStubServer, scenario: dict, work_dir: str, repeat: int) -> dict:
+    """ Measure a scenario. The best wall time of all repetitions is taken. """
+    runs = []
+
+    for _ in range(max(1, repeat)):
+        requests_before = stub.request_count
+
+        with context.Pool(1) as pool:
+            run = pool.apply(run_scenario, (scenario["commands"], work_dir))
+
+        run["requests"] = stub.request_count - requests_before
+        runs.append(run)
+
+    result = min(runs, key=lambda run: run["wall_time_s"])
+    result["items"] = scenario["items"]
+    result["items_per_s"] = scenario["items"] / result["wall_time_s"]
+    result["requests_per_s"] = result["requests"] / result["wall_time_s"]
+
+    return result
+
+
+def _get_peak_rss_kb() -> int:
+    """ Get the peak resident set size of the current process in kilobytes. """
+    peak_rss = None
+
+    if resource is not None:
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        # Reported in bytes on macOS and in kilobytes on Linux.
+        if "darwin" == sys.platform:
+            peak_rss //= 1024
+
+    return peak_rss
+
+
+def _print_result(name: str, result: dict) -> None:
+    """ Print the result of a scenario as a single line. """
+    print(f"{name:<16}{result['status']:<10}"
+          f"{result['wall_time_s']:>9.3f} s"
+          f"{result['requests']:>8} requests"
+          f"{result['items_per_s']:>11.1f} items/s"
+          f"{result['peak_rss_kb'] or 0:>10} kB peak RSS")
+
+
+def _add_parser() -> argparse.ArgumentParser:
+    """ Add the parser for the command line arguments of the benchmark. """
+    parser, run_parser = history.add_parser("benchmarks.run_benchmarks",
+                                            "End-to-end benchmarks of the pyJiraCli commands "
+                                            "against a local Jira stub server.",
+                                            DEFAULT_HISTORY_FILE)
+    run_parser.add_argument("--issues", type=int, default=1000,
+                            help="Number of issues of the dataset. Default is 1000.")
+    run_parser.add_argument("--custom-fields", type=int, default=20,
+                            help="Number of custom fields. Default is 20.")
+    run_parser.add_argument("--worklogs", type=int, default=2,
+                            help="Number of worklogs per issue. Default is 2.")
+    run_parser.add_argument("--subtasks", type=int, default=2,
+                            help="Number of sub-issues per issue. Default is 2.")
+    run_parser.add_argument("--import-issues", type=int, default=100,
+                            help="Number of issues imported. Default is 100.")
+    run_parser.add_argument("--edit-issues", type=int, default=100,
+                            help="Number of issues edited. Default is 100.")
+    run_parser.add_argument("--latency", type=float, default=0,
+                            help="Latency in milliseconds of the stub server. Default is 0.")
+    run_parser.add_argument("--seed", type=int, default=0,
+                            help="Seed of the dataset generator. Default is 0.")
+    run_parser.add_argument("--scenario", type=str, action="append",
+                            choices=["search", "search_print", "search_full", "export",
+                                     "export_many", "import", "edit", "get_sprints", "scheme"],
+                            help="Scenario to run. Can be used multiple times. "
+                                 "Default is all scenarios.")
+
+    return parser
+
+
+def main() -> int:
+    """ The benchmark entry point.
+
+    Returns:
+        int: 0 if no regression was found, otherwise 1.
+    """
+    return history.evaluate(_add_parser().parse_args(), run_benchmarks, COMPARED_METRICS)
+
+################################################################################
+# Main
+################################################################################
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""Micro-benchmarks of the CPU-bound hot paths on fixed payload fixtures."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import argparse
+import contextlib
+import copy
+import json
+import os
+import sys
+import timeit
+
+from pyJiraCli import cmd_edit
+from pyJiraCli import cmd_search
+from pyJiraCli.jira_server import Server
+from pyJiraCli.json_serializer import JsonSerializer
+
+from benchmarks import history
+from tests.tools.jira_stub_server import JiraStubDataset
+
+################################################################################
+# Variables
+################################################################################
+
+DEFAULT_HISTORY_FILE = os.path.join(os.path.dirname(__file__), "micro_history.json")
+
+# Number of system fields in the field catalogue of the stub dataset.
+SYSTEM_FIELDS = 19
+
+# Number of fields referenced by name per issue in the edit fixture.
+EDIT_FIELDS_PER_ISSUE = 20
+
+# Metrics compared between two runs.
+COMPARED_METRICS = ["best_s"]
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def get_fixtures(issues: int, fields: int, seed: int) -> dict:
+    """ Generate the payload fixtures. The payloads are derived from the stub dataset,
+        so they have the same shape as the responses of a Jira server.
+
+    Args:
+        issues (int): The number of issues.
+        fields (int): The number of fields in the field catalogue, including the system fields.
+        seed (int): The seed of the dataset generator.
+
+    Returns:
+        dict: The field catalogue, the search results with the default and with all fields
+              and the fields to edit per issue.
+    """
+    dataset = JiraStubDataset(issues=issues,
+                              custom_fields=max(0, fields - SYSTEM_FIELDS),
+                              worklogs=0,
+                              seed=seed)
+    field_names = [field["name"] for field in dataset.fields]
+
+    return {
+        "fields": dataset.fields,
+        "search_default": {
+            "issues": [{"key": issue["key"],
+                        "fields": {field_id: issue["fields"][field_id]
+                                   for field_id in cmd_search.DEFAULT_FIELDS}}
+                       for issue in dataset.issues]
+        },
+        "search_full": {
+            "search": "project = STUB",
+            "max": 0,
+            "found": len(dataset.issues),
+            "issues": dataset.issues
+        },
+        "edit": [{field_names[(idx + offset) % len(field_names)]: f"Edited {idx}"
+                  for offset in range(EDIT_FIELDS_PER_ISSUE)}
+                 for idx in range(len(dataset.issues))]
+    }
+
+
+def get_benchmarks(fixtures: dict) -> dict:
+    """ Get the benchmarks. Each benchmark is a function without arguments,
+        which processes all issues of the fixtures once.
+
+    Args:
+        fixtures (dict): The payload fixtures.
+
+    Returns:
+        dict: The benchmark functions by name.
+    """
+    server = Server()
+
+    # The field catalogue is provided by the fixture instead of the server.
+    server._all_fields = copy.deepcopy(fixtures["fields"])  # pylint: disable=protected-access
+
+    def print_table() -> None:
+        with open(os.devnull, "w", encoding="utf-8") as null_file, \
+                contextlib.redirect_stdout(null_file):
+            cmd_search._print_table(fixtures["search_default"],  # pylint: disable=protected-access
+                                    cmd_search.DEFAULT_FIELDS)
+
+    def translate() -> None:
+        for issue in fixtures["search_full"]["issues"]:
+            cmd_search._translate_fields(server, issue["fields"])  # pylint: disable=protected-access
+
+    def normalize_edit_fields() -> None:
+        for fields_to_edit in fixtures["edit"]:
+            cmd_edit._normalize_edit_fields(server, fields_to_edit)  # pylint: disable=protected-access
+
+    def json_dumps() -> None:
+        json.dumps(fixtures["search_full"], indent=4, ensure_ascii=False)
+
+    def serializer_dumps() -> None:
+        JsonSerializer.dumps(fixtures["search_full"])
+
+    def serializer_dumps_compact() -> None:
+        JsonSerializer.dumps(fixtures["search_full"], compact=True)
+
+    return {
+        "print_table": print_table,
+        "translate": translate,
+        "normalize_edit_fields": normalize_edit_fields,
+        "json_dumps": json_dumps,
+        "serializer_dumps": serializer_dumps,
+        "serializer_dumps_compact": serializer_dumps_compact
+    }
+
+
+def run_micro_benchmarks(args) -> dict:
+    """ Run the selected micro-benchmarks on the generated fixtures.
+
+    Args:
+        args (obj): The command line arguments of the benchmark.
+
+    Returns:
+        dict: The history entry with the environment, the fixture sizes and the results.
+    """
+    fixtures = get_fixtures(args.issues, args.fields, args.seed)
+    benchmarks = get_benchmarks(fixtures)
+    results = {}
+
+    for name in args.benchmark or benchmarks.keys():
+        times = timeit.repeat(benchmarks[name], number=1, repeat=max(1, args.repeat))
+        best = min(times)
+
+        results[name] = {
+            "best_s": best,
+            "mean_s": sum(times) / len(times),
+            "per_issue_us": best * 1e6 / args.issues
+        }
+
+        print(f"{name:<24}{best:>10.3f} s best{results[name]['mean_s']:>10.3f} s mean"
+              f"{results[name]['per_issue_us']:>12.2f} us/issue")
+
+    return history.get_entry({"issues": args.issues, "fields": args.fields, "seed": args.seed},
+                             results)
+
+
+def _add_parser() -> argparse.ArgumentParser:
+    """ Add the parser for the command line arguments of the benchmark. """
+    parser, run_parser = history.add_parser("benchmarks.run_micro_benchmarks",
+                                            "Micro-benchmarks of the CPU-bound hot paths "
+                                            "of pyJiraCli.",
+                                            DEFAULT_HISTORY_FILE)
+    run_parser.add_argument("--issues", type=int, default=10000,
+                            help="Number of issues of the fixtures. Default is 10000.")
+    run_parser.add_argument("--fields", type=int, default=300,
+                            help="Number of fields per issue. Default is 300.")
+    run_parser.add_argument("--seed", type=int, default=0,
+                            help="Seed of the fixture generator. Default is 0.")
+    run_parser.add_argument("--benchmark", type=str, action="append",
+                            choices=["print_table", "translate", "normalize_edit_fields",
+                                     "json_dumps", "serializer_dumps",
+                                     "serializer_dumps_compact"],
+                            help="Benchmark to run. Can be used multiple times. "
+                                 "Default is all benchmarks.")
+
+    return parser
+
+
+def main() -> int:
+    """ The micro-benchmark entry point.
+
+    Returns:
+        int: 0 if no regression was found, otherwise 1.
+    """
+    return history.evaluate(_add_parser().parse_args(), run_micro_benchmarks, COMPARED_METRICS)
+
+################################################################################
+# Main
+################################################################################
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -46,9 +46,17 @@ from pyJiraCli import cmd_profile
 from pyJiraCli import cmd_get_sprints
 from pyJiraCli import cmd_scheme
 from pyJiraCli import cmd_edit
+from pyJiraCli import cmd_mirror
+from pyJiraCli import cmd_migrate
 
+from pyJiraCli.http_pool import ConnectionStats
+from pyJiraCli.jira_server import Server
+from pyJiraCli.memory_profile import MemoryProfile
 from pyJiraCli.printer import Printer
+from pyJiraCli.replay import ReplayAdapter
 from pyJiraCli.ret import Ret
+from pyJiraCli.timings import Timings
+from pyJiraCli.trace_file import TraceFile
 from pyJiraCli.version import __version__, __author__, __email__, __repository__, __license__
 
 ################################################################################
@@ -65,6 +73,8 @@ _CMD_MODULES = [
     cmd_get_sprints,
     cmd_scheme,
     cmd_edit,
+    cmd_mirror,
+    cmd_migrate,
 ]
 
 PROG_NAME = "pyJiraCli"
@@ -107,6 +117,40 @@ def add_parser() -> argparse.ArgumentParser:
                         help="Print full command details before executing the command.\
                             Enables logs of type INFO and WARNING.")
 
+    parser.add_argument("--timings",
+                        action="store_true",
+                        help="Print a summary of the latency and size of all HTTP requests \
+                            and the duration of the command phases.")
+
+    parser.add_argument("--timings-file",
+                        type=str,
+                        metavar="<path to file>",
+                        help="Write the timings summary and all single records to a JSON file.")
+
+    parser.add_argument("--memory-profile",
+                        action="store_true",
+                        help="Print the retained and peak memory after every command phase \
+                            and search page and the top allocation sites per phase.")
+
+    parser.add_argument("--trace-file",
+                        type=str,
+                        metavar="<path to file>",
+                        help="Record all HTTP requests and responses to a HAR file. \
+                            Credentials in the headers are redacted.")
+
+    parser.add_argument("--replay",
+                        type=str,
+                        metavar="<path to file>",
+                        help="Serve all HTTP requests from a HAR file recorded with --trace-file \
+                            instead of sending them to the server.")
+
+    parser.add_argument("--replay-latency",
+                        type=float,
+                        default=0,
+                        metavar="<ms>",
+                        help="Latency in milliseconds added to every replayed response. \
+                            Default is 0.")
+
     subparser = parser.add_subparsers(required='True')
 
     # Register command modules und argparser arguments
@@ -150,14 +194,130 @@ def main() -> Ret.CODE:
                 print(f"* {arg} = {vars(args)[arg]}")
             print("\n")
 
+        ret_status = _setup_instrumentation(args)
+
         # Call command function and return exit status
-        ret_status = args.func(args)
+        if Ret.CODE.RET_OK == ret_status:
+            ret_status = args.func(args)
+
+        ret_status = _report_instrumentation(args, printer, ret_status)
 
     if ret_status is not Ret.CODE.RET_OK:
         print(Ret.MSG[ret_status])
 
     return ret_status
 
+
+def _setup_instrumentation(args) -> Ret.CODE:
+    """ Set up the replay, the trace and the timings of the HTTP traffic
+        and the memory profile as requested by the command line arguments.
+
+    Args:
+        args (obj): The command line arguments.
+
+    Returns:
+        Ret.CODE: Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+    """
+    ret_status = Ret.CODE.RET_OK
+
+    if args.replay is not None:
+        ret_status = _set_replay(args.replay, args.replay_latency)
+
+    # A trace shall contain the server info, so it can be replayed without the cache.
+    if (args.replay is not None) or (args.trace_file is not None):
+        Server.set_server_info_cache(None)
+
+    # The trace is registered first, to measure the time to receive the response body.
+    if args.trace_file is not None:
+        TraceFile.enable()
+        Server.add_response_hook(TraceFile.record_response)
+
+    if args.timings or (args.timings_file is not None):
+        Timings.enable()
+        Server.add_response_hook(Timings.record_response)
+
+    if args.memory_profile:
+        MemoryProfile.enable()
+        Timings.add_phase_hook(MemoryProfile.record_phase)
+        Server.add_response_hook(MemoryProfile.record_response)
+
+    return ret_status
+
+
+def _report_instrumentation(args, printer: Printer, ret_status: Ret.CODE) -> Ret.CODE:
+    """ Print and save the connection statistics, the timings, the memory profile
+        and the trace as requested by the command line arguments.
+
+    Args:
+        args (obj): The command line arguments.
+        printer (Printer): The printer object.
+        ret_status (Ret.CODE): The return status of the command.
+
+    Returns:
+        Ret.CODE: The return status of the command or the error while saving the reports.
+    """
+    _print_connection_stats(printer)
+
+    if args.timings:
+        Timings.print_report()
+
+    if args.memory_profile:
+        MemoryProfile.checkpoint("exit")
+        MemoryProfile.print_report()
+
+    if args.timings_file is not None:
+        timings_status = Timings.save_report(args.timings_file)
+
+        if Ret.CODE.RET_OK == ret_status:
+            ret_status = timings_status
+
+    if args.trace_file is not None:
+        trace_status = TraceFile.save(args.trace_file)
+
+        if Ret.CODE.RET_OK == ret_status:
+            ret_status = trace_status
+
+    return ret_status
+
+
+def _set_replay(file_path: str, latency: float) -> Ret.CODE:
+    """ Replay the responses recorded in a HAR file for all server sessions.
+
+    Args:
+        file_path (str): The path to the HAR file.
+        latency (float): Latency in milliseconds added to every response.
+
+    Returns:
+        Ret.CODE: Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+    """
+    ret_status = Ret.CODE.RET_OK
+
+    try:
+        Server.set_transport_adapter(ReplayAdapter.load(file_path, latency))
+    except IOError:
+        ret_status = Ret.CODE.RET_ERROR_FILEPATH_INVALID
+    except ValueError:
+        ret_status = Ret.CODE.RET_ERROR_WRONG_FILE_FORMAT
+
+    return ret_status
+
+
+def _print_connection_stats(printer: Printer) -> None:
+    """ Print how many HTTP requests reused a pooled connection
+        and how many required a new connection (and TLS handshake).
+        Only printed in verbose mode.
+
+    Args:
+        printer (Printer): The printer object.
+    """
+    stats = ConnectionStats.get()
+
+    if 0 < stats["requests"]:
+        printer.print_info("HTTP connection statistics:",
+                           f"Requests:           {stats['requests']}",
+                           f"New connections:    {stats['new_connections']}",
+                           f"Reused connections: {stats['reused_connections']}")
+
 ################################################################################
 # Main
 ################################################################################
@@ -0,0 +1,254 @@
+""" A content-addressed store of downloaded issue attachments. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from jira.exceptions import JIRAError
+from requests import exceptions as reqex
+
+from pyJiraCli.jira_server import Server
+from pyJiraCli.json_serializer import JsonSerializer
+from pyJiraCli.printer import Printer
+from pyJiraCli.ret import Ret
+from pyJiraCli.timings import Timings
+
+################################################################################
+# Variables
+################################################################################
+
+# The index of the downloaded attachments in the store directory.
+INDEX_FILE = "index.json"
+
+# The directory of the files, named by the SHA-256 hash of their content.
+OBJECTS_DIR = "objects"
+
+# The size of the chunks, which are written to the disk while downloading.
+CHUNK_SIZE = 64 * 1024
+
+LOG = Printer()
+
+################################################################################
+# Classes
+################################################################################
+
+
+class AttachmentStore:
+    """ A content-addressed store of attachments. Every file is stored once,
+        named by the SHA-256 hash of its content, also if it is attached to many
+        issues. The index maps the attachment IDs to the hash, file name and size,
+        so attachments downloaded by a previous run are skipped.
+        The attachments can be added by multiple threads.
+    """
+
+    def __init__(self, store_dir: str):
+        """ Create an empty store for a directory.
+
+        Args:
+            store_dir (str): The directory of the store.
+        """
+        self._store_dir = store_dir
+        self._lock = threading.Lock()
+        self._index = {}
+        self._pending = {}
+
+    def load(self) -> None:
+        """ Create the directories of the store and load its index, if it exists.
+
+        Raises:
+            IOError: If the directories cannot be created or the index cannot be read.
+            ValueError: If the index is no valid JSON object.
+        """
+        os.makedirs(os.path.join(self._store_dir, OBJECTS_DIR), exist_ok=True)
+        index_path = os.path.join(self._store_dir, INDEX_FILE)
+
+        if os.path.isfile(index_path):
+            with open(index_path, 'r', encoding="UTF-8") as index_file:
+                self._index = JsonSerializer.loads(index_file.read())
+
+            if isinstance(self._index, dict) is False:
+                raise ValueError(f"'{index_path}' is no valid attachment index.")
+
+    def save(self) -> None:
+        """ Write the index. A temporary file replaces the old one.
+
+        Raises:
+            IOError: If the file cannot be written.
+        """
+        index_path = os.path.join(self._store_dir, INDEX_FILE)
+
+        with self._lock:
+            text = JsonSerializer.dumps(self._index)
+
+        with open(index_path + ".tmp", 'w', encoding="UTF-8") as index_file:
+            index_file.write(text)
+
+        os.replace(index_path + ".tmp", index_path)
+
+    def add_issue(self, issue: dict) -> None:
+        """ Add the attachments of an issue to the pending downloads,
+            unless they were downloaded before.
+
+        Args:
+            issue (dict): The raw issue with the attachment field.
+        """
+        for attachment in (issue.get("fields") or {}).get("attachment") or []:
+            attachment_id = str(attachment.get("id"))
+
+            with self._lock:
+                if (self._get_stored_hash(attachment_id) is None) and \
+                        (attachment.get("content") is not None):
+                    self._pending[attachment_id] = attachment
+
+    def get_path(self, content_hash: str) -> str:
+        """ Get the path of a file in the store.
+
+        Args:
+            content_hash (str): The SHA-256 hash of the file content.
+
+        Returns:
+            str: The path of the file.
+        """
+        return os.path.join(self._store_dir, OBJECTS_DIR, content_hash[:2], content_hash)
+
+    def download(self, server: Server) -> tuple[Ret.CODE, int]:
+        """ Download the pending attachments in parallel and update the index.
+            Every file is streamed to the disk in chunks.
+
+        Args:
+            server (Server): The server object to interact with the Jira server.
+
+        Returns:
+            tuple[Ret.CODE, int]: The return code and the number of downloaded attachments.
+        """
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending = {}
+
+        # The jobs share the connection pool of the server, which is sized for them.
+        with Timings.phase("attachments"), \
+                ThreadPoolExecutor(max_workers=server.get_jobs()) as executor:
+            results = list(executor.map(lambda attachment: self._download(server, attachment),
+                                        pending))
+
+        ret_status = next((status for status in results if Ret.CODE.RET_OK != status),
+                          Ret.CODE.RET_OK)
+
+        return ret_status, results.count(Ret.CODE.RET_OK)
+
+    def _download(self, server: Server, attachment: dict) -> Ret.CODE:
+        """ Download an attachment into the store and add it to the index.
+
+        Args:
+            server (Server): The server object to interact with the Jira server.
+            attachment (dict): The attachment with ID, file name and content URL.
+
+        Returns:
+            Ret.CODE: Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+        """
+        content_hash = hashlib.sha256()
+        size = 0
+
+        try:
+            file_descriptor, temp_path = tempfile.mkstemp(
+                dir=os.path.join(self._store_dir, OBJECTS_DIR))
+        except OSError:
+            return Ret.CODE.RET_ERROR_FILEPATH_INVALID
+
+        try:
+            with os.fdopen(file_descriptor, 'wb') as temp_file:
+                for chunk in server.iter_content(attachment["content"], CHUNK_SIZE):
+                    content_hash.update(chunk)
+                    temp_file.write(chunk)
+                    size += len(chunk)
+
+            file_path = self.get_path(content_hash.hexdigest())
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+            # The same content may be downloaded by another thread at the same time.
+            os.replace(temp_path, file_path)
+
+        except JIRAError as e:
+            print(f"The attachment '{attachment.get('filename')}' failed: {e.text}")
+            return Ret.CODE.RET_ERROR
+
+        except reqex.RequestException as e:
+            print(f"The attachment '{attachment.get('filename')}' failed: {e}")
+            return Ret.CODE.RET_ERROR
+
+        except IOError:
+            return Ret.CODE.RET_ERROR_FILEPATH_INVALID
+
+        finally:
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
+
+        with self._lock:
+            self._index[str(attachment["id"])] = {
+                "sha256": content_hash.hexdigest(),
+                "filename": attachment.get("filename"),
+                "size": size
+            }
+
+        LOG.print_info(f"Downloaded attachment '{attachment.get('filename')}' to '{file_path}'.")
+
+        return Ret.CODE.RET_OK
+
+    def _get_stored_hash(self, attachment_id: str) -> str:
+        """ Get the hash of a downloaded attachment, whose file is in the store.
+
+        Args:
+            attachment_id (str): The ID of the attachment.
+
+        Returns:
+            str: The SHA-256 hash of the file content or None if not downloaded.
+        """
+        entry = self._index.get(attachment_id)
+
+        if (entry is None) or (os.path.isfile(self.get_path(entry["sha256"])) is False):
+            return None
+
+        return entry["sha256"]
+
+################################################################################
+# Functions
+################################################################################
+
+################################################################################
+# Main
+################################################################################
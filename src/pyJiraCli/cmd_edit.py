@@ -36,16 +36,17 @@
 # Imports
 ################################################################################
 
-import json
-import os
 
 import argparse
 from jira.exceptions import JIRAError
 
 from pyJiraCli.file_helper import FileHelper
 from pyJiraCli.jira_server import Server
+from pyJiraCli.json_serializer import JsonSerializer
 from pyJiraCli.printer import Printer
 from pyJiraCli.ret import Ret
+from pyJiraCli.shard import is_in_shard, parse_shard
+from pyJiraCli.timings import Timings
 
 
 ################################################################################
@@ -117,10 +118,20 @@ def register(subparser) -> argparse.ArgumentParser:
         help="The Jira server URL to connect to."
     )
 
+    parser.add_argument(
+        '--shard',
+        type=str,
+        metavar='<index>/<count>',
+        help="Only edit the issues of this shard, e.g. 2/4 for the second of four shards. " +
+        "The issues are partitioned by a hash of their key, so every machine " +
+        "can edit another shard of the same file."
+    )
+
     parser.add_argument(
         'file',
         type=str,
-        help="Path to the input file."
+        help="Path to the input file. " +
+        "The file format must be JSON, optionally compressed as .json.gz or .json.zst."
     )
 
     return parser
@@ -136,6 +147,12 @@ def execute(args) -> Ret.CODE:
     Returns:
         Ret:   Ret.CODE.RET_OK if successful, corresponding error code if not
     """
+    try:
+        shard = parse_shard(args.shard)
+    except ValueError as e:
+        print(e)
+        return Ret.CODE.RET_ERROR_ARGPARSE
+
     server = Server()
     ret_status = server.login(args.profile,
                               args.server,
@@ -147,17 +164,18 @@ def execute(args) -> Ret.CODE:
         LOG.print_error(
             "Connection to server is not established. Please login first.")
     else:
-        ret_status = _cmd_edit(args.file, server)
+        ret_status = _cmd_edit(args.file, server, shard)
 
     return ret_status
 
 
-def _cmd_edit(input_file: str, server: Server) -> Ret.CODE:
+def _cmd_edit(input_file: str, server: Server, shard: tuple[int, int] = None) -> Ret.CODE:
     """ Edit Jira issues from a JSON file.
 
     Args:
         input_file (str):  The filepath to the input file.
         server (Server): The server object to interact with the Jira server.
+        shard (tuple[int, int]): The index and count of the shard to edit or None for all.
 
     Returns:
         Ret:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
@@ -166,7 +184,8 @@ def _cmd_edit(input_file: str, server: Server) -> Ret.CODE:
     issue_dict = {}
 
     # Read the data from the file.
-    ret_status, issue_dict = _read_json_file(input_file)
+    with Timings.phase("read file"):
+        ret_status, issue_dict = _read_json_file(input_file)
 
     if Ret.CODE.RET_OK == ret_status:
         # Get the Jira handle to use the Jira API directly.
@@ -175,26 +194,32 @@ def _cmd_edit(input_file: str, server: Server) -> Ret.CODE:
         # Get the issues to edit.
         issues_to_edit = issue_dict.get('issues', [])
 
-        for input_issue in issues_to_edit:
-            # Check if issue key is provided.
-            if 'key' not in input_issue:
-                print("Skipping issue without key.")
-                continue
-
-            # Normalize the fields to edit.
-            edit_data = _normalize_edit_fields(server, input_issue.get('fields', {}))
-            fields_to_update = edit_data.keys()
-            LOG.print_info(f"Editing {input_issue['key']}: {fields_to_update}")
-
-            try:
-                # Retrieve the issue object with only the fields to edit.
-                issue_object = jira.issue(input_issue['key'], fields=fields_to_update)
-
-                # Update the issue with the new data.
-                issue_object.update(fields=edit_data)
-            except JIRAError as e:
-                print(f"Failed to edit issue {input_issue['key']}: {e.response.text}")
-                continue
+        with Timings.phase("edit issues"):
+            for input_issue in issues_to_edit:
+                # Check if issue key is provided.
+                if 'key' not in input_issue:
+                    print("Skipping issue without key.")
+                    continue
+
+                # Another shard edits the issue.
+                if not is_in_shard(input_issue['key'].upper(), shard):
+                    continue
+
+                # Normalize the fields to edit.
+                edit_data = _normalize_edit_fields(server, input_issue.get('fields', {}))
+                fields_to_update = edit_data.keys()
+                LOG.print_info(f"Editing {input_issue['key']}: {fields_to_update}")
+
+                try:
+                    with Timings.phase("edit issue"):
+                        # Retrieve the issue object with only the fields to edit.
+                        issue_object = jira.issue(input_issue['key'], fields=fields_to_update)
+
+                        # Update the issue with the new data.
+                        issue_object.update(fields=edit_data)
+                except JIRAError as e:
+                    print(f"Failed to edit issue {input_issue['key']}: {e.response.text}")
+                    continue
 
     return ret_status
 
@@ -212,13 +237,13 @@ def _read_json_file(input_file: str) -> tuple[Ret.CODE, dict]:
     issue_dict = {}
     ret_status = Ret.CODE.RET_OK
 
-    # Make sure file has .json extension.
-    if os.path.splitext(input_file)[-1] != '.json':
-        return Ret.CODE.RET_ERROR_WRONG_FILE_FORMAT
+    # Make sure file has .json extension, optionally followed by .gz or .zst.
+    if not FileHelper.is_json_file(input_file):
+        return Ret.CODE.RET_ERROR_WRONG_FILE_FORMAT, issue_dict
 
     try:
         with FileHelper.open_file(input_file, 'r') as input_file_handle:
-            issue_dict = json.load(input_file_handle)
+            issue_dict = JsonSerializer.load(input_file_handle)
 
     except IOError:
         ret_status = Ret.CODE.RET_ERROR_FILEPATH_INVALID
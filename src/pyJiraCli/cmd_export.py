@@ -37,18 +37,44 @@
 ################################################################################
 
 import argparse
-import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 
+from jira.exceptions import JIRAError
+from requests import exceptions as reqex
+
+from pyJiraCli.attachment_store import AttachmentStore
+from pyJiraCli.cmd_mirror import get_sync_start
+from pyJiraCli.export_manifest import MANIFEST_FILE, ExportManifest, get_content_hash
 from pyJiraCli.file_helper import FileHelper
+from pyJiraCli.issue_store import from_store_datetime, to_store_datetime
 from pyJiraCli.jira_server import Server
+from pyJiraCli.jql import get_updated_since_jql, strip_order_by, to_jql_datetime
+from pyJiraCli.json_serializer import JsonSerializer
 from pyJiraCli.printer import Printer
 from pyJiraCli.ret import Ret
+from pyJiraCli.shard import is_in_shard, parse_shard
+from pyJiraCli.timings import Timings
 
 
 ################################################################################
 # Variables
 ################################################################################
 
+DEFAULT_JOBS = 4
+
+# The relations of an issue, which are followed to export the related issues too.
+FOLLOW_SUBTASKS = "subtasks"
+FOLLOW_LINKS = "links"
+FOLLOW_PARENT = "parent"
+FOLLOW_RELATIONS = [FOLLOW_SUBTASKS, FOLLOW_LINKS, FOLLOW_PARENT]
+
+DEFAULT_DEPTH = 1
+
+# The number of keys per search. More keys make the URL of the request too long.
+KEYS_PER_SEARCH = 100
+
 LOG = Printer()
 
 
@@ -73,13 +99,15 @@ def register(subparser) -> argparse.ArgumentParser:
 
     parser = subparser.add_parser(
         'export',
-        help="Export a ticket from a Jira Server to a JSON file."
+        help="Export tickets from a Jira Server to JSON files."
     )
 
     parser.add_argument(
         'issue',
         type=str,
-        help="Jira issue key"
+        nargs='*',
+        help="Jira issue keys. A single issue is exported to --file, " +
+        "multiple issues to one file per issue in --dir."
     )
 
     parser.add_argument(
@@ -129,7 +157,107 @@ def register(subparser) -> argparse.ArgumentParser:
         "to the current working directory. " +
         "The file format must be JSON. "
         "If a different file format is provided, " +
-        "the file extension will be replaced."
+        "the file extension will be replaced. " +
+        "Files ending with .json.gz or .json.zst are compressed."
+    )
+
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help="Write the JSON file without indentation and whitespace, " +
+        "e.g. for machine consumption. Faster and smaller."
+    )
+
+    parser.add_argument(
+        '--keys-file',
+        type=str,
+        metavar='<path to file>',
+        help="A text file with the keys of the issues to export, " +
+        "separated by whitespace or commas, e.g. one per line."
+    )
+
+    parser.add_argument(
+        '--jql',
+        type=str,
+        metavar='<filter>',
+        help="Export all issues found with this filter. Must be in JQL format."
+    )
+
+    parser.add_argument(
+        '--dir',
+        type=str,
+        metavar='<path to directory>',
+        help="The directory for the files of multiple issues, named by the issue key. " +
+        "Default is the current working directory."
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=DEFAULT_JOBS,
+        metavar='<jobs>',
+        help="The number of searches running in parallel for multiple issues. " +
+        f"Default is {DEFAULT_JOBS}."
+    )
+
+    parser.add_argument(
+        '--keyset',
+        action='store_true',
+        help="Page the search by the issue ID instead of the offset. " +
+        "The pages of a long search stay consistent while issues change " +
+        "and do not get slower with the offset. The issues are ordered by their ID then."
+    )
+
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help="Keep a manifest in --dir with the update time and content hash of every " +
+        "issue. The --jql filter only searches the issues updated since the last export, " +
+        "paged by the issue ID, and unchanged files are not written again."
+    )
+
+    parser.add_argument(
+        '--follow',
+        type=str,
+        metavar='<relations>',
+        help="Export the related issues too, separated by commas: " +
+        f"{', '.join(FOLLOW_RELATIONS)}. E.g. subtasks,links."
+    )
+
+    parser.add_argument(
+        '--depth',
+        type=int,
+        default=DEFAULT_DEPTH,
+        metavar='<depth>',
+        help="The number of relations followed from the given issues with --follow. " +
+        f"Default is {DEFAULT_DEPTH}."
+    )
+
+    parser.add_argument(
+        '--attachments',
+        type=str,
+        metavar='<path to directory>',
+        help="Download the attachments of the exported issues into this directory. " +
+        "Every file is stored once, named by the hash of its content, and files " +
+        "downloaded before are skipped."
+    )
+
+    parser.add_argument(
+        '--shard',
+        type=str,
+        metavar='<index>/<count>',
+        help="Only export the issues of this shard, e.g. 2/4 for the second of four shards. " +
+        "The issues are partitioned by a hash of their key, so every machine " +
+        "can export another shard of the same issues. Related issues are always exported."
+    )
+
+    parser.add_argument(
+        '--merge',
+        type=str,
+        nargs='+',
+        metavar='<path to directory>',
+        help="Merge the directories of the shard exports into --dir, " +
+        "including their manifests. No server is required."
     )
 
     return parser
@@ -145,7 +273,26 @@ def execute(args) -> Ret.CODE:
     Returns:
         Ret:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
     """
-    server = Server()
+    if args.merge is not None:
+        return _cmd_merge(args.merge, args.dir or ".")
+
+    ret_status, keys = _get_keys(args.issue, args.keys_file)
+
+    if Ret.CODE.RET_OK != ret_status:
+        return ret_status
+
+    ret_status = _check_args(keys, args)
+
+    if Ret.CODE.RET_OK != ret_status:
+        return ret_status
+
+    ret_status, attachments = _get_attachment_store(args.attachments)
+
+    if Ret.CODE.RET_OK != ret_status:
+        return ret_status
+
+    # Pages by the issue ID are not shifted by issues updated during an incremental export.
+    server = Server(jobs=args.jobs, keyset=args.keyset or args.incremental)
     ret_status = server.login(  args.profile,
                                 args.server,
                                 args.token,
@@ -155,13 +302,143 @@ def execute(args) -> Ret.CODE:
     if Ret.CODE.RET_OK != ret_status:
         LOG.print_error(
             "Connection to server is not established. Please login first.")
+        return ret_status
+
+    if _is_single_export(keys, args):
+        ret_status = _cmd_export(keys[0], args, server, attachments)
     else:
-        ret_status = _cmd_export(args, server)
+        ret_status = _cmd_export_many(keys, args, server, attachments)
+
+    # The attachments of the exported issues are downloaded, also if others failed.
+    if attachments is not None:
+        download_status = _download_attachments(attachments, server)
+
+        if Ret.CODE.RET_OK == ret_status:
+            ret_status = download_status
 
     return ret_status
 
 
-def _cmd_export(args, server: Server) -> Ret.CODE:
+def _check_args(keys: list[str], args) -> Ret.CODE:
+    """ Check the arguments of an export and replace --follow and --shard by their values.
+
+    Args:
+        keys (list[str]): The keys of the issues to export.
+        args (obj): The command line arguments.
+
+    Returns:
+        Ret.CODE: Returns Ret.CODE.RET_OK if valid or else the corresponding error code.
+    """
+    if (0 == len(keys)) and (args.jql is None):
+        print("No issue to export. Provide issue keys, --keys-file or --jql.")
+        return Ret.CODE.RET_ERROR_ARGPARSE
+
+    ret_status, args.follow = _get_follow(args.follow)
+
+    if Ret.CODE.RET_OK == ret_status:
+        ret_status, args.shard = _get_shard(args.shard)
+
+    return ret_status
+
+
+def _is_single_export(keys: list[str], args) -> bool:
+    """ Check whether a single issue is exported to --file.
+
+    Args:
+        keys (list[str]): The keys of the issues to export.
+        args (obj): The checked command line arguments.
+
+    Returns:
+        bool: True for a single issue, False for the export to a directory.
+    """
+    return (1 == len(keys)) and (args.jql is None) and (args.dir is None) and \
+        (args.incremental is False) and (0 == len(args.follow)) and (args.shard is None)
+
+
+def _get_keys(issue_keys: list[str], keys_file: str) -> tuple[Ret.CODE, list[str]]:
+    """ Get the keys of the issues to export from the command line and the keys file.
+
+    Args:
+        issue_keys (list[str]): The keys on the command line.
+        keys_file (str): The path to the keys file or None.
+
+    Returns:
+        tuple[Ret.CODE, list[str]]: The return code and the keys without duplicates.
+    """
+    keys = list(issue_keys)
+
+    if keys_file is not None:
+        try:
+            with FileHelper.open_file(keys_file, 'r') as file:
+                keys += file.read().replace(",", " ").split()
+
+        except IOError:
+            return Ret.CODE.RET_ERROR_FILEPATH_INVALID, []
+
+    return Ret.CODE.RET_OK, list(dict.fromkeys(keys))
+
+
+def _get_follow(follow: str) -> tuple[Ret.CODE, list[str]]:
+    """ Get the relations to follow from the --follow argument.
+
+    Args:
+        follow (str): The relations separated by commas or None.
+
+    Returns:
+        tuple[Ret.CODE, list[str]]: The return code and the relations.
+    """
+    relations = [relation.strip().lower() for relation in (follow or "").split(",")
+                 if relation.strip()]
+
+    for relation in relations:
+        if relation not in FOLLOW_RELATIONS:
+            print(f"Unknown relation '{relation}'. Use {', '.join(FOLLOW_RELATIONS)}.")
+            return Ret.CODE.RET_ERROR_ARGPARSE, []
+
+    return Ret.CODE.RET_OK, relations
+
+
+def _get_shard(shard: str) -> tuple[Ret.CODE, tuple[int, int]]:
+    """ Get the shard to export from the --shard argument.
+
+    Args:
+        shard (str): The shard as index/count or None.
+
+    Returns:
+        tuple[Ret.CODE, tuple[int, int]]: The return code and the index and count or None.
+    """
+    try:
+        return Ret.CODE.RET_OK, parse_shard(shard)
+    except ValueError as e:
+        print(e)
+        return Ret.CODE.RET_ERROR_ARGPARSE, None
+
+
+def _get_attachment_store(store_dir: str) -> tuple[Ret.CODE, AttachmentStore]:
+    """ Open the store for the attachments.
+
+    Args:
+        store_dir (str): The directory of the store or None to skip the attachments.
+
+    Returns:
+        tuple[Ret.CODE, AttachmentStore]: The return code and the store or None.
+    """
+    attachments = None
+
+    if store_dir is not None:
+        attachments = AttachmentStore(store_dir)
+
+        try:
+            attachments.load()
+        except IOError:
+            return Ret.CODE.RET_ERROR_FILEPATH_INVALID, None
+        except ValueError:
+            return Ret.CODE.RET_ERROR_WRONG_FILE_FORMAT, None
+
+    return Ret.CODE.RET_OK, attachments
+
+
+def _cmd_export(issue_key: str, args, server: Server, attachments: AttachmentStore) -> Ret.CODE:
     """ Export a jira ticket to a JSON file.
 
         The function takes the command line arguments and extracts the
@@ -173,21 +450,31 @@ def _cmd_export(args, server: Server) -> Ret.CODE:
         The data will be written and stored in a JSON file.
 
     Args:
+        issue_key (str): The key of the issue.
         args (obj): The command line arguments.
         server (Server): The server object to interact with the Jira server.
+        attachments (AttachmentStore): The store for the attachments or None.
 
     Returns:
         Ret:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
     """
 
-    ret_status, file_path = FileHelper.process_file_argument(args.issue, args.file)
+    ret_status, file_path = FileHelper.process_file_argument(issue_key, args.file)
     if ret_status == Ret.CODE.RET_OK:
         try:
             with FileHelper.open_file(file_path, 'w') as export_file:
-                ret_status = server.search(f"key = {args.issue}", max_results=1, fields=[])
+                with Timings.phase("search"):
+                    ret_status = server.search(f"key = {issue_key}",
+                                               max_results=1,
+                                               fields=[],
+                                               raw=True)
                 if ret_status == Ret.CODE.RET_OK:
-                    issue = server.get_search_result().pop().raw
-                    export_file.write(json.dumps(issue, indent=4))
+                    issue = server.get_search_result().pop()
+                    with Timings.phase("serialize"):
+                        JsonSerializer.dump(issue, export_file, args.compact)
+
+                    if attachments is not None:
+                        attachments.add_issue(issue)
 
                     msg = f"Successfully exported to file '{file_path}'."
                     LOG.print_info(msg)
@@ -197,3 +484,390 @@ def _cmd_export(args, server: Server) -> Ret.CODE:
             ret_status = Ret.CODE.RET_ERROR_FILEPATH_INVALID
 
     return ret_status
+
+
+def _cmd_export_many(keys: list[str], args, server: Server,
+                     attachments: AttachmentStore) -> Ret.CODE:
+    """ Export multiple issues to one JSON file per issue in the output directory.
+        The keys are searched in batches, which run in parallel.
+        Issues which are not found are reported, the others are exported anyway.
+        The related issues are exported breadth-first, one level after another.
+
+    Args:
+        keys (list[str]): The keys of the issues.
+        args (obj): The command line arguments.
+        server (Server): The server object to interact with the Jira server.
+        attachments (AttachmentStore): The store for the attachments or None.
+
+    Returns:
+        Ret:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+    """
+    out_dir = args.dir or "."
+
+    if args.file is not None:
+        print("--file is only used for a single issue. Use --dir for multiple issues.")
+        return Ret.CODE.RET_ERROR_ARGPARSE
+
+    try:
+        os.makedirs(out_dir, exist_ok=True)
+    except OSError:
+        return Ret.CODE.RET_ERROR_FILEPATH_INVALID
+
+    manifest = None
+    last_updated = None
+
+    if args.incremental is True:
+        manifest = ExportManifest(out_dir)
+
+        try:
+            manifest.load()
+        except IOError:
+            return Ret.CODE.RET_ERROR_FILEPATH_INVALID
+        except ValueError:
+            return Ret.CODE.RET_ERROR_WRONG_FILE_FORMAT
+
+    if args.jql is not None:
+        ret_status, found_keys, last_updated = _search_keys(args.jql, server, manifest)
+
+        if Ret.CODE.RET_OK != ret_status:
+            return ret_status
+
+        keys = list(dict.fromkeys(keys + found_keys))
+
+    # Only the given and found issues are sharded, not the related ones.
+    keys = [key for key in keys if is_in_shard(key.upper(), args.shard)]
+
+    # The batches are exported by worker threads, their phases are part of this one.
+    with Timings.phase("export"):
+        ret_status, exported, unchanged = _export_graph(keys, args, server, manifest,
+                                                        attachments)
+
+    if manifest is not None:
+        # A failed export is repeated completely by the next run.
+        if (Ret.CODE.RET_OK == ret_status) and (args.jql is not None):
+            manifest.set_last_updated(strip_order_by(args.jql), last_updated)
+
+        try:
+            manifest.save()
+        except IOError:
+            ret_status = Ret.CODE.RET_ERROR_FILEPATH_INVALID
+
+        print(f"Successfully exported {exported} issues to '{out_dir}', "
+              f"{unchanged} issues were unchanged.")
+    else:
+        print(f"Successfully exported {exported} issues to '{out_dir}'.")
+
+    return ret_status
+
+
+def _cmd_merge(shard_dirs: list[str], out_dir: str) -> Ret.CODE:
+    """ Merge the directories of several shard exports into one directory.
+        The issue files are copied and the manifests of incremental exports are merged.
+
+    Args:
+        shard_dirs (list[str]): The output directories of the shard exports.
+        out_dir (str): The directory to merge into.
+
+    Returns:
+        Ret:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+    """
+    copied = 0
+    manifests = []
+
+    try:
+        os.makedirs(out_dir, exist_ok=True)
+
+        for shard_dir in shard_dirs:
+            manifest = ExportManifest(shard_dir)
+            manifest.load()
+            manifests.append(manifest)
+
+            # A shard exported into the merged directory is already there.
+            if os.path.samefile(shard_dir, out_dir):
+                continue
+
+            for entry in os.scandir(shard_dir):
+                if entry.is_file() and (MANIFEST_FILE != entry.name) and \
+                        (entry.name.endswith(".tmp") is False):
+                    shutil.copyfile(entry.path, os.path.join(out_dir, entry.name))
+                    copied += 1
+
+        if any(os.path.isfile(os.path.join(shard_dir, MANIFEST_FILE))
+               for shard_dir in shard_dirs):
+            merged = ExportManifest(out_dir)
+            merged.merge(manifests)
+            merged.save()
+
+    except (IOError, OSError):
+        return Ret.CODE.RET_ERROR_FILEPATH_INVALID
+    except ValueError:
+        return Ret.CODE.RET_ERROR_WRONG_FILE_FORMAT
+
+    print(f"Successfully merged {copied} files of {len(shard_dirs)} shards into '{out_dir}'.")
+
+    return Ret.CODE.RET_OK
+
+
+def _search_keys(jql: str, server: Server, manifest: ExportManifest) -> tuple:
+    """ Search the keys of the issues to export with a filter. With a manifest,
+        only the issues updated since the last export with the filter are searched.
+        The returned update time is not beyond the start of the search, so the
+        issues updated during it are searched again by the next export.
+
+    Args:
+        jql (str): The filter in JQL format.
+        server (Server): The server object to interact with the Jira server.
+        manifest (ExportManifest): The manifest of an incremental export or None.
+
+    Returns:
+        tuple[Ret.CODE, list[str], str]: The return code, the keys and the latest
+                                         update time in UTC of the found issues.
+    """
+    search_start = get_sync_start(server)
+    last_updated = None
+    keys = []
+
+    if manifest is not None:
+        since = manifest.get_last_updated(strip_order_by(jql))
+
+        # JQL only has minutes, so the issues of the last minute are searched again.
+        if since is not None:
+            since = to_jql_datetime(from_store_datetime(since), server.get_time_zone())
+
+        jql = get_updated_since_jql(jql, since)
+
+    try:
+        with Timings.phase("search"):
+            for issue in server.iter_search_raw(jql, 0, ["key", "updated"]):
+                keys.append(issue["key"])
+                updated = to_store_datetime(issue.get("fields", {}).get("updated"))
+
+                if (updated is not None) and ((last_updated is None) or (last_updated < updated)):
+                    last_updated = updated
+
+    except JIRAError as e:
+        print(e.text)
+        return Ret.CODE.RET_ERROR_INVALID_SEARCH, [], None
+
+    if last_updated is not None:
+        last_updated = min(last_updated, search_start)
+
+    return Ret.CODE.RET_OK, keys, last_updated
+
+
+def _export_graph(keys: list[str], args, server: Server, manifest: ExportManifest,
+                  attachments: AttachmentStore) -> tuple:
+    # pylint: disable=too-many-arguments,too-many-locals
+    """ Export the issues and, with --follow, the related issues up to --depth.
+        Every level of the graph is searched with parallel batches, the keys of
+        the next level are the related issues which were not visited yet.
+
+    Args:
+        keys (list[str]): The keys of the issues.
+        args (obj): The command line arguments.
+        server (Server): The server object to interact with the Jira server.
+        manifest (ExportManifest): The manifest of an incremental export or None.
+        attachments (AttachmentStore): The store for the attachments or None.
+
+    Returns:
+        tuple[Ret.CODE, int, int]: The return code, the number of exported issues
+                                   and the number of unchanged issues.
+    """
+    ret_status = Ret.CODE.RET_OK
+    exported = 0
+    unchanged = 0
+    visited = {key.upper() for key in keys}
+
+    # The jobs share the connection pool of the server, which is sized for them.
+    with ThreadPoolExecutor(max_workers=server.get_jobs()) as executor:
+        for level in range(args.depth + 1 if args.follow else 1):
+            if 0 == len(keys):
+                break
+
+            LOG.print_info(f"Exporting {len(keys)} issues of level {level}.")
+            batches = [keys[idx:idx + KEYS_PER_SEARCH]
+                       for idx in range(0, len(keys), KEYS_PER_SEARCH)]
+            keys = []
+
+            for status, count, unchanged_count, related_keys in executor.map(
+                    lambda batch: _export_batch(batch, args, server, manifest, attachments),
+                    batches):
+                exported += count
+                unchanged += unchanged_count
+
+                if (Ret.CODE.RET_OK == ret_status) and (Ret.CODE.RET_OK != status):
+                    ret_status = status
+
+                keys += _visit(related_keys, visited)
+
+    return ret_status, exported, unchanged
+
+
+def _visit(keys: list[str], visited: set[str]) -> list[str]:
+    """ Mark the keys as visited and get those which were not visited before.
+
+    Args:
+        keys (list[str]): The keys of the related issues.
+        visited (set[str]): The upper case keys of the visited issues. Updated in place.
+
+    Returns:
+        list[str]: The keys which were not visited before.
+    """
+    unvisited = []
+
+    for key in keys:
+        if key.upper() not in visited:
+            visited.add(key.upper())
+            unvisited.append(key)
+
+    return unvisited
+
+
+def _export_batch(keys: list[str], args, server: Server, manifest: ExportManifest,
+                  attachments: AttachmentStore) -> tuple:
+    # pylint: disable=too-many-arguments
+    """ Search a batch of issues by their keys and write every issue to its file.
+        With a manifest, files with the same content as before are not written again.
+
+    Args:
+        keys (list[str]): The keys of the issues.
+        args (obj): The command line arguments with the output directory, the
+                    compact flag and the relations to get the related issues.
+        server (Server): The server object to interact with the Jira server.
+        manifest (ExportManifest): The manifest of an incremental export or None.
+        attachments (AttachmentStore): The store for the attachments or None.
+
+    Returns:
+        tuple[Ret.CODE, int, int, list[str]]: The return code, the number of exported
+                                              issues, the number of unchanged issues
+                                              and the keys of the related issues.
+    """
+    ret_status = Ret.CODE.RET_OK
+    missing = {key.upper(): key for key in keys}
+    related_keys = []
+    exported = 0
+    unchanged = 0
+    jql = "key in (" + ", ".join(f'"{key}"' for key in keys) + ")"
+
+    try:
+        # Unknown keys are ignored instead of failing the whole batch.
+        with Timings.phase("search"):
+            issues = list(server.iter_search_raw(jql, len(keys), [], validate_query=False))
+
+    except JIRAError as e:
+        print(e.text)
+        return Ret.CODE.RET_ERROR_INVALID_SEARCH, exported, unchanged, related_keys
+
+    except reqex.RequestException as e:
+        print(e)
+        return Ret.CODE.RET_ERROR, exported, unchanged, related_keys
+
+    try:
+        for issue in issues:
+            missing.pop(issue["key"].upper(), None)
+            related_keys += _get_related_keys(issue, args.follow)
+
+            # Also the attachments of unchanged issues may be missing in the store.
+            if attachments is not None:
+                attachments.add_issue(issue)
+            if _write_issue(issue, args, manifest) is False:
+                unchanged += 1
+                continue
+
+            exported += 1
+
+    except IOError:
+        return Ret.CODE.RET_ERROR_FILEPATH_INVALID, exported, unchanged, related_keys
+
+    for key in missing.values():
+        print(f"The issue '{key}' was not found.")
+        ret_status = Ret.CODE.RET_ERROR_ISSUE_NOT_FOUND
+
+    return ret_status, exported, unchanged, related_keys
+
+
+def _get_related_keys(issue: dict, follow: list[str]) -> list[str]:
+    """ Get the keys of the sub-tasks, the linked issues and the parent of an issue.
+
+    Args:
+        issue (dict): The raw issue.
+        follow (list[str]): The relations to follow.
+
+    Returns:
+        list[str]: The keys of the related issues.
+    """
+    fields = issue.get("fields") or {}
+    related = []
+
+    if FOLLOW_SUBTASKS in follow:
+        related += fields.get("subtasks") or []
+
+    if FOLLOW_LINKS in follow:
+        for link in fields.get("issuelinks") or []:
+            related.append(link.get("outwardIssue") or link.get("inwardIssue") or {})
+
+    if (FOLLOW_PARENT in follow) and (fields.get("parent") is not None):
+        related.append(fields["parent"])
+
+    return [related_issue["key"] for related_issue in related if "key" in related_issue]
+
+
+def _write_issue(issue: dict, args, manifest: ExportManifest) -> bool:
+    """ Write an issue to its file in the output directory. With a manifest, the file
+        is not written again if it exists and the manifest records the same content.
+
+    Args:
+        issue (dict): The raw issue.
+        args (obj): The command line arguments with the output directory and the compact flag.
+        manifest (ExportManifest): The manifest of an incremental export or None.
+
+    Returns:
+        bool: True if the file was written, False if it was unchanged.
+
+    Raises:
+        IOError: If the file cannot be written.
+    """
+    file_path = os.path.join(args.dir or ".", f"{issue['key']}.json")
+
+    with Timings.phase("serialize"):
+        content = JsonSerializer.dumps(issue, args.compact)
+
+    content_hash = None
+
+    if manifest is not None:
+        content_hash = get_content_hash(content)
+
+        if manifest.is_unchanged(issue["key"], content_hash) and os.path.isfile(file_path):
+            return False
+
+    with Timings.phase("serialize"), FileHelper.open_file(file_path, 'w') as export_file:
+        export_file.write(content)
+
+    if manifest is not None:
+        manifest.set_issue(issue["key"], issue.get("fields", {}).get("updated"), content_hash)
+
+    LOG.print_info(f"Successfully exported to file '{file_path}'.")
+
+    return True
+
+
+def _download_attachments(attachments: AttachmentStore, server: Server) -> Ret.CODE:
+    """ Download the attachments of the exported issues and save the index of the store.
+
+    Args:
+        attachments (AttachmentStore): The store with the pending attachments.
+        server (Server): The server object to interact with the Jira server.
+
+    Returns:
+        Ret:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+    """
+    ret_status, downloaded = attachments.download(server)
+
+    try:
+        attachments.save()
+    except IOError:
+        ret_status = Ret.CODE.RET_ERROR_FILEPATH_INVALID
+
+    print(f"Successfully downloaded {downloaded} attachments.")
+
+    return ret_status
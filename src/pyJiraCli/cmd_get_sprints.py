@@ -34,13 +34,14 @@
 # Imports
 ################################################################################
 
-import json
 import argparse
 
 from pyJiraCli.file_helper import FileHelper
 from pyJiraCli.printer import Printer, PrintType
 from pyJiraCli.jira_server import Server
+from pyJiraCli.json_serializer import JsonSerializer
 from pyJiraCli.ret import Ret
+from pyJiraCli.timings import Timings
 
 
 ################################################################################
@@ -127,7 +128,15 @@ def register(subparser) -> argparse.ArgumentParser:
         metavar='<path to file>',
         help="Absolute file path or filepath relative " +
         "to the current working directory. " +
-        "The file format must be JSON. "
+        "The file format must be JSON. " +
+        "Files ending with .json.gz or .json.zst are compressed."
+    )
+
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help="Write the JSON file without indentation and whitespace, " +
+        "e.g. for machine consumption. Faster and smaller."
     )
 
     return parser
@@ -153,12 +162,15 @@ def execute(args) -> Ret.CODE:
     if Ret.CODE.RET_OK != ret_status:
         LOG.print_error(PrintType.ERROR, ret_status)
     else:
-        ret_status = _cmd_get_sprints(args.board, args.file, server)
+        ret_status = _cmd_get_sprints(args.board, args.file, server, args.compact)
 
     return ret_status
 
 
-def _cmd_get_sprints(board_name: str, filepath: str, server: Server) -> Ret.CODE:
+def _cmd_get_sprints(board_name: str,
+                     filepath: str,
+                     server: Server,
+                     compact: bool = False) -> Ret.CODE:
     """ Load the sprints in the board and store the data in a
         JSON file.
 
@@ -167,13 +179,15 @@ def _cmd_get_sprints(board_name: str, filepath: str, server: Server) -> Ret.CODE
         filepath (str): The absolute filepath or a relative filepath to
                         the current working directory.
         server (Server): The server object to interact with the Jira server.
+        compact (bool): Whether to write the JSON file without indentation.
 
     Returns:
         Ret.CODE: The return status of the module.
     """
 
     ret_status = Ret.CODE.RET_OK
-    write_dict, ret_status = _get_sprints(board_name, server)
+    with Timings.phase("get sprints"):
+        write_dict, ret_status = _get_sprints(board_name, server)
 
     if ret_status == Ret.CODE.RET_OK:
         writeable_board_name = write_dict[BOARD_KEY].replace(
@@ -184,7 +198,8 @@ def _cmd_get_sprints(board_name: str, filepath: str, server: Server) -> Ret.CODE
         if ret_status == Ret.CODE.RET_OK:
             try:
                 with FileHelper.open_file(output_file_path, 'w') as output_file:
-                    write_data = json.dumps(write_dict, indent=4)
+                    with Timings.phase("serialize"):
+                        write_data = JsonSerializer.dumps(write_dict, compact)
                     output_file.write(write_data)
 
                     msg = f"Successfully saved sprint to '{output_file_path}'."
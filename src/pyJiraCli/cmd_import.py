@@ -36,16 +36,17 @@
 # Imports
 ################################################################################
 
-import json
-import os
 
 import argparse
 from jira.client import JIRA
 
 from pyJiraCli.file_helper import FileHelper
 from pyJiraCli.jira_server import Server
+from pyJiraCli.json_serializer import JsonSerializer
 from pyJiraCli.printer import Printer
 from pyJiraCli.ret import Ret
+from pyJiraCli.shard import is_in_shard, parse_shard
+from pyJiraCli.timings import Timings
 
 
 ################################################################################
@@ -117,10 +118,20 @@ def register(subparser) -> argparse.ArgumentParser:
         help="The Jira server URL to connect to."
     )
 
+    parser.add_argument(
+        '--shard',
+        type=str,
+        metavar='<index>/<count>',
+        help="Only import the issues of this shard, e.g. 2/4 for the second of four shards. " +
+        "The issues are partitioned by a hash of their external ID, the sub-issues by " +
+        "the one of their parent, so every machine can import another shard of the same file."
+    )
+
     parser.add_argument(
         'file',
         type=str,
-        help="Path to the input file."
+        help="Path to the input file. " +
+        "The file format must be JSON, optionally compressed as .json.gz or .json.zst."
     )
 
     return parser
@@ -136,6 +147,12 @@ def execute(args) -> Ret.CODE:
     Returns:
         Ret:   Ret.CODE.RET_OK if successful, corresponding error code if not
     """
+    try:
+        shard = parse_shard(args.shard)
+    except ValueError as e:
+        print(e)
+        return Ret.CODE.RET_ERROR_ARGPARSE
+
     server = Server()
     ret_status = server.login(  args.profile,
                                 args.server,
@@ -147,7 +164,7 @@ def execute(args) -> Ret.CODE:
         LOG.print_error(
             "Connection to server is not established. Please login first.")
     else:
-        ret_status = _cmd_import(args.file, server)
+        ret_status = _cmd_import(args.file, server, shard)
 
     return ret_status
 
@@ -334,7 +351,7 @@ def _create_sub_issues(jira: JIRA,
     return ret_status
 
 
-def _cmd_import(input_file: str, server: Server) -> Ret.CODE:
+def _cmd_import(input_file: str, server: Server, shard: tuple[int, int] = None) -> Ret.CODE:
     """ Import a jira issue from a JSON file.
         Create a jira issue on the server with the data
         read from the input file.
@@ -342,6 +359,7 @@ def _cmd_import(input_file: str, server: Server) -> Ret.CODE:
     Args:
         input_file (str):  The filepath to the input file.
         server (Server): The server object to interact with the Jira server.
+        shard (tuple[int, int]): The index and count of the shard to import or None for all.
 
     Returns:
         Ret:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
@@ -350,7 +368,8 @@ def _cmd_import(input_file: str, server: Server) -> Ret.CODE:
     issue_dict = {}
 
     # Read the data from the file.
-    ret_status, issue_dict = _read_json_file(input_file)
+    with Timings.phase("read file"):
+        ret_status, issue_dict = _read_json_file(input_file)
 
     if Ret.CODE.RET_OK == ret_status:
         # Get the Jira handle to use the Jira API directly.
@@ -364,7 +383,8 @@ def _cmd_import(input_file: str, server: Server) -> Ret.CODE:
 
     if Ret.CODE.RET_OK == ret_status:
         components = issue_dict.get("components", [])
-        ret_status = _create_components(jira, components, project_key)
+        with Timings.phase("create components"):
+            ret_status = _create_components(jira, components, project_key)
 
     if Ret.CODE.RET_OK == ret_status:
         issues_list = []
@@ -374,22 +394,47 @@ def _cmd_import(input_file: str, server: Server) -> Ret.CODE:
         # Separate the sub-issues from the normal issues.
         issues_list, sub_issues_list = _separate_issue_types(issue_dict)
 
+        # The sub-issues are in the shard of their parent, which is created before them.
+        issues_list = [issue for issue in issues_list
+                       if is_in_shard(str(issue.get('externalId')), shard)]
+        sub_issues_list = [issue for issue in sub_issues_list
+                           if is_in_shard(_get_parent_id(issue), shard)]
+
         # Create the normal issues.
-        ret_status, id_cross_ref_dict = _create_issues(jira,
-                                                       issue_dict,
-                                                       issues_list)
+        with Timings.phase("create issues"):
+            ret_status, id_cross_ref_dict = _create_issues(jira,
+                                                           issue_dict,
+                                                           issues_list)
 
         # Check if the issues were created successfully.
         if Ret.CODE.RET_OK == ret_status:
             # Create the sub issues.
-            ret_status = _create_sub_issues(jira,
-                                            issue_dict,
-                                            sub_issues_list,
-                                            id_cross_ref_dict)
+            with Timings.phase("create sub-issues"):
+                ret_status = _create_sub_issues(jira,
+                                                issue_dict,
+                                                sub_issues_list,
+                                                id_cross_ref_dict)
 
     return ret_status
 
 
+def _get_parent_id(sub_issue: dict) -> str:
+    """ Get the value, by which a sub-issue is assigned to a shard.
+
+    Args:
+        sub_issue (dict): The sub-issue.
+
+    Returns:
+        str: The external ID of the parent or, for an existing parent, its key.
+    """
+    parent = sub_issue.get('parent') or {}
+
+    if parent.get('key') is not None:
+        return parent['key'].upper()
+
+    return str(parent.get('externalId'))
+
+
 def _read_json_file(input_file: str) -> tuple[Ret.CODE, dict]:
     """ Read in the data from a JSON file.
 
@@ -403,13 +448,13 @@ def _read_json_file(input_file: str) -> tuple[Ret.CODE, dict]:
     issue_dict = {}
     ret_status = Ret.CODE.RET_OK
 
-    # Make sure file has .json extension.
-    if os.path.splitext(input_file)[-1] != '.json':
-        return  Ret.CODE.RET_ERROR_WRONG_FILE_FORMAT
+    # Make sure file has .json extension, optionally followed by .gz or .zst.
+    if not FileHelper.is_json_file(input_file):
+        return Ret.CODE.RET_ERROR_WRONG_FILE_FORMAT, issue_dict
 
     try:
         with FileHelper.open_file(input_file, 'r') as input_file_handle:
-            issue_dict = json.load(input_file_handle)
+            issue_dict = JsonSerializer.load(input_file_handle)
 
     except IOError:
         ret_status = Ret.CODE.RET_ERROR_FILEPATH_INVALID
@@ -0,0 +1,626 @@
+""" Command for the migrate function.
+    Stream the issues of a query from a source Jira server
+    into bulk creates on a target Jira server."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import argparse
+import queue
+import re
+import threading
+from typing import Optional
+
+from jira.exceptions import JIRAError
+from requests import exceptions as reqex
+
+from pyJiraCli.jira_server import Server
+from pyJiraCli.migration_checkpoint import MigrationCheckpoint, DEFAULT_CHECKPOINT_FILE
+from pyJiraCli.printer import Printer
+from pyJiraCli.ret import Ret
+from pyJiraCli.timings import Timings
+
+################################################################################
+# Variables
+################################################################################
+
+DEFAULT_JOBS = 4
+
+# Jira creates at most 50 issues with one bulk request.
+BULK_CREATE_SIZE = 50
+
+# The number of bulk requests waiting per job. The search of the source pauses
+# while the queue is full, so the issues are never held in memory all at once.
+QUEUED_BATCHES_PER_JOB = 2
+
+# The number of keys per search of the deferred sub-tasks.
+KEYS_PER_SEARCH = 100
+
+# The fields which are set by Jira and cannot be set when an issue is created.
+# The project and the parent are set by the migration.
+READ_ONLY_FIELDS = [
+    "project", "parent", "key", "status", "statuscategorychangedate", "created", "updated",
+    "creator", "resolution", "resolutiondate", "lastViewed", "votes", "watches", "worklog",
+    "comment", "attachment", "subtasks", "issuelinks", "thumbnail", "progress",
+    "aggregateprogress", "workratio", "timespent", "aggregatetimespent", "timeestimate",
+    "aggregatetimeestimate", "aggregatetimeoriginalestimate"
+]
+
+# The fields required to create an issue. They are migrated also if not selected.
+REQUIRED_FIELDS = ["summary", "issuetype"]
+
+# The attributes which identify an object on both servers, in the order of preference,
+# e.g. an option by its value instead of its ID, which differs between the servers.
+REFERENCE_ATTRIBUTES = ["accountId", "value", "name", "key"]
+
+# The type of the Sprint field of Jira Software, which is set by the ID of the sprint.
+SPRINT_FIELD_TYPE = "com.pyxis.greenhopper.jira:gh-sprint"
+
+# The ID in the text form of a sprint, provided by older Jira servers.
+_SPRINT_ID_PATTERN = re.compile(r"\bid=(\d+)")
+
+LOG = Printer()
+
+################################################################################
+# Classes
+################################################################################
+
+
+# The search and the parallel jobs of one migration share its state.
+class _Migration:  # pylint: disable=too-many-instance-attributes
+    """ Streams the issues of a search on the source server into bulk creates on
+        the target server. The pages of the search are queued in batches, which
+        are created by parallel jobs. The queue is bounded, so the search waits
+        while the jobs are busy.
+    """
+    # pylint: disable=too-few-public-methods
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, source: Server, target: Server, field_map: dict,
+                 checkpoint: MigrationCheckpoint, target_project: str,
+                 sprint_fields: list[str] = None):
+        self._source = source
+        self._target = target
+        self._field_map = field_map
+        self._checkpoint = checkpoint
+        self._target_project = target_project
+        self._sprint_fields = sprint_fields or []
+        self._create_screens = {}
+        self._batches = queue.Queue(maxsize=target.get_jobs() * QUEUED_BATCHES_PER_JOB)
+        self._statuses = []
+
+    def run(self, jql: str) -> Ret.CODE:
+        """ Migrate the issues of a query. The issues, whose parents are not
+            migrated yet, are deferred until all other issues are created.
+            The deferred issues are searched again, until all are created or
+            no more parents are created, e.g. the stories of an epic before
+            their sub-tasks.
+
+        Args:
+            jql (str): The query on the source server.
+
+        Returns:
+            Ret.CODE: Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+        """
+        workers = [threading.Thread(target=self._create_worker, daemon=True)
+                   for _ in range(self._target.get_jobs())]
+        deferred = {}
+
+        for worker in workers:
+            worker.start()
+
+        try:
+            ret_status = self._queue_issues(self._iter_search(jql), deferred)
+
+            # The parents of the deferred issues are created then.
+            self._batches.join()
+
+            while 0 < len(deferred):
+                keys = list(deferred)
+                deferred = {}
+
+                for idx in range(0, len(keys), KEYS_PER_SEARCH):
+                    keys_jql = ", ".join(f'"{key}"' for key in keys[idx:idx + KEYS_PER_SEARCH])
+                    status = self._queue_issues(
+                        self._iter_search("key in (" + keys_jql + ")", False), deferred)
+
+                    if Ret.CODE.RET_OK == ret_status:
+                        ret_status = status
+
+                self._batches.join()
+
+                if len(deferred) >= len(keys):
+                    for key, parent_key in deferred.items():
+                        print(f"The parent {parent_key} of {key} was not migrated.")
+
+                    ret_status = Ret.CODE.RET_ERROR_CREATING_TICKET_FAILED
+                    break
+
+        finally:
+            for _ in workers:
+                self._batches.put(None)
+
+            for worker in workers:
+                worker.join()
+
+        if Ret.CODE.RET_OK == ret_status:
+            ret_status = next((status for status in self._statuses
+                               if Ret.CODE.RET_OK != status), Ret.CODE.RET_OK)
+
+        return ret_status
+
+    def _iter_search(self, jql: str, validate_query: bool = True):
+        """ Search the issues with the migrated fields on the source server.
+
+        Args:
+            jql (str): The query.
+            validate_query (bool): Whether the server shall validate the query.
+
+        Yields:
+            dict: The raw issues.
+        """
+        fields = list(self._field_map) + ["project", "parent"]
+
+        # Not timed as a phase, the search waits while the queue is full.
+        yield from self._source.iter_search_raw(jql, 0, fields, validate_query)
+
+    def _queue_issues(self, issues, deferred: dict[str, str]) -> Ret.CODE:
+        """ Queue the issues in batches for the bulk creates. Blocks while the queue is full.
+
+        Args:
+            issues (iterable): The raw issues of the source server.
+            deferred (dict[str, str]): Gets the keys of the issues, whose parents are not
+                                       migrated yet, with the keys of their parents.
+
+        Returns:
+            Ret.CODE: Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+        """
+        ret_status = Ret.CODE.RET_OK
+        batch = []
+
+        try:
+            for issue in issues:
+                parent = issue["fields"].get("parent")
+
+                if self._checkpoint.get_target_key(issue["key"]) is not None:
+                    LOG.print_info(f"Issue {issue['key']} was migrated before.")
+                elif (parent is not None) and \
+                        (self._checkpoint.get_target_key(parent["key"]) is None):
+                    deferred[issue["key"]] = parent["key"]
+                else:
+                    batch.append((issue["key"], self._get_create_fields(issue)))
+
+                if BULK_CREATE_SIZE <= len(batch):
+                    self._batches.put(batch)
+                    batch = []
+
+        except JIRAError as e:
+            print(e.text)
+            ret_status = Ret.CODE.RET_ERROR_INVALID_SEARCH
+
+        except reqex.RequestException as e:
+            print(e)
+            ret_status = Ret.CODE.RET_ERROR
+
+        if batch:
+            self._batches.put(batch)
+
+        return ret_status
+
+    def _get_create_fields(self, issue: dict) -> dict:
+        """ Get the fields to create a target issue from a source issue.
+
+        Args:
+            issue (dict): The raw source issue.
+
+        Returns:
+            dict: The fields with the IDs and values of the target server.
+        """
+        fields = issue["fields"]
+        project_key = self._target_project or fields["project"]["key"]
+        create_screen = self._get_create_screen(project_key,
+                                                (fields.get("issuetype") or {}).get("name"))
+        create_fields = {
+            "project": {"key": project_key}
+        }
+
+        for source_id, target_id in self._field_map.items():
+            if fields.get(source_id) in (None, "", [], {}) or \
+                    ((create_screen is not None) and (target_id not in create_screen)):
+                continue
+
+            if source_id in self._sprint_fields:
+                value = _map_sprint(fields[source_id])
+            else:
+                value = _map_value(fields[source_id])
+
+            if value is not None:
+                create_fields[target_id] = value
+
+        if fields.get("parent") is not None:
+            create_fields["parent"] = {
+                "key": self._checkpoint.get_target_key(fields["parent"]["key"])
+            }
+
+        return create_fields
+
+    def _get_create_screen(self, project_key: str, issue_type: str) -> Optional[set[str]]:
+        """ Get the fields on the create screen of an issue type in a target project.
+            The screens are requested once per project and issue type.
+
+        Args:
+            project_key (str): The key of the target project.
+            issue_type (str): The name of the issue type.
+
+        Returns:
+            Optional[set[str]]: The target field IDs or None if the target server
+                                doesn't provide them, then all mapped fields are set.
+        """
+        screen_key = (project_key, issue_type)
+
+        if (screen_key not in self._create_screens) and (issue_type is not None):
+            field_ids = self._target.get_create_field_ids(project_key, issue_type)
+            create_screen = None if field_ids is None else set(field_ids)
+
+            if create_screen is not None:
+                skipped = [target_id for target_id in self._field_map.values()
+                           if target_id not in create_screen]
+                LOG.print_info(f"Fields not on the create screen of {issue_type} in "
+                               f"{project_key}:", ", ".join(skipped) or "None")
+
+            self._create_screens[screen_key] = create_screen
+
+        return self._create_screens.get(screen_key)
+
+    def _create_worker(self) -> None:
+        """ Create the queued batches until the end of the queue is signaled with None. """
+        while True:
+            batch = self._batches.get()
+
+            try:
+                if batch is None:
+                    return
+
+                self._statuses.append(self._create_batch(batch))
+
+            finally:
+                self._batches.task_done()
+
+    def _create_batch(self, batch: list[tuple[str, dict]]) -> Ret.CODE:
+        """ Create a batch of issues with one bulk request and save the checkpoint.
+
+        Args:
+            batch (list[tuple[str, dict]]): The keys of the source issues and the
+                                            fields of the target issues.
+
+        Returns:
+            Ret.CODE: Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+        """
+        ret_status = Ret.CODE.RET_OK
+
+        try:
+            with Timings.phase("create"):
+                results = self._target.get_handle().create_issues(
+                    [create_fields for _, create_fields in batch], prefetch=False)
+
+        except JIRAError as e:
+            print(e.text)
+            return Ret.CODE.RET_ERROR_CREATING_TICKET_FAILED
+
+        except reqex.RequestException as e:
+            print(e)
+            return Ret.CODE.RET_ERROR
+
+        for (source_key, _), result in zip(batch, results):
+            if result["issue"] is None:
+                print(f"The issue {source_key} could not be created: {result['error']}")
+                ret_status = Ret.CODE.RET_ERROR_CREATING_TICKET_FAILED
+            else:
+                self._checkpoint.add(source_key, result["issue"].key)
+                LOG.print_info(f"Created issue {result['issue'].key} from {source_key}.")
+
+        try:
+            self._checkpoint.save()
+        except IOError:
+            ret_status = Ret.CODE.RET_ERROR_FILEPATH_INVALID
+
+        return ret_status
+
+################################################################################
+# Functions
+################################################################################
+
+
+def register(subparser) -> argparse.ArgumentParser:
+    """ Register subparser commands for the migrate module.
+
+    Args:
+        subparser (obj):   The command subparser object provided via __main__.py.
+
+    Returns:
+        obj:    The command parser object of this module.
+    """
+
+    parser = subparser.add_parser(
+        'migrate',
+        help="Migrate the issues of a query from one Jira server to another."
+    )
+
+    for prefix, server_name in [("from", "source"), ("to", "target")]:
+        _add_login_arguments(parser, prefix, server_name)
+
+    parser.add_argument(
+        '--jql',
+        type=str,
+        required=True,
+        metavar='<filter>',
+        help="The filter of the issues to migrate. Must be in JQL format."
+    )
+
+    parser.add_argument(
+        '--to-project',
+        type=str,
+        metavar='<project key>',
+        help="The project of the created issues. Default is the project of the source issue."
+    )
+
+    parser.add_argument(
+        '--field',
+        type=str,
+        action='append',
+        metavar='<field>',
+        help="The field to migrate, by ID or name. Can be used multiple times. " +
+        "Default is all fields known to both servers, which can be set."
+    )
+
+    parser.add_argument(
+        '--checkpoint',
+        type=str,
+        default=DEFAULT_CHECKPOINT_FILE,
+        metavar='<path to file>',
+        help="The file with the keys of the migrated issues. A restarted migration " +
+        f"skips them. Default is '{DEFAULT_CHECKPOINT_FILE}'."
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=DEFAULT_JOBS,
+        metavar='<jobs>',
+        help=f"The number of bulk creates running in parallel. Default is {DEFAULT_JOBS}."
+    )
+
+    parser.add_argument(
+        '--keyset',
+        action='store_true',
+        help="Page the search by the issue ID instead of the offset. " +
+        "The pages of a long search stay consistent while issues change " +
+        "and do not get slower with the offset. The issues are ordered by their ID then."
+    )
+
+    return parser
+
+
+def execute(args) -> Ret.CODE:
+    """ This function serves as entry point for the command 'migrate'.
+        It will be stored as callback for this modules subparser command.
+
+    Args:
+        args (obj): The command line arguments.
+
+    Returns:
+        Ret.CODE:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+    """
+    checkpoint = MigrationCheckpoint(args.checkpoint)
+
+    try:
+        checkpoint.load()
+    except IOError:
+        return Ret.CODE.RET_ERROR_FILEPATH_INVALID
+    except ValueError:
+        return Ret.CODE.RET_ERROR_WRONG_FILE_FORMAT
+
+    source = Server(keyset=args.keyset)
+    target = Server(jobs=args.jobs)
+
+    for server, prefix in [(source, "from"), (target, "to")]:
+        ret_status = server.login(vars(args)[f"{prefix}_profile"],
+                                  vars(args)[f"{prefix}_server"],
+                                  vars(args)[f"{prefix}_token"],
+                                  vars(args)[f"{prefix}_user"],
+                                  vars(args)[f"{prefix}_password"])
+
+        if Ret.CODE.RET_OK != ret_status:
+            LOG.print_error(
+                f"Connection to the {prefix} server is not established. Please login first.")
+            return ret_status
+
+    with Timings.phase("fields"):
+        source_fields = source.get_fields()
+        field_map = get_field_map(source_fields, target.get_fields(), args.field)
+
+    LOG.print_info("Migrated fields:", ", ".join(field_map))
+    migrated_before = checkpoint.get_count()
+    sprint_fields = [field["id"] for field in source_fields
+                     if SPRINT_FIELD_TYPE == field.get("schema", {}).get("custom")]
+
+    ret_status = _Migration(source, target, field_map, checkpoint,
+                            args.to_project, sprint_fields).run(args.jql)
+
+    print(f"Successfully migrated {checkpoint.get_count() - migrated_before} issues, "
+          f"{migrated_before} issues were migrated before.")
+
+    return ret_status
+
+
+def get_field_map(source_fields: list[dict], target_fields: list[dict],
+                  selected: list[str]) -> dict:
+    """ Map the fields of the source server to the fields of the target server.
+        The system fields are mapped by their ID, the custom fields by their name,
+        as their IDs differ between the servers. The read-only fields are skipped.
+        The fields which are not on the create screen of the target are skipped
+        per project and issue type when the issues are created.
+
+    Args:
+        source_fields (list[dict]): The field catalogue of the source server.
+        target_fields (list[dict]): The field catalogue of the target server.
+        selected (list[str]): The IDs or names of the fields to map or None for all.
+
+    Returns:
+        dict: The IDs of the target fields by the IDs of the source fields.
+    """
+    selected = None if selected is None else \
+        {field.lower() for field in selected + REQUIRED_FIELDS}
+    target_ids = {field["id"] for field in target_fields}
+    target_custom_ids = {field["name"].lower(): field["id"]
+                         for field in target_fields if field.get("custom")}
+    field_map = {}
+
+    for field in source_fields:
+        target_id = None
+
+        if (field["id"] in READ_ONLY_FIELDS) or ((selected is not None) and
+                                                 (field["id"].lower() not in selected) and
+                                                 (field["name"].lower() not in selected)):
+            continue
+
+        if field.get("custom"):
+            target_id = target_custom_ids.get(field["name"].lower())
+        elif field["id"] in target_ids:
+            target_id = field["id"]
+
+        if target_id is not None:
+            field_map[field["id"]] = target_id
+
+    return field_map
+
+
+def _map_value(value: any) -> any:
+    """ Map a field value of the source server to the target server. Objects like
+        users, options, versions and components are referenced by an attribute,
+        which is the same on both servers.
+
+    Args:
+        value (any): The value of the source issue.
+
+    Returns:
+        any: The value for the target issue.
+    """
+    if isinstance(value, list):
+        value = [_map_value(element) for element in value]
+
+    elif isinstance(value, dict):
+        attribute = next((attribute for attribute in REFERENCE_ATTRIBUTES
+                          if attribute in value), None)
+
+        if attribute is not None:
+            mapped_value = {attribute: value[attribute]}
+
+            # The selected option of a cascading select field.
+            if value.get("child") is not None:
+                mapped_value["child"] = _map_value(value["child"])
+
+            value = mapped_value
+
+    return value
+
+
+def _map_sprint(value: any) -> Optional[int]:
+    """ Map the value of a Sprint field to the ID of the sprint, which is the only value
+        a create request accepts. An issue can only be created in one sprint, so the
+        latest sprint of the source issue is used. The sprint must exist with the same
+        ID on the target server, e.g. for a migration between projects of one server.
+
+    Args:
+        value (any): The sprints of the source issue, as objects or in the text form
+                     of older Jira servers.
+
+    Returns:
+        Optional[int]: The ID of the latest sprint or None if there is no sprint.
+    """
+    sprints = value if isinstance(value, list) else [value]
+
+    for sprint in reversed(sprints):
+        if isinstance(sprint, dict) and (sprint.get("id") is not None):
+            return int(sprint["id"])
+
+        match = _SPRINT_ID_PATTERN.search(str(sprint))
+
+        if match is not None:
+            return int(match.group(1))
+
+    return None
+
+
+def _add_login_arguments(parser: argparse.ArgumentParser, prefix: str, server_name: str) -> None:
+    """ Add the login arguments of a server.
+
+    Args:
+        parser (argparse.ArgumentParser): The command parser.
+        prefix (str): The prefix of the arguments, e.g. from for --from-profile.
+        server_name (str): The name of the server in the help, e.g. source.
+    """
+    parser.add_argument(
+        f'--{prefix}-profile',
+        type=str,
+        metavar='<profile>',
+        help=f"The name of the server profile of the {server_name} server."
+    )
+
+    parser.add_argument(
+        f'--{prefix}-user',
+        type=str,
+        metavar='<user>',
+        help=f"The user to authenticate with the {server_name} server."
+    )
+
+    parser.add_argument(
+        f'--{prefix}-password',
+        type=str,
+        metavar='<password>',
+        help=f"The password to authenticate with the {server_name} server."
+    )
+
+    parser.add_argument(
+        f'--{prefix}-token',
+        type=str,
+        metavar='<token>',
+        help=f"The token to authenticate with the {server_name} server."
+    )
+
+    parser.add_argument(
+        f'--{prefix}-server',
+        type=str,
+        metavar='<server URL>',
+        help=f"The URL of the {server_name} server to connect to."
+    )
@@ -0,0 +1,361 @@
+""" Command for the mirror function.
+    Synchronize the issues of a query incrementally into
+    a local SQLite database."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import argparse
+import datetime
+import sqlite3
+
+from jira.exceptions import JIRAError
+
+from pyJiraCli.issue_store import IssueStore, DEFAULT_DB_FILE, META_FIELDS, META_TIME_ZONE, \
+    STORE_DATETIME_FORMAT, from_store_datetime, to_store_datetime
+from pyJiraCli.jira_server import Server
+from pyJiraCli.jql import get_updated_since_jql, to_jql_datetime
+from pyJiraCli.printer import Printer, PrintType
+from pyJiraCli.ret import Ret
+from pyJiraCli.timings import Timings
+
+
+################################################################################
+# Variables
+################################################################################
+
+# All fields are mirrored by default, so every field can be queried offline.
+DEFAULT_SYNC_FIELDS = ["*all"]
+
+# The number of issues stored per transaction.
+SYNC_BATCH_SIZE = 1000
+
+LOG = Printer()
+
+
+################################################################################
+# Classes
+################################################################################
+
+
+################################################################################
+# Functions
+################################################################################
+
+def register(subparser) -> argparse.ArgumentParser:
+    """ Register subparser commands for the mirror module.
+
+    Args:
+        subparser (obj):   The command subparser object provided via __main__.py.
+
+    Returns:
+        obj:    The command parser object of this module.
+    """
+
+    parser = subparser.add_parser(
+        'mirror',
+        help="Mirror the issues of a query into a local SQLite database."
+    )
+
+    sub_parsers = parser.add_subparsers(required=True)
+
+    # Sync
+    sub_parser_sync = sub_parsers.add_parser(
+        "sync",
+        help="Download the issues of a query. Later runs only download the issues " +
+        "updated since the previous run."
+    )
+    sub_parser_sync.set_defaults(func=_mirror_sync)
+
+    sub_parser_sync.add_argument(
+        '--profile',
+        type=str,
+        metavar='<profile>',
+        help="The name of the server profile which shall be used for this process."
+    )
+
+    sub_parser_sync.add_argument(
+        '-u',
+        '--user',
+        type=str,
+        metavar='<user>',
+        help="The user to authenticate with the Jira server."
+    )
+
+    sub_parser_sync.add_argument(
+        '-p',
+        '--password',
+        type=str,
+        metavar='<password>',
+        help="The password to authenticate with the Jira server."
+    )
+
+    sub_parser_sync.add_argument(
+        '-t',
+        '--token',
+        type=str,
+        metavar='<token>',
+        help="The token to authenticate with the Jira server."
+    )
+
+    sub_parser_sync.add_argument(
+        '-s',
+        '--server',
+        type=str,
+        metavar='<server URL>',
+        help="The Jira server URL to connect to."
+    )
+
+    sub_parser_sync.add_argument(
+        '--jql',
+        type=str,
+        required=True,
+        metavar='<filter>',
+        help="Filter string of the issues to mirror. Must be in JQL format."
+    )
+
+    sub_parser_sync.add_argument(
+        '--db',
+        type=str,
+        default=DEFAULT_DB_FILE,
+        metavar='<path to file>',
+        help=f"The SQLite database file. Default is '{DEFAULT_DB_FILE}'."
+    )
+
+    sub_parser_sync.add_argument(
+        '--field',
+        type=str,
+        action='append',
+        metavar='<field>',
+        help="The field to mirror. Can be used multiple times. Default is all fields."
+    )
+
+    sub_parser_sync.add_argument(
+        '--full',
+        action='store_true',
+        help="Download all issues of the query again, not only the updated ones."
+    )
+
+    sub_parser_sync.add_argument(
+        '--text-index',
+        action='store_true',
+        help="Create a full-text index of the summaries, descriptions and comments " +
+        "for 'search --offline --text'. Once created, it is kept up to date."
+    )
+
+    return parser
+
+
+def execute(_) -> Ret.CODE:
+    """ This function serves as entry point for the command 'mirror'.
+        It will be stored as callback for this modules subparser command.
+
+    Args:
+        args (obj): The command line arguments.
+
+    Returns:
+        Ret.CODE:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+    """
+    ret_status = Ret.CODE.RET_OK
+
+    # Nothing to do, the operations have their own callbacks.
+
+    return ret_status
+
+
+def _mirror_sync(args) -> Ret.CODE:
+    """ Synchronize the issues of a query into the database.
+
+    Args:
+        args (obj): The command line arguments.
+
+    Returns:
+        Ret.CODE:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+    """
+    # Pages by the issue ID are not shifted by issues updated during the synchronization.
+    server = Server(keyset=True)
+    ret_status = server.login(args.profile,
+                              args.server,
+                              args.token,
+                              args.user,
+                              args.password)
+
+    if Ret.CODE.RET_OK != ret_status:
+        LOG.print_error(PrintType.ERROR, ret_status)
+    else:
+        try:
+            with IssueStore(args.db) as store:
+                if args.text_index is True:
+                    ret_status = _enable_text_index(store)
+
+                if Ret.CODE.RET_OK == ret_status:
+                    ret_status = _sync(server, store, args.jql,
+                                       args.field or DEFAULT_SYNC_FIELDS, args.full)
+
+        except sqlite3.Error as e:
+            print(e)
+            ret_status = Ret.CODE.RET_ERROR_FILE_OPEN_FAILED
+
+    return ret_status
+
+
+def _enable_text_index(store: IssueStore) -> Ret.CODE:
+    """ Create the full-text index, if the mirror has none yet.
+
+    Args:
+        store (IssueStore):  The database.
+
+    Returns:
+        Ret.CODE:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+    """
+    if not store.has_text_index():
+        try:
+            with Timings.phase("text index"):
+                store.enable_text_index()
+
+        except sqlite3.OperationalError as e:
+            # The FTS5 extension is missing in some builds of SQLite.
+            print(e)
+            return Ret.CODE.RET_ERROR_MISSING_DEPENDENCY
+
+    return Ret.CODE.RET_OK
+
+
+def _sync(server: Server, store: IssueStore, jql: str, fields: list[str], full: bool) -> Ret.CODE:
+    """ Download the issues of a query, which were updated since the high-water mark
+        of the query, and store them. The high-water mark only advances if all issues
+        were downloaded and not beyond the start of the synchronization, so the issues
+        updated during it are downloaded again by the next one.
+
+    Args:
+        server (Server):     The server object to interact with the Jira server.
+        store (IssueStore):  The database.
+        jql (str):           The query.
+        fields (list[str]):  The fields to download.
+        full (bool):         Whether to download all issues, ignoring the high-water mark.
+
+    Returns:
+        Ret.CODE:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+    """
+    time_zone = server.get_time_zone()
+    last_updated = None if full else store.get_last_updated(jql)
+    since = None
+
+    # JQL only has minutes, so the issues of the last minute are downloaded again.
+    if last_updated:
+        since = to_jql_datetime(from_store_datetime(last_updated), time_zone)
+
+    sync_jql = get_updated_since_jql(jql, since)
+
+    # The update time is required for the high-water mark.
+    if not any(field in ("updated", "*all", "*navigable") for field in fields):
+        fields = fields + ["updated"]
+
+    sync_start = get_sync_start(server)
+
+    LOG.print_info("Synchronization query:", sync_jql)
+
+    try:
+        with Timings.phase("sync"):
+            synced, newest = _download(server, store, sync_jql, fields)
+            store.set_synced(jql, None if newest is None else min(newest, sync_start))
+
+            # Required to resolve the field names and dates of the offline search.
+            store.set_meta(META_FIELDS, server.get_fields())
+            store.set_meta(META_TIME_ZONE, time_zone)
+
+    except JIRAError as e:
+        print(e.text)
+        return Ret.CODE.RET_ERROR_INVALID_SEARCH
+
+    print(f"Synchronized {synced} issues into the mirror with "
+          f"{store.get_issue_count()} issues.")
+
+    return Ret.CODE.RET_OK
+
+
+def _download(server: Server, store: IssueStore, sync_jql: str,
+              fields: list[str]) -> tuple[int, str]:
+    """ Download the issues of the synchronization query and store them in batches.
+
+    Args:
+        server (Server):     The server object to interact with the Jira server.
+        store (IssueStore):  The database.
+        sync_jql (str):      The query of the updated issues.
+        fields (list[str]):  The fields to download.
+
+    Raises:
+        JIRAError: The search failed.
+
+    Returns:
+        tuple[int, str]: The number of downloaded issues and their latest update time
+                         in UTC, in the STORE_DATETIME_FORMAT, or None if there is none.
+    """
+    newest = None
+    synced = 0
+    batch = []
+
+    for issue in server.iter_search_raw(sync_jql, 0, fields):
+        batch.append(issue)
+        updated = to_store_datetime(issue.get("fields", {}).get("updated"))
+
+        if (updated is not None) and ((newest is None) or (newest < updated)):
+            newest = updated
+
+        if len(batch) >= SYNC_BATCH_SIZE:
+            store.upsert_issues(batch)
+            synced += len(batch)
+            batch = []
+
+    store.upsert_issues(batch)
+    synced += len(batch)
+
+    return synced, newest
+
+
+def get_sync_start(server: Server) -> str:
+    """ Get the start time of a synchronization on the server,
+        or on this machine if the server doesn't report its time.
+
+    Args:
+        server (Server): The server object to interact with the Jira server.
+
+    Returns:
+        str: The time in UTC, in the STORE_DATETIME_FORMAT of the database.
+    """
+    sync_start = to_store_datetime(server.get_server_time())
+
+    if sync_start is None:
+        sync_start = datetime.datetime.now(datetime.timezone.utc).strftime(STORE_DATETIME_FORMAT)
+
+    return sync_start
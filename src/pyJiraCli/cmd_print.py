@@ -39,6 +39,7 @@ import argparse
 from pyJiraCli.printer import Printer
 from pyJiraCli.jira_server import Server
 from pyJiraCli.ret import Ret
+from pyJiraCli.timings import Timings
 ################################################################################
 # Variables
 ################################################################################
@@ -154,11 +155,13 @@ def _cmd_print(issue_key: str, server: Server) -> Ret.CODE:
         Ret.CODE: The return status of the module.
     """
     ret_status = Ret.CODE.RET_OK
-    ret_status = server.search(f"key = {issue_key}", max_results=1, fields=[])
+    with Timings.phase("search"):
+        ret_status = server.search(f"key = {issue_key}", max_results=1, fields=[], raw=True)
 
     if ret_status == Ret.CODE.RET_OK:
-        issue = server.get_search_result().pop().raw
-        issue_data = json.dumps(issue, indent=4)
+        issue = server.get_search_result().pop()
+        with Timings.phase("serialize"):
+            issue_data = json.dumps(issue, indent=4)
         print(issue_data)
 
     return ret_status
@@ -33,13 +33,14 @@
 # Imports
 ################################################################################
 
-import json
 import argparse
 
 from pyJiraCli.file_helper import FileHelper
 from pyJiraCli.jira_server import Server
+from pyJiraCli.json_serializer import JsonSerializer
 from pyJiraCli.printer import Printer
 from pyJiraCli.ret import Ret
+from pyJiraCli.timings import Timings
 
 
 ################################################################################
@@ -119,6 +120,13 @@ def register(subparser) -> argparse.ArgumentParser:
         help="The name of the project to get the scheme information for."
     )
 
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help="Write the JSON file without indentation and whitespace, " +
+        "e.g. for machine consumption. Faster and smaller."
+    )
+
     return parser
 
 
@@ -143,19 +151,22 @@ def execute(args) -> Ret.CODE:
         LOG.print_error(
             "Connection to server is not established. Please login first.")
     elif args.project:
-        ret_status = _get_project_scheme(server, args.project)
+        with Timings.phase("project scheme"):
+            ret_status = _get_project_scheme(server, args.project, args.compact)
     else:
-        ret_status = _get_instance_scheme(server)
+        with Timings.phase("instance scheme"):
+            ret_status = _get_instance_scheme(server, args.compact)
 
     return ret_status
 
 
-def _get_project_scheme(server: Server, project_key: str) -> Ret.CODE:
+def _get_project_scheme(server: Server, project_key: str, compact: bool = False) -> Ret.CODE:
     """ Get the scheme information from the Jira server for a specific project.
 
     Args:
         server (Server):    The server object to interact with the Jira server.
         project_key (str):  The key of the project to get the scheme information for.
+        compact (bool):     Whether to write the JSON file without indentation.
 
     Returns:
         Ret:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
@@ -202,14 +213,15 @@ def _get_project_scheme(server: Server, project_key: str) -> Ret.CODE:
         scheme_output["issue_types"].append(element)
 
     # Save output to file
-    return _save_search(f"scheme_output_{project_key}.json", scheme_output)
+    return _save_search(f"scheme_output_{project_key}.json", scheme_output, compact)
 
 
-def _get_instance_scheme(server: Server) -> Ret.CODE:
+def _get_instance_scheme(server: Server, compact: bool = False) -> Ret.CODE:
     """ Get the scheme information from the Jira server.
 
     Args:
         server (Server):    The server object to interact with the Jira server.
+        compact (bool):     Whether to write the JSON file without indentation.
 
     Returns:
         Ret:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
@@ -246,15 +258,16 @@ def _get_instance_scheme(server: Server) -> Ret.CODE:
         scheme_output["fields"].append(element)
 
     # Save output to file
-    return _save_search("scheme_output.json", scheme_output)
+    return _save_search("scheme_output.json", scheme_output, compact)
 
 
-def _save_search(save_file: str, search_dict: dict) -> Ret.CODE:
+def _save_search(save_file: str, search_dict: dict, compact: bool = False) -> Ret.CODE:
     """ Save the search result to a JSON file.
 
     Args:
         save_file (str): The filepath to the JSON file.
         search_dict (dict): The dictionary with the search data.
+        compact (bool): Whether to write the JSON file without indentation.
 
     Returns:
         Ret.CODE: _description_
@@ -263,9 +276,7 @@ def _save_search(save_file: str, search_dict: dict) -> Ret.CODE:
 
     try:
         with FileHelper.open_file(save_file, 'w') as result_file:
-            result_data = json.dumps(search_dict, indent=4, ensure_ascii=False)
-
-            result_file.write(result_data)
+            JsonSerializer.dump(search_dict, result_file, compact)
 
             msg = f"Successfully saved the search results in '{save_file}'."
             LOG.print_info(msg)
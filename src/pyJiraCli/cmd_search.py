@@ -35,14 +35,24 @@
 # Imports
 ################################################################################
 
-import json
 import argparse
 import datetime
+import os
+import sqlite3
 
+from jira.exceptions import JIRAError
+
+from pyJiraCli.csv_writer import CsvWriter
 from pyJiraCli.file_helper import FileHelper
+from pyJiraCli.issue_store import IssueStore, DEFAULT_DB_FILE
 from pyJiraCli.jira_server import Server
+from pyJiraCli.jql import JqlSyntaxError
+from pyJiraCli.json_serializer import JsonSerializer
+from pyJiraCli.offline_server import OfflineServer
 from pyJiraCli.printer import Printer
 from pyJiraCli.ret import Ret
+from pyJiraCli.sharded_server import ShardedServer, DEFAULT_SHARDS
+from pyJiraCli.timings import Timings
 
 
 ################################################################################
@@ -53,6 +63,19 @@ DEFAULT_FIELDS = ['project', 'summary', 'created', 'creator']
 COLUMN_WIDTH = 25
 MAX_FIELDS_PRINTED = len(DEFAULT_FIELDS)
 
+FORMAT_JSON = "json"
+FORMAT_PARQUET = "parquet"
+FORMAT_CSV = "csv"
+
+# The formats, which are written page by page, and their default files.
+STREAMED_FORMATS = {
+    FORMAT_PARQUET: "./search.parquet",
+    FORMAT_CSV: "./search.csv"
+}
+
+# Number of issues after which the progress of a search for all issues is printed.
+PROGRESS_INTERVAL = 1000
+
 LOG = Printer()
 
 
@@ -122,7 +145,10 @@ def register(subparser) -> argparse.ArgumentParser:
     parser.add_argument(
         'filter',
         type=str,
-        help="Filter string to search for. Must be in JQL format."
+        nargs='?',
+        default="",
+        help="Filter string to search for. Must be in JQL format. " +
+        "Optional with --text."
     )
 
     parser.add_argument(
@@ -139,7 +165,8 @@ def register(subparser) -> argparse.ArgumentParser:
         type=str,
         metavar='<PATH TO FILE>',
         help="Absolute filepath or filepath relative " +
-        "to the current work directory to a JSON file."
+        "to the current work directory to a JSON file. " +
+        "Files ending with .json.gz or .json.zst are compressed."
     )
 
     parser.add_argument(
@@ -167,6 +194,75 @@ def register(subparser) -> argparse.ArgumentParser:
         help="Translate the field IDs to names in the output."
     )
 
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help="Write the JSON file without indentation and whitespace, " +
+        "e.g. for machine consumption. Faster and smaller."
+    )
+
+    parser.add_argument(
+        '--format',
+        type=str,
+        choices=[FORMAT_JSON, FORMAT_PARQUET, FORMAT_CSV],
+        default=FORMAT_JSON,
+        help="The format of the file. Default is json. " +
+        "parquet writes every field as typed column, " +
+        f"by default to '{STREAMED_FORMATS[FORMAT_PARQUET]}'. Requires pyarrow. " +
+        "csv writes a column per field, which may be a dotted path like " +
+        f"assignee.displayName, by default to '{STREAMED_FORMATS[FORMAT_CSV]}'."
+    )
+
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help="Search the local mirror created with 'mirror sync' instead of the server. " +
+        "Supports a JQL subset: =, !=, ~, !~, <, <=, >, >=, IN, NOT IN, IS EMPTY, " +
+        "AND, OR, NOT and ORDER BY."
+    )
+
+    parser.add_argument(
+        '--db',
+        type=str,
+        default=DEFAULT_DB_FILE,
+        metavar='<path to file>',
+        help=f"The SQLite database file of the mirror. Default is '{DEFAULT_DB_FILE}'."
+    )
+
+    parser.add_argument(
+        '--text',
+        type=str,
+        metavar='<terms>',
+        help="Only find the issues, which contain all terms in the summary, description " +
+        "or comments, ranked by relevance. A term ending with * matches any suffix. " +
+        "Requires --offline and a mirror with a text index."
+    )
+
+    parser.add_argument(
+        '--keyset',
+        action='store_true',
+        help="Page the search by the issue ID instead of the offset. " +
+        "The pages of a long search stay consistent while issues change " +
+        "and do not get slower with the offset. The issues are ordered by their ID then."
+    )
+
+    parser.add_argument(
+        '--shard-by',
+        type=str,
+        metavar='<date field>',
+        help="Split the filter into non-overlapping windows of a date field, e.g. created, " +
+        "which are searched in parallel. Every issue is found once. " +
+        "The ORDER BY clause only orders the issues within a window."
+    )
+
+    parser.add_argument(
+        '--shards',
+        type=int,
+        default=DEFAULT_SHARDS,
+        metavar='<shards>',
+        help=f"The number of date windows of --shard-by. Default is {DEFAULT_SHARDS}."
+    )
+
     return parser
 
 
@@ -180,7 +276,30 @@ def execute(args) -> Ret.CODE:
     Returns:
         Ret:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
     """
-    server = Server()
+    # Get the fields to search for in the issues
+    fields = DEFAULT_FIELDS
+
+    if args.full is True:
+        fields = []  # Get all fields
+    elif args.field is not None:
+        fields = args.field  # Get the fields provided by the user
+
+    if args.offline is True:
+        if args.shard_by is not None:
+            print("The mirror can not be searched with --shard-by.")
+            return Ret.CODE.RET_ERROR_ARGPARSE
+
+        return _cmd_search_offline(args, fields)
+
+    if args.text is not None:
+        print("The text search requires --offline.")
+        return Ret.CODE.RET_ERROR_ARGPARSE
+
+    if args.shard_by is not None:
+        server = ShardedServer(args.shard_by, args.shards, keyset=args.keyset)
+    else:
+        server = Server(keyset=args.keyset)
+
     ret_status = server.login(args.profile,
                               args.server,
                               args.token,
@@ -191,21 +310,48 @@ def execute(args) -> Ret.CODE:
         LOG.print_error(
             "Connection to server is not established. Please login first.")
     else:
-        # Get the fields to search for in the issues
-        fields = DEFAULT_FIELDS
-
-        if args.full is True:
-            fields = []  # Get all fields
-        elif args.field is not None:
-            fields = args.field  # Get the fields provided by the user
-
         # Search for the issues
         ret_status = _cmd_search(args.filter,
                                  args.max,
                                  args.file,
                                  server,
                                  fields,
-                                 args.translate)
+                                 args.translate,
+                                 args.compact,
+                                 args.format)
+
+    return ret_status
+
+
+def _cmd_search_offline(args, fields: list[str]) -> Ret.CODE:
+    """ Search the issues in the local mirror instead of the server.
+
+    Args:
+        args (obj):         The command line arguments.
+        fields (list[str]): The fields to search for in the work items.
+
+    Returns:
+        Ret.CODE:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+    """
+    # Opening a missing database would create an empty one.
+    if not os.path.isfile(args.db):
+        print(f"The mirror '{args.db}' does not exist. Create it with 'mirror sync'.")
+        return Ret.CODE.RET_ERROR_FILEPATH_INVALID
+
+    try:
+        with IssueStore(args.db) as store:
+            ret_status = _cmd_search(args.filter,
+                                     args.max,
+                                     args.file,
+                                     OfflineServer(store, args.text),
+                                     fields,
+                                     args.translate,
+                                     args.compact,
+                                     args.format)
+
+    except sqlite3.Error as e:
+        print(e)
+        ret_status = Ret.CODE.RET_ERROR_FILE_OPEN_FAILED
 
     return ret_status
 
@@ -215,7 +361,9 @@ def _cmd_search(filter_str: str,
                 save_file: str,
                 server: Server,
                 fields: list[str],
-                translate: bool) -> Ret.CODE:
+                translate: bool,
+                compact: bool = False,
+                file_format: str = FORMAT_JSON) -> Ret.CODE:
     # pylint: disable=too-many-arguments
     """ Search tickets with a provided filter or search string.
 
@@ -227,6 +375,8 @@ def _cmd_search(filter_str: str,
         server (Server):    The server object to interact with the Jira server.
         fields (list[str]): The fields to search for in the work items.
         translate (bool):   Whether to translate field IDs to names in the output.
+        compact (bool):     Whether to write the JSON file without indentation.
+        file_format (str):  The format of the file, FORMAT_JSON, FORMAT_PARQUET or FORMAT_CSV.
 
     Returns:
         Ret:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
@@ -236,8 +386,16 @@ def _cmd_search(filter_str: str,
     if results is None:
         results = 50
 
+    # The issues are written page by page instead of being collected first.
+    if file_format in STREAMED_FORMATS:
+        return _save_search_stream(filter_str, results, save_file, server, fields, translate,
+                                   file_format)
+
+    _get_approximate_count(filter_str, results, server)
+
     # Search for the issues on the server.
-    ret_status = server.search(filter_str, results, fields)
+    with Timings.phase("search"):
+        ret_status = server.search(filter_str, results, fields, raw=True)
 
     if ret_status == Ret.CODE.RET_OK:
         # Retrieve the search result.
@@ -255,39 +413,53 @@ def _cmd_search(filter_str: str,
         # Get the Jira handle to request extra data if required.
         jira = server.get_handle()
 
-        for issue in found_issues:
-            issue_dict = issue.raw
-
-            # Worklogs are requested for the issue.
-            if "worklog" in issue_dict["fields"]:
+        with Timings.phase("enrich"):
+            for issue_dict in found_issues:
 
-                # Get the worklogs for the issue
-                # Iterate over all worklogs and store them in a list
-                worklog_list = [
-                    log.raw for log in jira.worklogs(issue.key)]
+                # Worklogs are requested for the issue. The mirror has no Jira handle.
+                if (jira is not None) and ("worklog" in issue_dict["fields"]):
+                    with Timings.phase("worklogs"):
+                        # Get the worklogs for the issue
+                        # Iterate over all worklogs and store them in a list
+                        worklog_list = [
+                            log.raw for log in jira.worklogs(issue_dict["key"])]
 
-                issue_dict["fields"]["worklog"] = {
-                    "total": len(worklog_list),
-                    "worklogs": worklog_list
-                }
+                        issue_dict["fields"]["worklog"] = {
+                            "total": len(worklog_list),
+                            "worklogs": worklog_list
+                        }
 
-            # Translate field IDs to names
-            if True is translate:
-                for field_id in list(issue_dict["fields"].keys()):
-                    field_name = server.get_field_name(field_id)
-                    issue_dict["fields"][field_name] = issue_dict["fields"].pop(field_id)
+                # Translate field IDs to names
+                if True is translate:
+                    with Timings.phase("translate"):
+                        issue_dict["fields"] = _translate_fields(server, issue_dict["fields"])
 
-            search_dict['issues'].append(issue_dict)
+                search_dict['issues'].append(issue_dict)
 
         if save_file is not None:
-            ret_status = _save_search(save_file, search_dict)
+            with Timings.phase("serialize"):
+                ret_status = _save_search(save_file, search_dict, compact)
         else:
-            _print_table(search_dict, fields)
+            with Timings.phase("print"):
+                _print_table(search_dict, fields)
             ret_status = Ret.CODE.RET_OK
 
     return ret_status
 
 
+def _translate_fields(server: Server, fields: dict) -> dict:
+    """ Translate the field IDs of an issue to their names.
+
+    Args:
+        server (Server): The server object to interact with the Jira server.
+        fields (dict): The fields of the issue by ID.
+
+    Returns:
+        dict: The fields of the issue by name.
+    """
+    return {server.get_field_name(field_id): value for field_id, value in fields.items()}
+
+
 def _print_table(search_dict: dict, fields: list[str]) -> None:
     """ Print a quick overview for all issues in the dict.
 
@@ -344,12 +516,171 @@ def _print_table(search_dict: dict, fields: list[str]) -> None:
         print()
 
 
-def _save_search(save_file: str, search_dict: dict) -> Ret.CODE:
+def _save_search_stream(filter_str: str,
+                        results: int,
+                        save_file: str,
+                        server: Server,
+                        fields: list[str],
+                        translate: bool,
+                        file_format: str) -> Ret.CODE:
+    # pylint: disable=too-many-arguments,too-many-locals
+    """ Search tickets and write them to a Parquet or CSV file while the pages are received.
+        The worklogs are not requested per issue.
+
+    Args:
+        filter_str (str):   String containing the search parameters.
+        results (int):      The maximum number of search results.
+        save_file (str):    The filepath to the file or None for the default file.
+        server (Server):    The server object to interact with the Jira server.
+        fields (list[str]): The fields to search for in the work items. Empty for all fields.
+        translate (bool):   Whether to use the field names instead of the IDs as column names.
+                            Only used for Parquet.
+        file_format (str):  The format of the file, FORMAT_PARQUET or FORMAT_CSV.
+
+    Returns:
+        Ret.CODE: Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+    """
+    if FORMAT_PARQUET == file_format:
+        # Imported on demand, as importing pyarrow takes about 40 MB and 75 ms.
+        from pyJiraCli.parquet_writer import ParquetWriter  # pylint: disable=import-outside-toplevel
+
+        if not ParquetWriter.is_available():
+            return Ret.CODE.RET_ERROR_MISSING_DEPENDENCY
+
+    if save_file is None:
+        save_file = STREAMED_FORMATS[file_format]
+
+    # A column per field, all fields of the catalogue for a full search.
+    columns = fields or server.get_field_ids()
+    search_fields = fields
+
+    # The CSV columns may select attributes of the fields.
+    if FORMAT_CSV == file_format:
+        search_fields = CsvWriter.get_search_fields(fields)
+
+    total = _get_approximate_count(filter_str, results, server)
+
+    try:
+        with Timings.phase("search"), \
+                _open_writer(save_file, server, columns, translate, file_format) as writer:
+            issues = server.iter_search_raw(filter_str, results, search_fields)
+
+            for count, issue_dict in enumerate(issues, start=1):
+                writer.write_issue(issue_dict)
+
+                if 0 == count % PROGRESS_INTERVAL:
+                    LOG.print_info(f"Saved {count} of about {total or '?'} issues.")
+
+    except JIRAError as e:
+        print(e.text)
+        return Ret.CODE.RET_ERROR_INVALID_SEARCH
+
+    except JqlSyntaxError as e:
+        print(e)
+        return Ret.CODE.RET_ERROR_INVALID_SEARCH
+
+    except IOError:
+        return Ret.CODE.RET_ERROR_FILEPATH_INVALID
+
+    msg = f"Successfully saved the search results in '{save_file}'."
+    LOG.print_info(msg)
+    print(msg)
+
+    return Ret.CODE.RET_OK
+
+
+def _get_approximate_count(filter_str: str, results: int, server: Server) -> int:
+    """ Get the approximate number of issues of a search for all issues,
+        which is printed as progress in verbose mode. Not requested otherwise.
+
+    Args:
+        filter_str (str):   String containing the search parameters.
+        results (int):      The maximum number of search results.
+        server (Server):    The server object to interact with the Jira server.
+
+    Returns:
+        int: The approximate number of issues or None if not requested or not available.
+    """
+    count = None
+
+    if (0 == results) and (LOG.is_verbose() is True):
+        with Timings.phase("count"):
+            count = server.get_approximate_count(filter_str)
+
+        if count is not None:
+            LOG.print_info("Approximate number of issues:", str(count))
+
+    return count
+
+
+def _open_writer(save_file: str,
+                 server: Server,
+                 columns: list[str],
+                 translate: bool,
+                 file_format: str) -> any:
+    """ Open the writer of a streamed format.
+
+    Args:
+        save_file (str):     The filepath to the file.
+        server (Server):     The server object to interact with the Jira server.
+        columns (list[str]): The fields or field paths per column.
+        translate (bool):    Whether to use the field names instead of the IDs as column names.
+        file_format (str):   The format of the file, FORMAT_PARQUET or FORMAT_CSV.
+
+    Returns:
+        any: The ParquetWriter or CsvWriter.
+
+    Raises:
+        IOError: The file cannot be opened.
+    """
+    if FORMAT_CSV == file_format:
+        return CsvWriter(save_file, columns)
+
+    from pyJiraCli.parquet_writer import ParquetWriter  # pylint: disable=import-outside-toplevel
+
+    return ParquetWriter(save_file, _get_parquet_columns(server, columns, translate))
+
+
+def _get_parquet_columns(server: Server,
+                         fields: list[str],
+                         translate: bool) -> list[tuple[str, str, str]]:
+    """ Get the columns of the Parquet file for the requested fields.
+
+    Args:
+        server (Server):    The server object to interact with the Jira server.
+        fields (list[str]): The requested fields.
+        translate (bool):   Whether to use the field names instead of the IDs as column names.
+
+    Returns:
+        list[tuple[str, str, str]]: The column name, the key in the fields of the issue
+                                    and the schema type of the field per column.
+    """
+    columns = []
+    column_names = set()
+
+    for field in fields:
+        column_name = field
+
+        if True is translate:
+            column_name = server.get_field_name(server.get_field_id(field))
+
+        # Column names must be unique, fall back to the requested field.
+        if column_name in column_names:
+            column_name = field
+
+        column_names.add(column_name)
+        columns.append((column_name, field, server.get_field_type(field)))
+
+    return columns
+
+
+def _save_search(save_file: str, search_dict: dict, compact: bool = False) -> Ret.CODE:
     """ Save the search result to a JSON file.
 
     Args:
         save_file (str): The filepath to the JSON file.
         search_dict (dict): The dictionary with the search data.
+        compact (bool): Whether to write the JSON file without indentation.
 
     Returns:
         Ret.CODE: _description_
@@ -358,9 +689,7 @@ def _save_search(save_file: str, search_dict: dict) -> Ret.CODE:
 
     try:
         with FileHelper.open_file(save_file, 'w') as result_file:
-            result_data = json.dumps(search_dict, indent=4, ensure_ascii=False)
-
-            result_file.write(result_data)
+            JsonSerializer.dump(search_dict, result_file, compact)
 
             msg = f"Successfully saved the search results in '{save_file}'."
             LOG.print_info(msg)
@@ -0,0 +1,204 @@
+"""Writes the search results as flattened columns to a CSV file."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import csv
+import json
+
+from pyJiraCli.file_helper import FileHelper
+
+################################################################################
+# Variables
+################################################################################
+
+KEY_COLUMN = "key"
+
+# Separates the attributes of a field path, e.g. assignee.displayName.
+PATH_SEPARATOR = "."
+
+# Separates the values of an array in a cell, e.g. of components.name.
+LIST_SEPARATOR = ";"
+
+################################################################################
+# Classes
+################################################################################
+
+
+class CsvWriter:
+    """ Writes issues as rows to a CSV file. Every column is a dotted path into
+        the fields of the issue, e.g. assignee.displayName or components.name.
+        The paths are compiled once into extractor functions and every row is
+        written immediately, so the memory does not grow with the number of issues.
+    """
+
+    def __init__(self, file_path: str, paths: list[str]):
+        """ Open the CSV file and write the header.
+
+        Args:
+            file_path (str): The path to the CSV file. May end with .gz or .zst.
+            paths (list[str]): The field path per column.
+
+        Raises:
+            IOError: The file cannot be opened.
+        """
+        self._rows = 0
+        self._extractors = [compile_field_path(path) for path in paths]
+        self._file = FileHelper.open_file(file_path, "w")
+
+        # The line ending is translated by the file, like all other text files.
+        self._writer = csv.writer(self._file, lineterminator="\n")
+        self._writer.writerow([KEY_COLUMN, *paths])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
+
+    @staticmethod
+    def get_search_fields(paths: list[str]) -> list[str]:
+        """ Get the fields which must be requested from the server for the paths.
+
+        Args:
+            paths (list[str]): The field paths.
+
+        Returns:
+            list[str]: The first attribute of every path, without duplicates.
+        """
+        return list(dict.fromkeys(path.split(PATH_SEPARATOR, 1)[0] for path in paths))
+
+    def write_issue(self, issue: dict) -> None:
+        """ Write an issue as row.
+
+        Args:
+            issue (dict): The raw data of the issue.
+        """
+        fields = issue.get("fields", {})
+        row = [issue.get("key")]
+        row.extend(_to_cell(extractor(fields)) for extractor in self._extractors)
+
+        self._writer.writerow(row)
+        self._rows += 1
+
+    def close(self) -> int:
+        """ Close the file.
+
+        Returns:
+            int: The number of issues written.
+        """
+        if not self._file.closed:
+            self._file.close()
+
+        return self._rows
+
+################################################################################
+# Functions
+################################################################################
+
+
+def compile_field_path(path: str) -> any:
+    """ Compile a dotted field path into a function, which extracts the value
+        from the fields of an issue. The first attribute is the field, the
+        following attributes select from objects. A numeric attribute selects
+        an array element, any other attribute is selected from all elements.
+
+    Args:
+        path (str): The field path, e.g. assignee.displayName,
+                    components.name or fixVersions.0.name.
+
+    Returns:
+        any: The extractor function, which gets the fields and returns the value or None.
+    """
+    field, *attributes = path.split(PATH_SEPARATOR)
+    steps = tuple((attribute, int(attribute) if attribute.isdigit() else None)
+                  for attribute in attributes)
+
+    # Most paths select a field without attributes.
+    if 0 == len(steps):
+        return lambda fields: fields.get(field)
+
+    def extract(fields: dict) -> any:
+        value = fields.get(field)
+
+        for attribute, index in steps:
+            if value is None:
+                break
+
+            value = _select(value, attribute, index)
+
+        return value
+
+    return extract
+
+
+def _select(value: any, attribute: str, index: int) -> any:
+    """ Select an attribute of an object, an element or an attribute of all elements
+        of an array. None if the value has no such attribute or element. """
+    selected = None
+
+    if isinstance(value, dict):
+        selected = value.get(attribute)
+    elif isinstance(value, list):
+        if index is None:
+            selected = [_select(element, attribute, None) for element in value]
+        elif index < len(value):
+            selected = value[index]
+
+    return selected
+
+
+def _to_cell(value: any) -> str:
+    """ Convert a value to the text of a cell. Objects are replaced by their name,
+        like in the table of the search command, otherwise they are serialized to JSON.
+        The values of arrays are joined. """
+    cell = value
+
+    if value is None:
+        cell = ""
+    elif isinstance(value, bool):
+        cell = "true" if value else "false"
+    elif isinstance(value, dict):
+        if isinstance(value.get("name"), str):
+            cell = value["name"]
+        else:
+            cell = json.dumps(value, ensure_ascii=False)
+    elif isinstance(value, list):
+        cell = LIST_SEPARATOR.join(_to_cell(element) for element in value
+                                   if element is not None)
+
+    return cell
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,208 @@
+""" The manifest of an incremental directory export. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import hashlib
+import os
+import threading
+
+from pyJiraCli.json_serializer import JsonSerializer
+
+################################################################################
+# Variables
+################################################################################
+
+# The manifest is stored next to the exported issues.
+MANIFEST_FILE = ".manifest.json"
+
+_ISSUES = "issues"
+_QUERIES = "queries"
+
+################################################################################
+# Classes
+################################################################################
+
+
+class ExportManifest:
+    """ The manifest of a directory export. It records for every exported issue
+        the update time and the hash of the written file content, and for every
+        query the high-water mark of the update times, so the next export only
+        searches the issues updated since then and skips unchanged files.
+        The issues can be recorded by multiple threads.
+    """
+
+    def __init__(self, out_dir: str):
+        """ Create an empty manifest for a directory.
+
+        Args:
+            out_dir (str): The output directory of the export.
+        """
+        self._file_path = os.path.join(out_dir, MANIFEST_FILE)
+        self._lock = threading.Lock()
+        self._issues = {}
+        self._queries = {}
+
+    def load(self) -> None:
+        """ Load the manifest file of the directory, if it exists.
+
+        Raises:
+            IOError: If the file cannot be read.
+            ValueError: If the file is no valid manifest.
+        """
+        if os.path.isfile(self._file_path) is False:
+            return
+
+        with open(self._file_path, 'r', encoding="UTF-8") as manifest_file:
+            manifest = JsonSerializer.loads(manifest_file.read())
+
+        if (isinstance(manifest, dict) is False) or \
+                (isinstance(manifest.get(_ISSUES), dict) is False) or \
+                (isinstance(manifest.get(_QUERIES), dict) is False):
+            raise ValueError(f"'{self._file_path}' is no valid export manifest.")
+
+        self._issues = manifest[_ISSUES]
+        self._queries = manifest[_QUERIES]
+
+    def save(self) -> None:
+        """ Write the manifest file. A temporary file replaces the old one,
+            so an interrupted export never leaves a broken manifest.
+
+        Raises:
+            IOError: If the file cannot be written.
+        """
+        temp_file_path = self._file_path + ".tmp"
+
+        with self._lock:
+            text = JsonSerializer.dumps({_QUERIES: self._queries, _ISSUES: self._issues})
+
+        with open(temp_file_path, 'w', encoding="UTF-8") as manifest_file:
+            manifest_file.write(text)
+
+        os.replace(temp_file_path, self._file_path)
+
+    def get_last_updated(self, jql: str) -> str:
+        """ Get the high-water mark of a query.
+
+        Args:
+            jql (str): The query without ORDER BY clause.
+
+        Returns:
+            str: The latest update time in UTC of the exported issues, in the
+                 STORE_DATETIME_FORMAT of the issue store, or None if never exported.
+        """
+        return self._queries.get(jql)
+
+    def set_last_updated(self, jql: str, last_updated: str) -> None:
+        """ Set the high-water mark of a query. A None value is ignored.
+
+        Args:
+            jql (str): The query without ORDER BY clause.
+            last_updated (str): The latest update time in UTC of the exported issues.
+        """
+        if last_updated is not None:
+            self._queries[jql] = max(last_updated, self._queries.get(jql, last_updated))
+
+    def is_unchanged(self, key: str, content_hash: str) -> bool:
+        """ Check whether an issue was already exported with the same content.
+
+        Args:
+            key (str): The key of the issue.
+            content_hash (str): The hash of the file content.
+
+        Returns:
+            bool: True if the recorded hash is the same, otherwise False.
+        """
+        with self._lock:
+            entry = self._issues.get(key)
+
+        return (entry is not None) and (content_hash == entry.get("sha256"))
+
+    def set_issue(self, key: str, updated: str, content_hash: str) -> None:
+        """ Record an exported issue.
+
+        Args:
+            key (str): The key of the issue.
+            updated (str): The update time of the issue as provided by Jira.
+            content_hash (str): The hash of the file content.
+        """
+        with self._lock:
+            self._issues[key] = {"updated": updated, "sha256": content_hash}
+
+    def merge(self, manifests: list) -> None:
+        """ Replace the records by the ones of the manifests of several shards.
+            The issues of all shards are recorded. A query keeps the earliest
+            high-water mark of the shards and only if every shard exported it,
+            so the next export searches all issues missed by any shard.
+
+        Args:
+            manifests (list[ExportManifest]): The manifests of the shards.
+        """
+        issues = {}
+        queries = None
+
+        for manifest in manifests:
+            issues.update(manifest._issues)  # pylint: disable=protected-access
+
+            # pylint: disable-next=protected-access
+            shard_queries = manifest._queries
+
+            if queries is None:
+                queries = dict(shard_queries)
+            else:
+                queries = {jql: min(last_updated, shard_queries[jql])
+                           for jql, last_updated in queries.items() if jql in shard_queries}
+
+        with self._lock:
+            self._issues = issues
+            self._queries = queries or {}
+
+################################################################################
+# Functions
+################################################################################
+
+
+def get_content_hash(content: str) -> str:
+    """ Get the hash of a file content, which is stored in the manifest.
+
+    Args:
+        content (str): The file content.
+
+    Returns:
+        str: The SHA-256 hash in hexadecimal.
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+################################################################################
+# Main
+################################################################################
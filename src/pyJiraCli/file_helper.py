@@ -33,16 +33,35 @@
 # Imports
 ################################################################################
 
+import gzip
 import os
 
+# The Zstandard compression is optional. Install it with: pip install pyJiraCli[zstd]
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from pyJiraCli.ret import Ret, Warnings
-from pyJiraCli.printer import Printer as LOG
+from pyJiraCli.printer import Printer
 
 
 ################################################################################
 # Variables
 ################################################################################
 
+LOG = Printer()
+
+JSON_EXTENSION = ".json"
+GZIP_EXTENSION = ".gz"
+ZSTD_EXTENSION = ".zst"
+
+# Files with these extensions are compressed and decompressed while streaming.
+COMPRESSED_EXTENSIONS = [GZIP_EXTENSION, ZSTD_EXTENSION]
+
+# The default level of the gzip tool. The maximum level 9 is much slower for little gain.
+GZIP_COMPRESS_LEVEL = 6
+
 
 ################################################################################
 # Classes
@@ -67,6 +86,8 @@ class FileHelper:
             If the extension is .json, it returns file_arg as is.
             If none of the conditions are met, it returns an error code indicating
             an invalid file path.
+        A compression extension (.gz or .zst) after the .json extension is kept,
+        e.g. issues.json.gz.
 
         Args:
             default_name (str): The default name of the file.
@@ -84,20 +105,44 @@ class FileHelper:
         # Check if the file extension of file_arg is correct; otherwise, correct it.
 
         first, ext = os.path.splitext(file_arg)
+        compression_ext = ""
+
+        if ext in COMPRESSED_EXTENSIONS:
+            compression_ext = ext
+            first, ext = os.path.splitext(first)
 
         if ext is None:
             return Ret.CODE.RET_OK, file_arg + '.json'
 
         if ext != '.json':
             LOG.print_info(Warnings.MSG.get(Warnings.CODE.WARNING_UNKNOWN_FILE_EXTENSION))
-            return Ret.CODE.RET_OK, first + '.json'
+            return Ret.CODE.RET_OK, first + '.json' + compression_ext
 
         return Ret.CODE.RET_OK, file_arg
 
+    @staticmethod
+    def is_json_file(file_path: str) -> bool:
+        """ Check whether the file is a JSON file, which may be compressed.
+
+        Args:
+            file_path (str): The path to the file.
+
+        Returns:
+            bool: True if the extension is .json, .json.gz or .json.zst, otherwise False.
+        """
+        first, ext = os.path.splitext(file_path)
+
+        if ext in COMPRESSED_EXTENSIONS:
+            ext = os.path.splitext(first)[-1]
+
+        return JSON_EXTENSION == ext
+
     @staticmethod
     # pylint: disable=R1732
     def open_file(file_path: str, mode: str) -> any:
         """ Opens a file (encoding="UTF-8") in the given mode.
+            Files ending with .gz or .zst are compressed while writing
+            and decompressed while reading.
 
         Args:
             file_path (str): The path to the file to open.
@@ -111,8 +156,19 @@ class FileHelper:
             IOError: If the file cannot be accessed.
             IOError: If the file cannot be opened.
         """
+        compression_ext = os.path.splitext(file_path)[-1]
+
+        if (ZSTD_EXTENSION == compression_ext) and (zstandard is None):
+            raise IOError(f"Opening '{file_path}' requires the zstandard package.")
+
         try:
-            file = open(file_path, mode, encoding="UTF-8")
+            if GZIP_EXTENSION == compression_ext:
+                file = gzip.open(file_path, mode + "t",
+                                 compresslevel=GZIP_COMPRESS_LEVEL, encoding="UTF-8")
+            elif ZSTD_EXTENSION == compression_ext:
+                file = zstandard.open(file_path, mode + "t", encoding="UTF-8")
+            else:
+                file = open(file_path, mode, encoding="UTF-8")
             return file
 
         except FileNotFoundError as exc:
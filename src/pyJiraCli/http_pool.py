@@ -0,0 +1,163 @@
+""" HTTP connection pooling with keep-alive reuse statistics. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import threading
+
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+################################################################################
+# Variables
+################################################################################
+
+# Default number of connections kept alive per host, same as in requests.
+DEFAULT_POOL_SIZE = 10
+
+# Number of different hosts for which a connection pool is cached.
+DEFAULT_POOL_CONNECTIONS = 10
+
+################################################################################
+# Classes
+################################################################################
+
+
+class ConnectionStats:
+    """ Counts the HTTP requests and the newly opened connections of all
+        sessions using the PooledHTTPAdapter.
+        A request which didn't open a new connection reused a pooled one.
+    """
+    _lock = threading.Lock()
+    _new_connections = 0
+    _requests = 0
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def add_new_connection(cls) -> None:
+        """ Count a newly opened connection. """
+        with cls._lock:
+            cls._new_connections += 1
+
+    @classmethod
+    def add_request(cls) -> None:
+        """ Count a request sent through a connection pool. """
+        with cls._lock:
+            cls._requests += 1
+
+    @classmethod
+    def get(cls) -> dict:
+        """ Get the current connection statistics.
+
+        Returns:
+            dict: The number of requests, new connections and reused connections.
+        """
+        with cls._lock:
+            return {
+                "requests": cls._requests,
+                "new_connections": cls._new_connections,
+                "reused_connections": max(0, cls._requests - cls._new_connections)
+            }
+
+    @classmethod
+    def reset(cls) -> None:
+        """ Reset all counters to zero. """
+        with cls._lock:
+            cls._new_connections = 0
+            cls._requests = 0
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    """ HTTP connection pool which counts every newly opened connection. """
+
+    def _new_conn(self):
+        ConnectionStats.add_new_connection()
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    """ HTTPS connection pool which counts every newly opened connection
+        and therefore every TLS handshake.
+    """
+
+    def _new_conn(self):
+        ConnectionStats.add_new_connection()
+        return super()._new_conn()
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """ HTTP adapter with a configurable connection pool size,
+        which counts new and reused connections in the ConnectionStats.
+
+    Args:
+        pool_size (int): The maximum number of connections kept alive per host.
+        pool_block (bool): Wait for a free connection instead of opening
+                           a connection which is discarded afterwards.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, pool_block: bool = False):
+        super().__init__(pool_connections=DEFAULT_POOL_CONNECTIONS,
+                         pool_maxsize=pool_size,
+                         pool_block=pool_block,
+                         max_retries=0)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool
+        }
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        ConnectionStats.add_request()
+        return super().send(request, **kwargs)
+
+################################################################################
+# Functions
+################################################################################
+
+
+def get_pool_size(jobs: int) -> int:
+    """ Get the connection pool size required for the given number of
+        concurrent jobs. The pool never gets smaller than the requests default.
+
+    Args:
+        jobs (int): The number of concurrent jobs using the same session.
+
+    Returns:
+        int: The number of connections which shall be kept alive per host.
+    """
+    return max(DEFAULT_POOL_SIZE, jobs)
@@ -0,0 +1,802 @@
+"""Local SQLite mirror of the Jira issues, which is synchronized incrementally."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import datetime
+import re
+import sqlite3
+import zoneinfo
+
+from pyJiraCli.jql import parse, JqlSyntaxError, EMPTY, NODE_AND, NODE_OR, NODE_NOT
+from pyJiraCli.json_serializer import JsonSerializer
+
+################################################################################
+# Variables
+################################################################################
+
+DEFAULT_DB_FILE = "issues.sqlite"
+
+JIRA_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+# The timestamps are stored in UTC in this format, which sorts like the time.
+STORE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# The names of the metadata stored with the issues.
+META_FIELDS = "fields"
+META_TIME_ZONE = "timeZone"
+
+# The attribute of the common object fields, which is indexed for the offline search.
+INDEXED_FIELDS = {
+    "status": "name",
+    "assignee": "name",
+    "reporter": "name",
+    "issuetype": "name",
+    "priority": "name"
+}
+
+# The attribute of the object fields compared in JQL by their schema type.
+_OBJECT_ATTRIBUTES = {
+    "user": "name",
+    "option": "value",
+    "status": "name",
+    "priority": "name",
+    "issuetype": "name",
+    "resolution": "name",
+    "securitylevel": "name",
+    "version": "name",
+    "component": "name"
+}
+
+# The schema types of the system fields, if the mirror has no field catalogue.
+_SYSTEM_FIELD_TYPES = {
+    "summary": "string",
+    "description": "string",
+    "environment": "string",
+    "assignee": "user",
+    "reporter": "user",
+    "creator": "user",
+    "status": "status",
+    "priority": "priority",
+    "issuetype": "issuetype",
+    "resolution": "resolution",
+    "created": "datetime",
+    "updated": "datetime",
+    "resolutiondate": "datetime",
+    "duedate": "date",
+    "labels": "array",
+    "components": "array",
+    "fixVersions": "array",
+    "versions": "array"
+}
+
+# The formats of the dates in JQL, which are interpreted in the time zone of the user.
+_JQL_DATE_FORMATS = ["%Y/%m/%d %H:%M", "%Y-%m-%d %H:%M", "%Y/%m/%d", "%Y-%m-%d"]
+
+# A relative date in JQL, e.g. -7d for seven days ago.
+_RELATIVE_DATE_PATTERN = re.compile(r"^([+-]?)(\d+)([wdhm])$")
+
+_RELATIVE_DATE_UNITS = {"w": "weeks", "d": "days", "h": "hours", "m": "minutes"}
+
+_COMPARISONS = ["=", "!=", "<", "<=", ">", ">="]
+
+# The full-text index of the summary, the description and the comments.
+# Its rows have the rowid of the issue. Matches in the summary rank higher.
+_TEXT_INDEX_SCHEMA = "CREATE VIRTUAL TABLE IF NOT EXISTS issues_text USING fts5 (" \
+    "summary, description, comments, tokenize = 'unicode61 remove_diacritics 2')"
+_TEXT_INDEX_RANK = "bm25(issues_text, 5.0, 1.0, 1.0)"
+
+_SIMPLE_PATH_PATTERN = re.compile(r"^\w+$")
+
+_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS issues (
+        key TEXT PRIMARY KEY,
+        id TEXT,
+        project TEXT,
+        created TEXT,
+        updated TEXT,
+        data TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS issues_updated ON issues (updated)",
+    "CREATE INDEX IF NOT EXISTS issues_created ON issues (created)",
+    "CREATE INDEX IF NOT EXISTS issues_project ON issues (project COLLATE NOCASE)",
+    """CREATE TABLE IF NOT EXISTS syncs (
+        jql TEXT PRIMARY KEY,
+        last_updated TEXT,
+        synced_at TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS meta (
+        name TEXT PRIMARY KEY,
+        value TEXT
+    )"""
+]
+
+################################################################################
+# Classes
+################################################################################
+
+
+class IssueStore:
+    """ Local mirror of Jira issues in a SQLite database.
+        Every issue is stored once with its raw data as JSON, independent of the
+        queries it was synchronized with. Per query the latest update time of
+        the synchronized issues is tracked as high-water mark.
+    """
+
+    def __init__(self, file_path: str):
+        """ Open the database and create the tables if required.
+
+        Args:
+            file_path (str): The path to the SQLite database file.
+
+        Raises:
+            sqlite3.Error: The database cannot be opened.
+        """
+        self._connection = sqlite3.connect(file_path)
+        self._translator = None
+        self._has_text_index = False
+
+        try:
+            # Readers are not blocked by a running synchronization.
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA synchronous = NORMAL")
+
+            with self._connection:
+                for statement in _SCHEMA:
+                    self._connection.execute(statement)
+
+                # The expressions must match the ones of the queries to use the indexes.
+                for field_id, attribute in INDEXED_FIELDS.items():
+                    self._connection.execute(
+                        f"CREATE INDEX IF NOT EXISTS issues_{field_id} ON issues "
+                        f"({_get_value_sql(field_id, attribute)} COLLATE NOCASE)")
+
+            self._has_text_index = self._connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'issues_text'").fetchone() is not None
+
+        except sqlite3.Error:
+            self._connection.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """ Close the database. """
+        self._connection.close()
+
+    def get_last_updated(self, jql: str) -> str:
+        """ Get the high-water mark of a query.
+
+        Args:
+            jql (str): The query.
+
+        Returns:
+            str: The latest update time in UTC of the issues synchronized with the
+                 query, in the STORE_DATETIME_FORMAT, or None if never synchronized.
+        """
+        row = self._connection.execute("SELECT last_updated FROM syncs WHERE jql = ?",
+                                       (jql,)).fetchone()
+
+        return None if row is None else row[0]
+
+    def upsert_issues(self, issues: list[dict]) -> None:
+        """ Insert new or replace changed issues in one transaction.
+            The text index is updated, if enabled.
+
+        Args:
+            issues (list[dict]): The raw data of the issues.
+        """
+        rows = [_get_row(issue) for issue in issues]
+
+        with self._connection:
+            # A replaced issue gets a new rowid, so its old text is removed first.
+            if self._has_text_index:
+                self._connection.executemany(
+                    "DELETE FROM issues_text WHERE rowid = "
+                    "(SELECT rowid FROM issues WHERE key = ?)", [(row[0],) for row in rows])
+
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO issues (key, id, project, created, updated, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+            if self._has_text_index:
+                self._connection.executemany(
+                    "INSERT INTO issues_text (rowid, summary, description, comments) "
+                    "SELECT rowid, ?, ?, ? FROM issues WHERE key = ?",
+                    [_get_text_row(issue) + (issue["key"],) for issue in issues])
+
+    def set_synced(self, jql: str, last_updated: str) -> None:
+        """ Record the time of the completed synchronization of a query
+            and advance its high-water mark.
+
+        Args:
+            jql (str): The query.
+            last_updated (str): The new high-water mark in UTC, in the STORE_DATETIME_FORMAT,
+                                or None to keep the current one.
+        """
+        synced_at = datetime.datetime.now(datetime.timezone.utc).strftime(STORE_DATETIME_FORMAT)
+
+        with self._connection:
+            self._connection.execute("INSERT OR IGNORE INTO syncs (jql) VALUES (?)", (jql,))
+            self._connection.execute(
+                "UPDATE syncs SET synced_at = ?, "
+                "last_updated = MAX(COALESCE(last_updated, ''), COALESCE(?, '')) "
+                "WHERE jql = ?", (synced_at, last_updated, jql))
+
+    def get_issue_count(self) -> int:
+        """ Get the number of stored issues.
+
+        Returns:
+            int: The number of issues.
+        """
+        return self._connection.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+
+    def has_text_index(self) -> bool:
+        """ Check whether the full-text index is enabled.
+
+        Returns:
+            bool: True if the mirror has a full-text index, otherwise False.
+        """
+        return self._has_text_index
+
+    def enable_text_index(self) -> None:
+        """ Create the full-text index of the summaries, descriptions and comments
+            and add the stored issues. Later upserts keep it up to date.
+
+        Raises:
+            sqlite3.Error: The index cannot be created, e.g. SQLite has no FTS5.
+        """
+        if self._has_text_index:
+            return
+
+        with self._connection:
+            self._connection.execute(_TEXT_INDEX_SCHEMA)
+
+            for rowid, data in self._connection.execute("SELECT rowid, data FROM issues"):
+                self._connection.execute(
+                    "INSERT INTO issues_text (rowid, summary, description, comments) "
+                    "VALUES (?, ?, ?, ?)", (rowid,) + _get_text_row(JsonSerializer.loads(data)))
+
+        self._has_text_index = True
+
+    def set_meta(self, name: str, value: any) -> None:
+        """ Store metadata of the mirror, e.g. the field catalogue of the server.
+
+        Args:
+            name (str): The name of the metadata, e.g. META_FIELDS.
+            value (any): The value, which must be serializable to JSON.
+        """
+        with self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+                                     (name, JsonSerializer.dumps(value, compact=True)))
+
+        self._translator = None
+
+    def get_meta(self, name: str, default: any = None) -> any:
+        """ Get metadata of the mirror.
+
+        Args:
+            name (str): The name of the metadata, e.g. META_FIELDS.
+            default (any): The value if the metadata is not stored.
+
+        Returns:
+            any: The value of the metadata or the default.
+        """
+        row = self._connection.execute("SELECT value FROM meta WHERE name = ?",
+                                       (name,)).fetchone()
+
+        return default if row is None else JsonSerializer.loads(row[0])
+
+    def query(self, jql: str, max_results: int = 0, text: str = None):
+        """ Search the stored issues with a query of the JQL subset supported by
+            the jql module. The fields are resolved with the field catalogue and
+            the dates are interpreted in the time zone of the user stored at the
+            synchronization.
+
+        Args:
+            jql (str): The query.
+            max_results (int): The maximum number of issues. 0 or None for all.
+            text (str): Terms, which must all occur in the summary, the description or
+                        the comments, or None. Requires the full-text index. The issues
+                        are ranked by relevance, unless the query has an ORDER BY.
+
+        Raises:
+            JqlSyntaxError: The query is invalid or not supported.
+
+        Yields:
+            dict: The raw data of every found issue.
+        """
+        condition, order_by = parse(jql)
+
+        if self._translator is None:
+            self._translator = _SqlTranslator(self.get_meta(META_FIELDS, []),
+                                              self.get_meta(META_TIME_ZONE))
+
+        where, params = self._translator.get_where(condition)
+        tables = "issues"
+
+        if text is not None:
+            if not self._has_text_index:
+                raise JqlSyntaxError("The mirror has no text index. "
+                                     "Create it with 'mirror sync --text-index'.")
+
+            tables = "issues JOIN issues_text ON issues_text.rowid = issues.rowid"
+            where = f"issues_text MATCH ? AND {where}"
+            params.insert(0, _get_text_query(text))
+
+        order = self._translator.get_order_by(order_by)
+
+        if (text is not None) and not order_by:
+            order = _TEXT_INDEX_RANK
+
+        sql = f"SELECT data FROM {tables} WHERE {where} ORDER BY {order}"
+
+        if max_results:
+            sql += " LIMIT ?"
+            params.append(max_results)
+
+        for (data,) in self._connection.execute(sql, params):
+            yield JsonSerializer.loads(data)
+
+
+class _SqlTranslator:
+    """ Translates the condition tree and the ORDER BY fields of a parsed query
+        to SQL on the issues table.
+    """
+
+    def __init__(self, fields: list[dict], time_zone: str):
+        """ Index the field catalogue. JQL field names are not case sensitive.
+
+        Args:
+            fields (list[dict]): The field catalogue of the server. May be empty.
+            time_zone (str): The time zone of the user or None for UTC.
+        """
+        self._has_catalogue = 0 < len(fields)
+        self._field_ids = {}
+        self._field_types = {}
+
+        # Like the server, the names in JQL win over the display names.
+        for field in fields:
+            self._field_types.setdefault(field["id"], field.get("schema", {}).get("type"))
+
+            for name in [field["id"], field["name"]] + field.get("clauseNames", []):
+                self._field_ids[name.lower()] = field["id"]
+
+        try:
+            self._time_zone = zoneinfo.ZoneInfo(time_zone) if time_zone else \
+                datetime.timezone.utc
+        except (ValueError, zoneinfo.ZoneInfoNotFoundError):
+            self._time_zone = datetime.timezone.utc
+
+    def get_where(self, node: any) -> tuple[str, list]:
+        """ Get the WHERE condition of a condition tree.
+
+        Args:
+            node (any): The condition tree or None for all issues.
+
+        Returns:
+            tuple[str, list]: The condition and its parameters.
+        """
+        if node is None:
+            return "1", []
+
+        if node[0] in (NODE_AND, NODE_OR):
+            left, left_params = self.get_where(node[1])
+            right, right_params = self.get_where(node[2])
+            return f"({left} {node[0].upper()} {right})", left_params + right_params
+
+        if NODE_NOT == node[0]:
+            inner, params = self.get_where(node[1])
+            return f"(NOT {inner})", params
+
+        return self._get_clause(node[1], node[2], node[3])
+
+    def get_order_by(self, order_by: list[tuple[str, bool]]) -> str:
+        """ Get the ORDER BY terms. The issues are ordered by key by default.
+
+        Args:
+            order_by (list[tuple[str, bool]]): The fields and the descending flags.
+
+        Returns:
+            str: The ORDER BY terms.
+        """
+        terms = []
+
+        for field, descending in order_by or [("key", False)]:
+            direction = "DESC" if descending else "ASC"
+            field_id, field_type = self._resolve(field)
+
+            if "key" == field_id:
+                terms.append(f"project {direction}, "
+                             f"CAST(substr(key, length(project) + 2) AS INTEGER) {direction}")
+            else:
+                sql, kind = _get_field_sql(field_id, field_type)
+                collation = " COLLATE NOCASE" if "text" == kind else ""
+                terms.append(f"{sql}{collation} {direction}")
+
+        return ", ".join(terms)
+
+    def _resolve(self, field: str) -> tuple[str, str]:
+        """ Get the ID and the schema type of a field by its name in JQL. """
+        name = field.lower()
+
+        if name in ("key", "issuekey", "id", "text", "project"):
+            return {"issuekey": "key", "id": "key"}.get(name, name), None
+
+        if name in self._field_ids:
+            field_id = self._field_ids[name]
+            return field_id, self._field_types.get(field_id)
+
+        for field_id, field_type in _SYSTEM_FIELD_TYPES.items():
+            if name == field_id.lower() or ("type" == name and "issuetype" == field_id):
+                return field_id, field_type
+
+        if self._has_catalogue:
+            raise JqlSyntaxError(f"The field '{field}' does not exist in the mirror.")
+
+        return field, None
+
+    def _get_clause(self, field: str, operator: str, value: any) -> tuple[str, list]:
+        """ Get the condition of a clause. """
+        field_id, field_type = self._resolve(field)
+
+        # The key and the text are no fields of the issue data.
+        special_clauses = {"key": _get_key_clause, "text": _get_text_clause}
+
+        if field_id in special_clauses:
+            return special_clauses[field_id](operator, value)
+
+        sql, kind = _get_field_sql(field_id, field_type)
+
+        if (EMPTY is value) or (operator in ("is", "is not")):
+            return _get_empty_clause(sql, kind, operator in ("!=", "is not"))
+
+        if "array" == kind:
+            return _get_array_clause(sql, operator, value)
+
+        if operator in ("~", "!~"):
+            if "text" != kind:
+                raise JqlSyntaxError(f"The field '{field}' does not support the operator "
+                                     f"'{operator}'.")
+
+            negation = "NOT " if "!~" == operator else ""
+            return f"{sql} {negation}LIKE ? ESCAPE '\\'", [_get_like_pattern(value)]
+
+        values = value if isinstance(value, list) else [value]
+        params = [self._get_param(kind, field, element) for element in values]
+        collation = " COLLATE NOCASE" if "text" == kind else ""
+
+        if operator in ("in", "not in"):
+            placeholders = ", ".join("?" * len(params))
+            return f"{sql}{collation} {operator.upper()} ({placeholders})", params
+
+        return f"{sql}{collation} {operator} ?", params
+
+    def _get_param(self, kind: str, field: str, value: str) -> any:
+        """ Convert a JQL value to the parameter compared with the field. """
+        if "number" == kind:
+            try:
+                return float(value)
+            except ValueError as e:
+                raise JqlSyntaxError(f"The value '{value}' of the field '{field}' "
+                                     "is no number.") from e
+
+        if kind in ("datetime", "date"):
+            timestamp = self._to_datetime(value)
+
+            if timestamp is None:
+                raise JqlSyntaxError(f"The value '{value}' of the field '{field}' is no date.")
+
+            if "date" == kind:
+                return timestamp.astimezone(self._time_zone).strftime("%Y-%m-%d")
+
+            return timestamp.astimezone(datetime.timezone.utc).strftime(STORE_DATETIME_FORMAT)
+
+        return value
+
+    def _to_datetime(self, value: str) -> datetime.datetime:
+        """ Convert an absolute or relative JQL date to a time, None if invalid. """
+        match = _RELATIVE_DATE_PATTERN.match(value.strip())
+
+        if match is not None:
+            delta = datetime.timedelta(**{_RELATIVE_DATE_UNITS[match.group(3)]:
+                                          int(match.group(2))})
+            now = datetime.datetime.now(datetime.timezone.utc)
+
+            return now - delta if "-" == match.group(1) else now + delta
+
+        for date_format in _JQL_DATE_FORMATS:
+            try:
+                return datetime.datetime.strptime(value.strip(), date_format).replace(
+                    tzinfo=self._time_zone)
+            except ValueError:
+                pass
+
+        return None
+
+################################################################################
+# Functions
+################################################################################
+
+
+def to_store_datetime(value: str) -> str:
+    """ Convert a Jira timestamp to UTC in the STORE_DATETIME_FORMAT.
+
+    Args:
+        value (str): The Jira timestamp, e.g. 2024-01-01T10:00:00.000+0100.
+
+    Returns:
+        str: The timestamp in UTC, e.g. 2024-01-01 09:00:00, or None if invalid.
+    """
+    timestamp = None
+
+    if isinstance(value, str):
+        try:
+            timestamp = datetime.datetime.strptime(value, JIRA_DATETIME_FORMAT).astimezone(
+                datetime.timezone.utc).strftime(STORE_DATETIME_FORMAT)
+        except ValueError:
+            pass
+
+    return timestamp
+
+
+def from_store_datetime(value: str) -> datetime.datetime:
+    """ Convert a timestamp in the STORE_DATETIME_FORMAT to a time in UTC.
+
+    Args:
+        value (str): The timestamp, e.g. 2024-01-01 09:00:00.
+
+    Returns:
+        datetime.datetime: The time with the UTC time zone.
+    """
+    return datetime.datetime.strptime(value, STORE_DATETIME_FORMAT).replace(
+        tzinfo=datetime.timezone.utc)
+
+
+def _get_row(issue: dict) -> tuple:
+    """ Get the row of the issues table for the raw data of an issue. """
+    fields = issue.get("fields", {})
+    project = fields.get("project") or {}
+
+    return (issue["key"],
+            issue.get("id"),
+            project.get("key"),
+            to_store_datetime(fields.get("created")),
+            to_store_datetime(fields.get("updated")),
+            JsonSerializer.dumps(issue, compact=True))
+
+
+def _get_text_query(text: str) -> str:
+    """ Get the full-text query, which finds the issues containing all terms.
+        The terms are quoted, so characters like - or : are no FTS5 operators.
+
+    Args:
+        text (str): The terms separated by whitespace. A trailing * matches any suffix.
+
+    Raises:
+        JqlSyntaxError: There are no terms.
+
+    Returns:
+        str: The FTS5 query.
+    """
+    terms = []
+
+    for term in text.split():
+        prefix = term.endswith("*")
+        term = term.rstrip("*").replace('"', '""')
+
+        if term:
+            terms.append(f'"{term}"' + ("*" if prefix else ""))
+
+    if not terms:
+        raise JqlSyntaxError("The text to search for has no terms.")
+
+    return " ".join(terms)
+
+
+def _get_text_row(issue: dict) -> tuple[str, str, str]:
+    """ Get the summary, the description and the comments of an issue as plain text. """
+    fields = issue.get("fields", {})
+    comments = (fields.get("comment") or {}).get("comments", [])
+
+    return (_get_plain_text(fields.get("summary")),
+            _get_plain_text(fields.get("description")),
+            "\n".join(_get_plain_text(comment.get("body")) for comment in comments))
+
+
+def _get_plain_text(value: any) -> str:
+    """ Get the text of a field, which is a string or a rich text document
+        of the Atlassian document format, which has the text in its nodes.
+    """
+    if isinstance(value, str):
+        return value
+
+    if isinstance(value, dict):
+        return " ".join(filter(None, [_get_plain_text(value.get("text"))] +
+                               [_get_plain_text(node) for node in value.get("content", [])]))
+
+    return ""
+
+
+def _get_json_path(field_id: str, attribute: str = None) -> str:
+    """ Get the JSON path of a field and optionally an attribute of its object. """
+    path = "$.fields." + (field_id if _SIMPLE_PATH_PATTERN.match(field_id) else
+                          '"' + field_id.replace('"', '\\"') + '"')
+
+    if attribute is not None:
+        path += "." + attribute
+
+    return path
+
+
+def _get_value_sql(field_id: str, attribute: str = None) -> str:
+    """ Get the SQL expression of the value of a field in the raw data of an issue. """
+    path = _get_json_path(field_id, attribute).replace("'", "''")
+
+    return f"json_extract(data, '{path}')"
+
+
+def _get_field_sql(field_id: str, field_type: str) -> tuple[str, str]:
+    """ Get the SQL expression of a field and the kind of its values, which is one
+        of text, number, datetime, date or array. The expression of an array field
+        is its JSON path.
+    """
+    value = _get_value_sql(field_id)
+    kind = "text"
+
+    if "project" == field_id:
+        sql = "project"
+    elif field_id in ("created", "updated"):
+        sql, kind = field_id, "datetime"
+    elif "array" == field_type:
+        sql, kind = _get_json_path(field_id).replace("'", "''"), "array"
+    elif field_type in ("number", "date"):
+        sql, kind = value, field_type
+    elif "datetime" == field_type:
+        # The time of Jira, e.g. 2024-01-01T10:00:00.000+0100, converted to UTC.
+        sql = f"datetime(substr({value}, 1, 19) || substr({value}, 24, 3) || ':' || " \
+              f"substr({value}, 27, 2))"
+        kind = "datetime"
+    elif field_type in _OBJECT_ATTRIBUTES:
+        sql = _get_value_sql(field_id, _OBJECT_ATTRIBUTES[field_type])
+    elif "string" == field_type:
+        sql = value
+    else:
+        # Unknown types are compared by the name, value or key of objects.
+        path = _get_json_path(field_id).replace("'", "''")
+        sql = f"(CASE json_type(data, '{path}') WHEN 'object' THEN " \
+              f"COALESCE({_get_value_sql(field_id, 'name')}, " \
+              f"{_get_value_sql(field_id, 'value')}, {_get_value_sql(field_id, 'key')}) " \
+              f"ELSE {value} END)"
+
+    return sql, kind
+
+
+def _get_key_clause(operator: str, value: any) -> tuple[str, list]:
+    """ Get the condition of a clause on the issue key. Numbers are issue IDs. """
+    values = value if isinstance(value, list) else [value]
+
+    if (EMPTY in values) or (operator not in _COMPARISONS + ["in", "not in"]):
+        raise JqlSyntaxError(f"The field 'key' does not support the operator '{operator}' "
+                             "with this value.")
+
+    params = [str(element).upper() for element in values]
+
+    if operator in ("in", "not in"):
+        placeholders = ", ".join("?" * len(params))
+        junction = "OR" if "in" == operator else "AND"
+        return f"(key {operator.upper()} ({placeholders}) {junction} " \
+               f"id {operator.upper()} ({placeholders}))", params + params
+
+    if params[0].isdigit():
+        return f"CAST(id AS INTEGER) {operator} ?", [int(params[0])]
+
+    if operator in ("=", "!="):
+        return f"key {operator} ?", params
+
+    # Keys are ordered by their number within the project.
+    project, _, number = params[0].rpartition("-")
+
+    if not number.isdigit():
+        raise JqlSyntaxError(f"The value '{value}' is no issue key.")
+
+    return f"(project = ? AND CAST(substr(key, length(project) + 2) AS INTEGER) {operator} ?)", \
+        [project, int(number)]
+
+
+def _get_text_clause(operator: str, value: any) -> tuple[str, list]:
+    """ Get the condition of a clause on the text, which is the summary or the description. """
+    if "~" != operator:
+        raise JqlSyntaxError("The field 'text' only supports the operator '~'.")
+
+    pattern = _get_like_pattern(value)
+
+    return f"({_get_value_sql('summary')} LIKE ? ESCAPE '\\' OR " \
+           f"{_get_value_sql('description')} LIKE ? ESCAPE '\\')", [pattern, pattern]
+
+
+def _get_empty_clause(sql: str, kind: str, negation: bool) -> tuple[str, list]:
+    """ Get the condition of a clause with EMPTY. """
+    if "array" == kind:
+        return f"COALESCE(json_array_length(data, '{sql}'), 0) {'>' if negation else '='} 0", []
+
+    return f"{sql} IS {'NOT ' if negation else ''}NULL", []
+
+
+def _get_array_clause(path: str, operator: str, value: any) -> tuple[str, list]:
+    """ Get the condition of a clause on a field with multiple values, like labels,
+        components or sprints. The elements are compared by their name, value or key.
+    """
+    element = "(CASE json_each.type WHEN 'object' THEN " \
+              "COALESCE(json_extract(json_each.value, '$.name'), " \
+              "json_extract(json_each.value, '$.value'), " \
+              "json_extract(json_each.value, '$.key')) ELSE json_each.value END)"
+    values = value if isinstance(value, list) else [value]
+
+    if operator in ("=", "!=", "in", "not in"):
+        placeholders = ", ".join("?" * len(values))
+        match = f"{element} COLLATE NOCASE IN ({placeholders})"
+        params = values
+    elif operator in ("~", "!~"):
+        match = f"{element} LIKE ? ESCAPE '\\'"
+        params = [_get_like_pattern(value)]
+    else:
+        raise JqlSyntaxError(f"The operator '{operator}' is not supported for multiple values.")
+
+    exists = f"EXISTS (SELECT 1 FROM json_each(issues.data, '{path}') WHERE {match})"
+
+    # Like Jira, the negations do not find issues without values.
+    if operator in ("!=", "not in", "!~"):
+        return f"(NOT {exists} AND COALESCE(json_array_length(data, '{path}'), 0) > 0)", params
+
+    return exists, params
+
+
+def _get_like_pattern(value: any) -> str:
+    """ Get the LIKE pattern, which finds a text containing the value.
+        The JQL wildcards * and ? match any characters and a single character.
+    """
+    if not isinstance(value, str):
+        raise JqlSyntaxError("The operator '~' requires a single text.")
+
+    pattern = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    return "%" + pattern.replace("*", "%").replace("?", "_") + "%"
+
+################################################################################
+# Main
+################################################################################
@@ -45,8 +45,12 @@ from urllib3 import exceptions as urlex
 
 from pyProfileMgr.profile_mgr import ProfileMgr
 
+from pyJiraCli.http_pool import PooledHTTPAdapter, get_pool_size
+from pyJiraCli.jql import get_keyset_jql, strip_order_by
 from pyJiraCli.printer import Printer, PrintType
 from pyJiraCli.ret import Ret, Warnings
+from pyJiraCli.server_info_cache import ServerInfoCache
+from pyJiraCli.timings import Timings
 
 # pylint: disable=E0401
 if os.name == 'nt':
@@ -62,21 +66,47 @@ else:
 
 JIRA_SERVER_MAX_RETRIES = 0  # Number of retries for server connection
 
+# Number of issues requested per page by the raw search.
+# The server may return less, depending on its configured limit.
+SEARCH_PAGE_SIZE = 1000
+
 ################################################################################
 # Classes
 ################################################################################
 
 
-class Server:
+class Server:  # pylint: disable=too-many-instance-attributes
     """This class handles connection to the Jira server.
 
     Args:
         timeout (float): The timeout for the requests in seconds. Default is 10 seconds.
         Shorter timeout can result in failed requests,
         depending on the speed of the server and the size of the request.
+        jobs (int): The number of concurrent jobs which share this server connection.
+        Used to size the connection pool. Default is 1.
+        pool_size (int): The number of connections kept alive per host.
+        Default is derived from the number of jobs, but at least 10.
+        keep_alive (bool): Reuse connections between requests. Default is True.
+        keyset (bool): Page the raw search by the issue ID instead of the offset.
+        Default is False.
     """
 
-    def __init__(self, timeout: float = 10):
+    # Hooks which are called with every response received by any server instance.
+    _response_hooks = []
+
+    # Transport adapter which replaces the pooled HTTP adapter, e.g. to replay responses.
+    _transport_adapter = None
+
+    # Cache of the server info, which provides the deployment type and the version.
+    _server_info_cache = ServerInfoCache()
+
+    def __init__(self,
+                 timeout: float = 10,
+                 jobs: int = 1,
+                 pool_size: Optional[int] = None,
+                 keep_alive: bool = True,
+                 keyset: bool = False):
+        # pylint: disable=too-many-arguments
         self._jira_obj = None
         self._search_result = None
         self._cert_path = None
@@ -84,9 +114,52 @@ class Server:
         self._user = None
         self._timeout = timeout
         self._all_fields = None
+        self._field_names = None
+        self._field_ids = None
+        self._field_clauses = None
+        self._field_types = None
+        self._jobs = max(1, jobs)
+        self._pool_size = pool_size if pool_size is not None else get_pool_size(self._jobs)
+        self._keep_alive = keep_alive
+        self._keyset = keyset
 
         urllib3.disable_warnings()
 
+    @classmethod
+    def add_response_hook(cls, hook) -> None:
+        """ Add a hook which is called with every HTTP response received
+            by the sessions of all server instances logged in afterwards.
+            The hook has the signature of a requests response hook.
+
+        Args:
+            hook (callable): The hook function, called with the response
+                             and the arguments the request was sent with.
+        """
+        if hook not in cls._response_hooks:
+            cls._response_hooks.append(hook)
+
+    @classmethod
+    def set_transport_adapter(cls, adapter) -> None:
+        """ Set a transport adapter which is used by the sessions of all server
+            instances logged in afterwards instead of the pooled HTTP adapter.
+
+        Args:
+            adapter (requests.adapters.BaseAdapter): The transport adapter or None
+                                                     to use the pooled HTTP adapter.
+        """
+        cls._transport_adapter = adapter
+
+    @classmethod
+    def set_server_info_cache(cls, cache: Optional[ServerInfoCache]) -> None:
+        """ Set the cache of the server info used by all server instances
+            logged in afterwards.
+
+        Args:
+            cache (ServerInfoCache): The cache or None to request the server info
+                                     with every login.
+        """
+        cls._server_info_cache = cache
+
     # pylint: disable=R0913,R0917
     def login(self,
               arg_profile_name: Optional[str],
@@ -110,22 +183,23 @@ class Server:
         ret_status = Ret.CODE.RET_OK
         _printer = Printer()
 
-        # Login using settings from profile
-        if arg_profile_name is not None:
-            ret_status = self._login_using_profile(arg_profile_name)
+        with Timings.phase("login"):
+            # Login using settings from profile
+            if arg_profile_name is not None:
+                ret_status = self._login_using_profile(arg_profile_name)
 
-        # Else login with command line parameters
-        elif arg_server_url is not None:
+            # Else login with command line parameters
+            elif arg_server_url is not None:
 
-            ret_status = self._login_using_direct_args(
-                arg_server_url, arg_token, arg_username, arg_password)
+                ret_status = self._login_using_direct_args(
+                    arg_server_url, arg_token, arg_username, arg_password)
 
-        else:
-            # Neither profile nor command line information given
-            ret_status = Ret.CODE.RET_ERROR
-            print("Missing server URL to connect to.")
-            _printer.print_error(
-                PrintType.ERROR, Ret.CODE.RET_ERROR_JIRA_LOGIN)
+            else:
+                # Neither profile nor command line information given
+                ret_status = Ret.CODE.RET_ERROR
+                print("Missing server URL to connect to.")
+                _printer.print_error(
+                    PrintType.ERROR, Ret.CODE.RET_ERROR_JIRA_LOGIN)
 
         if Ret.CODE.RET_OK == ret_status:
             if self._user is not None:
@@ -144,7 +218,19 @@ class Server:
         """
         return self._jira_obj
 
-    def search(self, search_str: str, max_results: int, fields: list[str]) -> Ret.CODE:
+    def get_jobs(self) -> int:
+        """ Return the number of concurrent jobs the connection pool is sized for.
+
+        Returns:
+           int: The number of concurrent jobs.
+        """
+        return self._jobs
+
+    def search(self,
+               search_str: str,
+               max_results: int,
+               fields: list[str],
+               raw: bool = False) -> Ret.CODE:
         """ Search for jira issues with a search string.
             The maximum of found issues can be set.
 
@@ -152,6 +238,8 @@ class Server:
             search_str (str): The string by which to search issues for.
             max_results (int): The maximum number of search results.
             fields (list[str]): The fields to search for in the work items.
+            raw (bool): Get the issues as plain dicts, like the raw attribute of the
+                        issue resources, but without creating the resources.
 
         Returns:
             Ret.CODE:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
@@ -164,9 +252,14 @@ class Server:
 
         else:
             try:
-                self._search_result = self._jira_obj.search_issues(search_str,
-                                                                   maxResults=max_results,
-                                                                   fields=fields)
+                if raw is True:
+                    self._search_result = list(self.iter_search_raw(search_str,
+                                                                    max_results,
+                                                                    fields))
+                else:
+                    self._search_result = self._jira_obj.search_issues(search_str,
+                                                                       maxResults=max_results,
+                                                                       fields=fields)
 
             except exceptions.JIRAError as e:
                 print(e.text)
@@ -174,6 +267,208 @@ class Server:
 
         return ret_status
 
+    def iter_search_raw(self,
+                        search_str: str,
+                        max_results: int,
+                        fields: list[str],
+                        validate_query: bool = True):
+        """ Search for jira issues with a search string and yield them page by page
+            as plain dicts. The search endpoint is requested directly, the issues are
+            not wrapped into resources.
+            With keyset pagination, the issues are ordered by their ID and every page
+            continues after the last ID. The ORDER BY clause of the query is replaced then.
+            Jira Cloud is always paged with the token of the next page.
+
+        Args:
+            search_str (str): The string by which to search issues for.
+            max_results (int): The maximum number of search results. 0 or None for all.
+            fields (list[str]): The fields to search for in the work items.
+                                Empty for the default fields of the server.
+            validate_query (bool): Whether the server rejects a query with unknown values,
+                                   e.g. the key of a deleted issue, instead of ignoring them.
+                                   Jira Cloud always ignores them.
+
+        Raises:
+            JIRAError: The search failed.
+
+        Yields:
+            dict: The raw data of every found issue.
+        """
+        fields, aliases = self._get_search_fields(fields)
+
+        if self.is_cloud() is True:
+            pages = self._iter_token_pages(search_str, max_results, fields)
+        else:
+            pages = self._iter_offset_pages(search_str, max_results, fields, validate_query)
+
+        for issues in pages:
+            for issue in issues:
+                # Provide the fields also by the requested names, like the resources.
+                for field_id, field_name in aliases.items():
+                    if field_id in issue.get("fields", {}):
+                        issue["fields"][field_name] = issue["fields"][field_id]
+
+                yield issue
+
+    def _iter_offset_pages(self,
+                           search_str: str,
+                           max_results: int,
+                           fields: list[str],
+                           validate_query: bool):
+        """ Request the pages of the search endpoint by their offset or,
+            with keyset pagination, after the last ID of the previous page.
+
+        Args:
+            search_str (str): The string by which to search issues for.
+            max_results (int): The maximum number of search results. 0 or None for all.
+            fields (list[str]): The field IDs. Empty for the default fields of the server.
+            validate_query (bool): Whether the server rejects a query with unknown values.
+
+        Yields:
+            list[dict]: The raw issues of every page.
+        """
+        found = 0
+        last_id = None
+
+        while (not max_results) or (found < max_results):
+            page_size = SEARCH_PAGE_SIZE
+            jql = search_str
+            start_at = found
+
+            if max_results:
+                page_size = min(page_size, max_results - found)
+
+            # The cost of a page does not grow with the offset and a changing
+            # result does not skip or repeat issues at the page boundaries.
+            if self._keyset is True:
+                jql = get_keyset_jql(search_str, last_id)
+                start_at = 0
+
+            page = self._jira_obj._get_json("search", params={  # pylint: disable=protected-access
+                "jql": jql,
+                "startAt": start_at,
+                "maxResults": page_size,
+                "validateQuery": validate_query,
+                "fields": fields
+            })
+            issues = page.get("issues", [])
+
+            yield issues
+
+            found += len(issues)
+
+            if (0 == len(issues)) or (start_at + len(issues) >= page.get("total", 0)):
+                break
+
+            last_id = issues[-1]["id"]
+
+    def _iter_token_pages(self, search_str: str, max_results: int, fields: list[str]):
+        """ Request the pages of the enhanced search endpoint of Jira Cloud, where
+            every page provides the token of the next one instead of the total.
+
+        Args:
+            search_str (str): The string by which to search issues for.
+            max_results (int): The maximum number of search results. 0 or None for all.
+            fields (list[str]): The field IDs. Empty for the default fields of the server.
+
+        Yields:
+            list[dict]: The raw issues of every page.
+        """
+        found = 0
+        next_page_token = None
+
+        while (not max_results) or (found < max_results):
+            page_size = SEARCH_PAGE_SIZE
+
+            if max_results:
+                page_size = min(page_size, max_results - found)
+
+            # Without fields, the endpoint only provides the issue IDs.
+            params = {
+                "jql": search_str,
+                "maxResults": page_size,
+                "fields": fields or ["*navigable"]
+            }
+
+            if next_page_token is not None:
+                params["nextPageToken"] = next_page_token
+
+            page = self._jira_obj._get_json("search/jql",  # pylint: disable=protected-access
+                                            params=params)
+            issues = page.get("issues", [])
+
+            yield issues
+
+            found += len(issues)
+            next_page_token = page.get("nextPageToken")
+
+            if (0 == len(issues)) or (next_page_token is None):
+                break
+
+    def get_approximate_count(self, search_str: str) -> Optional[int]:
+        """ Get the number of issues found by a search string without requesting them.
+            Jira Cloud provides an approximate count, which may miss recent changes.
+
+        Args:
+            search_str (str): The string by which to search issues for.
+
+        Returns:
+            Optional[int]: The number of issues or None if the count is not available.
+        """
+        count = None
+        condition = strip_order_by(search_str)
+
+        if self._jira_obj is not None:
+            try:
+                # Older jira releases don't provide the count of Jira Cloud.
+                if (self.is_cloud() is True) and \
+                        hasattr(self._jira_obj, "approximate_issue_count"):
+                    count = self._jira_obj.approximate_issue_count(condition)
+                else:
+                    # A page without issues only provides the total.
+                    count = self._jira_obj._get_json(  # pylint: disable=protected-access
+                        "search", params={"jql": condition, "maxResults": 0}).get("total")
+
+            except exceptions.JIRAError:
+                count = None
+
+        return count
+
+    def is_cloud(self) -> bool:
+        """ Check whether the server is a Jira Cloud instance, as detected at the login.
+
+        Returns:
+            bool: True for Jira Cloud, False for Jira Server or Data Center.
+        """
+        # pylint: disable=protected-access
+        return (self._jira_obj is not None) and (self._jira_obj._is_cloud is True)
+
+    def _get_search_fields(self, fields: list[str]) -> tuple[list[str], dict]:
+        """ Translate the field names used in JQL to the field IDs,
+            like the search of the Jira handle does.
+
+        Args:
+            fields (list[str]): The requested fields.
+
+        Returns:
+            tuple[list[str], dict]: The field IDs and the requested names by field ID.
+        """
+        search_fields = []
+        aliases = {}
+
+        if fields:
+            self._load_fields()
+
+        for field in fields:
+            field_id = (self._field_clauses or {}).get(field, field)
+
+            if field_id != field:
+                aliases[field_id] = field
+
+            search_fields.append(field_id)
+
+        return search_fields, aliases
+
     def get_search_result(self) -> list:
         """ Return the results from a
             successful search.
@@ -194,21 +489,15 @@ class Server:
         """
         field_name = field_id
 
-        # Load all fields if not done yet. Prevent multiple calls to the server.
-        if self._all_fields is None and self._jira_obj is not None:
-            self._all_fields = self._jira_obj.fields()
+        self._load_fields()
 
-        if self._all_fields is not None:
-            # Search for the field ID
-            for field in self._all_fields:
-                if field['id'] == field_id:
-                    field_name = field['name']
-                    break
+        if self._field_names is not None:
+            field_name = self._field_names.get(field_id, field_id)
 
         return field_name
 
     def get_field_id(self, field_name: str) -> str:
-        """ Get the ID of a field by its name.
+        """ Get the ID of a field by its name or, if there is no such name, by its name in JQL.
 
         Args:
             field_name (str): The name of the field.
@@ -218,18 +507,186 @@ class Server:
         """
         field_id = field_name
 
+        self._load_fields()
+
+        if self._field_ids is not None:
+            field_id = self._field_ids.get(field_name,
+                                           self._field_clauses.get(field_name, field_name))
+
+        return field_id
+
+    def get_field_ids(self) -> list[str]:
+        """ Get the IDs of all fields in the order of the field catalogue.
+
+        Returns:
+            list[str]: The IDs of the fields.
+        """
+        self._load_fields()
+
+        return list(self._field_types or {})
+
+    def iter_content(self, url: str, chunk_size: int):
+        """ Download a file, e.g. an attachment, in chunks without loading it into memory.
+
+        Args:
+            url (str): The URL of the file.
+            chunk_size (int): The size of the chunks in bytes.
+
+        Yields:
+            bytes: The chunks of the file content.
+
+        Raises:
+            exceptions.JIRAError: If the server responds with an error.
+            requests.exceptions.RequestException: If the request fails.
+        """
+        # The session applies the timeout and raises a JIRAError for an error response.
+        # pylint: disable=protected-access
+        with self._jira_obj._session.get(url, stream=True) as response:
+            yield from response.iter_content(chunk_size=chunk_size)
+
+    def get_time_zone(self) -> Optional[str]:
+        """ Get the time zone of the user, which JQL dates are interpreted in.
+
+        Returns:
+            Optional[str]: The name of the time zone, e.g. Europe/Berlin, or None if
+                           the server doesn't report it, e.g. without a login.
+        """
+        try:
+            return self._jira_obj.myself()["timeZone"]
+        except (AttributeError, KeyError, TypeError, exceptions.JIRAError):
+            return None
+
+    def get_server_time(self) -> Optional[str]:
+        """ Get the current time of the server, which the update times of the issues
+            are based on. The server info is requested again, not taken from the cache.
+
+        Returns:
+            Optional[str]: The time in the format of the issue fields, e.g.
+                           2024-01-01T10:00:00.000+0100, or None if not reported.
+        """
+        try:
+            return self._jira_obj.server_info()["serverTime"]
+        except (AttributeError, KeyError, TypeError, exceptions.JIRAError):
+            return None
+
+    def get_fields(self) -> list[dict]:
+        """ Get the field catalogue of the server, as provided by the fields endpoint.
+
+        Returns:
+            list[dict]: The fields with ID, name, JQL names and schema.
+        """
+        self._load_fields()
+
+        return list(self._all_fields or [])
+
+    def get_create_field_ids(self, project_key: str, issue_type: str) -> Optional[list[str]]:
+        """ Get the fields on the create screen of an issue type in a project,
+            which are the only fields a create request may set.
+            Servers before Jira 8.4 only provide the general createmeta endpoint.
+
+        Args:
+            project_key (str): The key of the project.
+            issue_type (str): The name of the issue type.
+
+        Returns:
+            Optional[list[str]]: The field IDs or None if the server doesn't provide them,
+                                 e.g. for an unknown project or issue type.
+        """
+        try:
+            issue_types = self._get_createmeta_values(f"issue/createmeta/{project_key}/issuetypes",
+                                                      "issueTypes")
+            issue_type_id = next((element["id"] for element in issue_types
+                                  if element["name"].lower() == issue_type.lower()), None)
+
+            if issue_type_id is None:
+                return None
+
+            fields = self._get_createmeta_values(
+                f"issue/createmeta/{project_key}/issuetypes/{issue_type_id}", "fields")
+
+            return [field["fieldId"] for field in fields]
+
+        except exceptions.JIRAError:
+            pass
+
+        try:
+            meta = self._jira_obj.createmeta(projectKeys=project_key,
+                                             issuetypeNames=issue_type,
+                                             expand="projects.issuetypes.fields")
+
+            return list(meta["projects"][0]["issuetypes"][0]["fields"])
+
+        except (exceptions.JIRAError, IndexError, KeyError):
+            return None
+
+    def _get_createmeta_values(self, path: str, cloud_key: str) -> list[dict]:
+        """ Get all pages of a createmeta endpoint.
+
+        Args:
+            path (str): The path of the endpoint.
+            cloud_key (str): The key of the values in the response of Jira Cloud.
+                             Jira Server provides them as "values".
+
+        Raises:
+            JIRAError: The request failed, e.g. the endpoint is not provided.
+
+        Returns:
+            list[dict]: The values of all pages.
+        """
+        values = []
+
+        while True:
+            page = self._jira_obj._get_json(  # pylint: disable=protected-access
+                path, params={"startAt": len(values), "maxResults": SEARCH_PAGE_SIZE})
+            page_values = page.get("values", page.get(cloud_key, []))
+            values += page_values
+
+            if (0 == len(page_values)) or page.get("isLast", False) or \
+                    (len(values) >= page.get("total", len(values))):
+                return values
+
+    def get_field_type(self, field: str) -> str:
+        """ Get the schema type of a field, e.g. "string", "number" or "datetime".
+
+        Args:
+            field (str): The ID, the name in JQL or the name of the field.
+
+        Returns:
+            str: The schema type of the field or None if not found.
+        """
+        self._load_fields()
+
+        field_type = None
+
+        if self._field_types is not None:
+            field_type = self._field_types.get(field,
+                                               self._field_types.get(self.get_field_id(field)))
+
+        return field_type
+
+    def _load_fields(self) -> None:
+        """ Load all fields and index them by ID, by name and by JQL name.
+            The fields are only requested once from the server.
+        """
         # Load all fields if not done yet. Prevent multiple calls to the server.
         if self._all_fields is None and self._jira_obj is not None:
             self._all_fields = self._jira_obj.fields()
 
-        if self._all_fields is not None:
-            # Search for the field name
+        if self._all_fields is not None and self._field_names is None:
+            self._field_names = {}
+            self._field_ids = {}
+            self._field_clauses = {}
+            self._field_types = {}
+
+            # The first field wins if IDs or names are not unique.
             for field in self._all_fields:
-                if field['name'] == field_name:
-                    field_id = field['id']
-                    break
+                self._field_names.setdefault(field['id'], field['name'])
+                self._field_ids.setdefault(field['name'], field['id'])
+                self._field_types.setdefault(field['id'], field.get('schema', {}).get('type'))
 
-        return field_id
+                # The names of the field in JQL, like the Jira handle the last wins.
+                for clause_name in field.get('clauseNames', []):
+                    self._field_clauses[clause_name] = field['id']
 
     def _login_using_profile(self, profile_name: str) -> Ret.CODE:
         ''' Login to Jira server using the profile settings.'''
@@ -316,13 +773,17 @@ class Server:
                                       options={'verify': False},
                                       token_auth=token,
                                       max_retries=JIRA_SERVER_MAX_RETRIES,
-                                      timeout=self._timeout)
+                                      timeout=self._timeout,
+                                      get_server_info=False)
             else:
                 self._jira_obj = JIRA(server=self._server_url,
                                       options={'verify': self._cert_path},
                                       token_auth=token,
                                       max_retries=JIRA_SERVER_MAX_RETRIES,
-                                      timeout=self._timeout)
+                                      timeout=self._timeout,
+                                      get_server_info=False)
+
+            self._configure_session()
 
             user = self._jira_obj.current_user()
 
@@ -376,13 +837,17 @@ class Server:
                                       basic_auth=(user, pw),
                                       options={'verify': False},
                                       max_retries=JIRA_SERVER_MAX_RETRIES,
-                                      timeout=self._timeout)
+                                      timeout=self._timeout,
+                                      get_server_info=False)
             else:
                 self._jira_obj = JIRA(server=self._server_url,
                                       basic_auth=(user, pw),
                                       options={'verify': self._cert_path},
                                       max_retries=JIRA_SERVER_MAX_RETRIES,
-                                      timeout=self._timeout)
+                                      timeout=self._timeout,
+                                      get_server_info=False)
+
+            self._configure_session()
 
             user = self._jira_obj.current_user()
 
@@ -412,6 +877,44 @@ class Server:
 
         return ret_status
 
+    def _configure_session(self) -> None:
+        """ Mount the transport adapter on the session of the Jira handle and
+            request the server info through it afterwards, unless it is cached.
+            The Jira handle is created without requesting the server info,
+            so that already the first request uses the configured pool.
+        """
+        session = self._jira_obj._session  # pylint: disable=protected-access
+        adapter = self._transport_adapter
+
+        if adapter is None:
+            adapter = PooledHTTPAdapter(pool_size=self._pool_size,
+                                        pool_block=self._jobs > self._pool_size)
+
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        if self._keep_alive is False:
+            session.headers["Connection"] = "close"
+
+        session.hooks["response"].extend(self._response_hooks)
+
+        # Same as done by the JIRA constructor with get_server_info=True,
+        # but the deployment type and version are only requested once a day.
+        server_info = None
+
+        if self._server_info_cache is not None:
+            server_info = self._server_info_cache.get(self._server_url)
+
+        if server_info is None:
+            server_info = self._jira_obj.server_info()
+
+            if (self._server_info_cache is not None) and ("versionNumbers" in server_info):
+                self._server_info_cache.set(self._server_url, server_info)
+
+        # pylint: disable=protected-access
+        self._jira_obj._version = tuple(server_info["versionNumbers"])
+        self._jira_obj.deploymentType = server_info.get("deploymentType")
+
 ################################################################################
 # Functions
 ################################################################################
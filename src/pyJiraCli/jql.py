@@ -0,0 +1,427 @@
+"""Parser of the JQL subset, which can be evaluated on the local issue mirror."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import datetime
+import re
+import zoneinfo
+
+################################################################################
+# Variables
+################################################################################
+
+# The node types of the condition tree.
+NODE_AND = "and"
+NODE_OR = "or"
+NODE_NOT = "not"
+NODE_CLAUSE = "clause"
+
+# The value of the EMPTY and NULL keywords.
+EMPTY = None
+
+OPERATORS = ["=", "!=", "~", "!~", "<", "<=", ">", ">=", "in", "not in", "is", "is not"]
+
+_TOKEN_PATTERN = re.compile(
+    r'\s*(?:(?P<string>"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')'
+    r'|(?P<op>!=|>=|<=|!~|=|>|<|~|\(|\)|,)'
+    r'|(?P<word>[^\s=!<>~(),"\']+))')
+
+_ESCAPE_PATTERN = re.compile(r"\\(.)")
+
+_ORDER_BY_PATTERN = re.compile(r"\border\s+by\b", re.IGNORECASE)
+
+# The date format of JQL. Dates are interpreted in the time zone of the user.
+JQL_DATETIME_FORMAT = "%Y/%m/%d %H:%M"
+
+# If the time zone of the user is unknown, a time is moved back by the largest
+# UTC offset, so a query for the issues updated since then misses none.
+UNKNOWN_TIME_ZONE_MARGIN = datetime.timedelta(hours=14)
+
+################################################################################
+# Classes
+################################################################################
+
+
+class JqlSyntaxError(ValueError):
+    """ The query is no valid JQL or uses JQL which is not supported. """
+
+################################################################################
+# Functions
+################################################################################
+
+
+def parse(jql: str) -> tuple[any, list[tuple[str, bool]]]:
+    """ Parse a query of the supported JQL subset:
+
+        - Clauses with the operators =, !=, ~, !~, <, <=, >, >=, IN, NOT IN,
+          IS EMPTY and IS NOT EMPTY. Values are words, quoted strings or lists.
+        - AND, OR, NOT and parentheses.
+        - ORDER BY with ASC and DESC.
+
+        Functions, e.g. currentUser(), and history operators, e.g. WAS, are not supported.
+
+    Args:
+        jql (str): The query.
+
+    Raises:
+        JqlSyntaxError: The query is invalid or not supported.
+
+    Returns:
+        tuple[any, list[tuple[str, bool]]]: The condition tree or None if the query
+            has no condition, and the fields to order by with the descending flag.
+            The nodes of the tree are (NODE_AND, left, right), (NODE_OR, left, right),
+            (NODE_NOT, node) and (NODE_CLAUSE, field, operator, value). The operator
+            is lower case, the value is a string, a list of strings or EMPTY.
+    """
+    tokens = _tokenize(jql)
+    order_by = []
+    end = len(tokens)
+
+    for idx, (kind, value) in enumerate(tokens):
+        if _is_keyword(kind, value, "order"):
+            if (idx + 1 >= len(tokens)) or not _is_keyword(*tokens[idx + 1], "by"):
+                raise JqlSyntaxError("Expecting 'by' after 'order'.")
+
+            order_by = _parse_order_by(tokens[idx + 2:])
+            end = idx
+            break
+
+    condition = None
+
+    if 0 < end:
+        condition, position = _parse_or(tokens[:end], 0)
+
+        if position < end:
+            raise JqlSyntaxError(f"Unexpected '{tokens[position][1]}'.")
+
+    return condition, order_by
+
+
+def get_updated_since_jql(jql: str, since: str) -> str:
+    """ Get the query for the issues updated since a time, ordered by the update time.
+        With keyset pagination the issues are paged by their ID instead, so the
+        high-water mark is only advanced after the whole download and never beyond
+        its start time, as issues updated during the download may not be included.
+
+    Args:
+        jql (str):      The query of the user. An ORDER BY clause is replaced.
+        since (str):    The time in JQL format or None for all issues.
+
+    Returns:
+        str: The query ordered by the update time.
+    """
+    condition = strip_order_by(jql)
+
+    if since is not None:
+        condition = f'({condition}) AND updated >= "{since}"' if condition else \
+            f'updated >= "{since}"'
+
+    return f"{condition} ORDER BY updated ASC".strip()
+
+
+def get_keyset_jql(jql: str, after_id: str) -> str:
+    """ Get the query for the next page of a keyset pagination, ordered by the issue ID.
+        Every page starts after the last ID of the previous one, so issues which are
+        created, changed or deleted during the search do not shift the pages.
+
+    Args:
+        jql (str):      The query of the user. An ORDER BY clause is replaced.
+        after_id (str): The ID of the last issue of the previous page or None for the first page.
+
+    Returns:
+        str: The query ordered by the issue ID.
+    """
+    condition = strip_order_by(jql)
+
+    if after_id is not None:
+        condition = f"({condition}) AND id > {after_id}" if condition else f"id > {after_id}"
+
+    return f"{condition} ORDER BY id ASC".strip()
+
+
+def get_window_jqls(jql: str, field: str, boundaries: list[str]) -> list[str]:
+    """ Split a query into queries for non-overlapping windows of a date field.
+        The first window has no lower and the last no upper bound, and a last query
+        finds the issues without value, so together they find the same issues.
+
+    Args:
+        jql (str):              The query of the user. An ORDER BY clause is kept.
+        field (str):            The date field.
+        boundaries (list[str]): The ascending JQL dates between the windows.
+
+    Returns:
+        list[str]: The query of every window and of the empty field.
+    """
+    condition = strip_order_by(jql)
+    order_by = jql.strip()[len(condition):].strip()
+    bounds = [None] + list(boundaries) + [None]
+    windows = []
+
+    for lower, upper in zip(bounds[:-1], bounds[1:]):
+        clauses = []
+
+        if lower is not None:
+            clauses.append(f'{field} >= "{lower}"')
+
+        if upper is not None:
+            clauses.append(f'{field} < "{upper}"')
+
+        windows.append(" AND ".join(clauses) or f"{field} IS NOT EMPTY")
+
+    windows.append(f"{field} IS EMPTY")
+    queries = []
+
+    for window in windows:
+        query = f"({condition}) AND {window}" if condition else window
+        queries.append(f"{query} {order_by}".strip())
+
+    return queries
+
+
+def strip_order_by(jql: str) -> str:
+    """ Remove the ORDER BY clause from a query. Quoted text is not matched.
+
+    Args:
+        jql (str): The query.
+
+    Returns:
+        str: The condition of the query.
+    """
+    for match in _ORDER_BY_PATTERN.finditer(jql):
+        prefix = jql[:match.start()]
+
+        if (0 == prefix.count('"') % 2) and (0 == prefix.count("'") % 2):
+            return prefix.strip()
+
+    return jql.strip()
+
+
+def to_jql_datetime(timestamp: datetime.datetime, time_zone: str) -> str:
+    """ Convert a time to a JQL date in the time zone of the user.
+
+    Args:
+        timestamp (datetime.datetime): The time with time zone.
+        time_zone (str): The time zone of the user or None if unknown.
+
+    Returns:
+        str: The JQL date.
+    """
+    try:
+        timestamp = timestamp.astimezone(zoneinfo.ZoneInfo(time_zone))
+    except (TypeError, ValueError, zoneinfo.ZoneInfoNotFoundError):
+        timestamp -= UNKNOWN_TIME_ZONE_MARGIN
+
+    return timestamp.strftime(JQL_DATETIME_FORMAT)
+
+
+def _tokenize(jql: str) -> list[tuple[str, str]]:
+    """ Split a query into (kind, value) tokens. The kind is string, op or word. """
+    tokens = []
+    position = 0
+    jql = jql.strip()
+
+    while position < len(jql):
+        match = _TOKEN_PATTERN.match(jql, position)
+
+        if (match is None) or (match.end() == position):
+            raise JqlSyntaxError(f"Unexpected character at position {position}.")
+
+        kind = match.lastgroup
+        value = match.group(kind)
+
+        if "string" == kind:
+            value = _ESCAPE_PATTERN.sub(r"\1", value[1:-1])
+
+        tokens.append((kind, value))
+        position = match.end()
+
+    return tokens
+
+
+def _is_keyword(kind: str, value: str, keyword: str) -> bool:
+    """ Check whether a token is a keyword. Keywords are not case sensitive. """
+    return ("word" == kind) and (keyword == value.lower())
+
+
+def _parse_order_by(tokens: list) -> list[tuple[str, bool]]:
+    """ Parse the fields and directions after ORDER BY. """
+    order_by = []
+    position = 0
+
+    while position < len(tokens):
+        kind, field = tokens[position]
+
+        if kind not in ("word", "string"):
+            raise JqlSyntaxError(f"Expecting a field name, got '{field}'.")
+
+        descending = False
+        position += 1
+
+        if (position < len(tokens)) and (tokens[position][1].lower() in ("asc", "desc")):
+            descending = "desc" == tokens[position][1].lower()
+            position += 1
+
+        order_by.append((field, descending))
+
+        if position < len(tokens):
+            if "," != tokens[position][1]:
+                raise JqlSyntaxError(f"Expecting ',' in ORDER BY, got '{tokens[position][1]}'.")
+
+            position += 1
+
+    return order_by
+
+
+def _parse_or(tokens: list, position: int) -> tuple[any, int]:
+    """ Parse conditions joined with OR. """
+    node, position = _parse_and(tokens, position)
+
+    while (position < len(tokens)) and _is_keyword(*tokens[position], "or"):
+        right, position = _parse_and(tokens, position + 1)
+        node = (NODE_OR, node, right)
+
+    return node, position
+
+
+def _parse_and(tokens: list, position: int) -> tuple[any, int]:
+    """ Parse conditions joined with AND. """
+    node, position = _parse_not(tokens, position)
+
+    while (position < len(tokens)) and _is_keyword(*tokens[position], "and"):
+        right, position = _parse_not(tokens, position + 1)
+        node = (NODE_AND, node, right)
+
+    return node, position
+
+
+def _parse_not(tokens: list, position: int) -> tuple[any, int]:
+    """ Parse a negated condition, a condition in parentheses or a clause. """
+    if position >= len(tokens):
+        raise JqlSyntaxError("Unexpected end of the query.")
+
+    kind, value = tokens[position]
+
+    if _is_keyword(kind, value, "not"):
+        node, position = _parse_not(tokens, position + 1)
+        return (NODE_NOT, node), position
+
+    if ("op" == kind) and ("(" == value):
+        node, position = _parse_or(tokens, position + 1)
+
+        if (position >= len(tokens)) or (")" != tokens[position][1]):
+            raise JqlSyntaxError("Expecting ')'.")
+
+        return node, position + 1
+
+    return _parse_clause(tokens, position)
+
+
+def _parse_clause(tokens: list, position: int) -> tuple[any, int]:
+    """ Parse a clause: a field, an operator and a value. """
+    kind, field = tokens[position]
+
+    if kind not in ("word", "string"):
+        raise JqlSyntaxError(f"Expecting a field name, got '{field}'.")
+
+    operator, position = _parse_operator(tokens, position + 1)
+
+    if operator in ("in", "not in"):
+        value, position = _parse_list(tokens, position)
+    else:
+        value, position = _parse_value(tokens, position)
+
+        if (operator in ("is", "is not")) and (value is not EMPTY):
+            raise JqlSyntaxError(f"Expecting EMPTY after '{operator.upper()}'.")
+
+    return (NODE_CLAUSE, field, operator, value), position
+
+
+def _parse_operator(tokens: list, position: int) -> tuple[str, int]:
+    """ Parse an operator, which may consist of two words, e.g. NOT IN. """
+    if position >= len(tokens):
+        raise JqlSyntaxError("Expecting an operator.")
+
+    operator = tokens[position][1].lower()
+    position += 1
+
+    if (operator in ("not", "is")) and (position < len(tokens)):
+        following = tokens[position][1].lower()
+
+        if ("not" == operator and "in" == following) or ("is" == operator and "not" == following):
+            operator = f"{operator} {following}"
+            position += 1
+
+    if operator not in OPERATORS:
+        raise JqlSyntaxError(f"The operator '{operator}' is not supported.")
+
+    return operator, position
+
+
+def _parse_value(tokens: list, position: int) -> tuple[any, int]:
+    """ Parse a single value. """
+    if position >= len(tokens):
+        raise JqlSyntaxError("Expecting a value.")
+
+    kind, value = tokens[position]
+
+    if "op" == kind:
+        raise JqlSyntaxError(f"Expecting a value, got '{value}'.")
+
+    if (position + 1 < len(tokens)) and ("(" == tokens[position + 1][1]):
+        raise JqlSyntaxError(f"The function '{value}()' is not supported.")
+
+    if ("word" == kind) and (value.lower() in ("empty", "null")):
+        value = EMPTY
+
+    return value, position + 1
+
+
+def _parse_list(tokens: list, position: int) -> tuple[list[str], int]:
+    """ Parse a list of values in parentheses. """
+    if (position >= len(tokens)) or ("(" != tokens[position][1]):
+        raise JqlSyntaxError("Expecting '(' after IN.")
+
+    values = []
+    position += 1
+
+    while True:
+        value, position = _parse_value(tokens, position)
+        values.append(value)
+
+        if (position < len(tokens)) and ("," == tokens[position][1]):
+            position += 1
+        elif (position < len(tokens)) and (")" == tokens[position][1]):
+            return values, position + 1
+        else:
+            raise JqlSyntaxError("Expecting ',' or ')' in the list.")
@@ -0,0 +1,192 @@
+""" Serialization and parsing of JSON with an optional accelerated backend. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import json
+
+# The accelerated backends are optional. Install them with: pip install pyJiraCli[fast]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+################################################################################
+# Variables
+################################################################################
+
+BACKEND_ORJSON = "orjson"
+BACKEND_MSGSPEC = "msgspec"
+BACKEND_STDLIB = "json"
+
+INDENT = 4
+
+################################################################################
+# Classes
+################################################################################
+
+
+class JsonSerializer:
+    """ Serializes and parses JSON with the fastest available backend.
+        orjson and msgspec are used if installed, otherwise the standard library.
+        The output is UTF-8, non-ASCII characters are not escaped.
+    """
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def get_backend(compact: bool = False) -> str:
+        """ Get the name of the backend used for the serialization.
+
+        Args:
+            compact (bool): Get the backend of the compact instead of the indented output.
+
+        Returns:
+            str: The name of the backend.
+        """
+        backend = BACKEND_STDLIB
+
+        # orjson supports only an indentation of 2 spaces.
+        if (compact is True) and (orjson is not None):
+            backend = BACKEND_ORJSON
+        elif msgspec is not None:
+            backend = BACKEND_MSGSPEC
+
+        return backend
+
+    @staticmethod
+    def dumps(data: any, compact: bool = False) -> str:
+        """ Serialize the data to a JSON string.
+
+        Args:
+            data (any): The data to serialize.
+            compact (bool): Omit the indentation and all whitespace, e.g. for machine
+                            consumption. Default is an indentation of 4 spaces.
+
+        Returns:
+            str: The JSON string.
+        """
+        backend = JsonSerializer.get_backend(compact)
+        result = None
+
+        try:
+            if BACKEND_ORJSON == backend:
+                result = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+            elif BACKEND_MSGSPEC == backend:
+                result = msgspec.json.encode(data)
+
+                if compact is False:
+                    result = msgspec.json.format(result, indent=INDENT)
+
+                result = result.decode("utf-8")
+
+        except (TypeError, OverflowError):
+            # Not supported by the backend, e.g. integers with more than 64 bits.
+            result = None
+
+        if result is None:
+            if compact is True:
+                result = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+            else:
+                result = json.dumps(data, indent=INDENT, ensure_ascii=False)
+
+        return result
+
+    @staticmethod
+    def dump(data: any, file, compact: bool = False) -> None:
+        """ Serialize the data to a file opened in text mode.
+
+        Args:
+            data (any): The data to serialize.
+            file (obj): The file to write to.
+            compact (bool): Omit the indentation and all whitespace.
+        """
+        file.write(JsonSerializer.dumps(data, compact))
+
+    @staticmethod
+    def loads(text: any) -> any:
+        """ Parse a JSON string.
+
+        Args:
+            text (str|bytes): The JSON string.
+
+        Returns:
+            any: The parsed data.
+
+        Raises:
+            ValueError: The string is no valid JSON.
+        """
+        data = None
+
+        if orjson is not None:
+            data = orjson.loads(text)
+
+        elif msgspec is not None:
+            try:
+                data = msgspec.json.decode(text)
+            except msgspec.DecodeError as exc:
+                raise ValueError(str(exc)) from exc
+
+        else:
+            data = json.loads(text)
+
+        return data
+
+    @staticmethod
+    def load(file) -> any:
+        """ Parse the JSON content of a file.
+
+        Args:
+            file (obj): The file to read from.
+
+        Returns:
+            any: The parsed data.
+
+        Raises:
+            ValueError: The content is no valid JSON.
+        """
+        return JsonSerializer.loads(file.read())
+
+################################################################################
+# Functions
+################################################################################
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,248 @@
+""" Records the memory allocations with tracemalloc at the command phases
+    and search pages to find the sites which hold the most memory. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import os
+import sys
+import threading
+import tracemalloc
+
+from pyJiraCli.timings import get_endpoint
+
+################################################################################
+# Variables
+################################################################################
+
+# Number of allocation sites reported per phase.
+TOP_SITES = 5
+
+# Allocations of the profiler itself are not reported.
+_IGNORED_FILES = (tracemalloc.__file__, "<frozen importlib._bootstrap>",
+                  "<frozen importlib._bootstrap_external>", "<unknown>")
+
+_MEGABYTE = 1024 * 1024
+
+# The search endpoints of Jira Server and of Jira Cloud, which provide the pages.
+_SEARCH_ENDPOINTS = ("/search", "/search/jql")
+
+################################################################################
+# Classes
+################################################################################
+
+
+class MemoryProfile:
+    """ Records the memory allocated by Python at checkpoints, like the end of a
+        command phase or the receipt of a search page. Every checkpoint holds the
+        retained memory, the peak since the previous checkpoint and, for phases,
+        the top allocation sites. The checkpoints are collected for all instances
+        of the class, but only if the profile is enabled.
+    """
+    _enabled = False
+    _lock = threading.Lock()
+    _checkpoints = []
+    _pages = 0
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def enable(cls) -> None:
+        """ Start tracing the memory allocations and enable the checkpoints. """
+        if tracemalloc.is_tracing() is False:
+            tracemalloc.start()
+
+        cls._enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        """ Stop tracing the memory allocations and disable the checkpoints. """
+        cls._enabled = False
+        tracemalloc.stop()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """ Check whether the memory profile is recorded.
+
+        Returns:
+            bool: True if the memory profile is recorded, otherwise False.
+        """
+        return cls._enabled
+
+    @classmethod
+    def reset(cls) -> None:
+        """ Remove all checkpoints. """
+        with cls._lock:
+            cls._checkpoints = []
+            cls._pages = 0
+
+    @classmethod
+    def record_phase(cls, name: str) -> None:
+        """ Add a checkpoint with the top allocation sites at the end of a phase.
+            Used as phase hook of the timings.
+
+        Args:
+            name (str): The name of the phase.
+        """
+        if cls._enabled is True:
+            cls.checkpoint(name, with_sites=True)
+
+    @classmethod
+    def record_response(cls, response, *_args, **_kwargs) -> None:
+        """ Add a checkpoint for every received search page.
+            Used as response hook of a requests session.
+
+        Args:
+            response (requests.Response): The received response.
+        """
+        if (cls._enabled is True) and \
+                get_endpoint(response.request.url).endswith(_SEARCH_ENDPOINTS):
+            with cls._lock:
+                cls._pages += 1
+                page = cls._pages
+
+            # Taking a snapshot per page is too slow for large results.
+            cls.checkpoint(f"search page {page}", with_sites=False)
+
+    @classmethod
+    def checkpoint(cls, name: str, with_sites: bool = True) -> None:
+        """ Add a checkpoint with the retained memory and the peak since the previous one.
+
+        Args:
+            name (str): The name of the checkpoint.
+            with_sites (bool): Take a snapshot to get the top allocation sites.
+        """
+        with cls._lock:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            sites = []
+
+            if with_sites is True:
+                sites = _get_top_sites(tracemalloc.take_snapshot(), TOP_SITES)
+
+            cls._checkpoints.append({
+                "name": name,
+                "retained": current,
+                "peak": peak,
+                "sites": sites
+            })
+
+    @classmethod
+    def get_checkpoints(cls) -> list[dict]:
+        """ Get a copy of all checkpoints.
+
+        Returns:
+            list[dict]: The checkpoints in the order they were taken.
+        """
+        with cls._lock:
+            return list(cls._checkpoints)
+
+    @classmethod
+    def get_peak(cls) -> int:
+        """ Get the peak of the allocated memory since the profile was enabled.
+
+        Returns:
+            int: The peak in bytes.
+        """
+        peaks = [checkpoint["peak"] for checkpoint in cls.get_checkpoints()]
+
+        if tracemalloc.is_tracing() is True:
+            peaks.append(tracemalloc.get_traced_memory()[1])
+
+        return max(peaks, default=0)
+
+    @classmethod
+    def print_report(cls) -> None:
+        """ Print the checkpoints with their top allocation sites to the console. """
+        print(f"Memory profile (peak {cls.get_peak() / _MEGABYTE:.1f} MB):")
+        print(f"{'Checkpoint':<24}{'Retained [MB]':>14}{'Peak [MB]':>12}")
+
+        for checkpoint in cls.get_checkpoints():
+            print(f"{checkpoint['name']:<24}{checkpoint['retained'] / _MEGABYTE:>14.1f}"
+                  f"{checkpoint['peak'] / _MEGABYTE:>12.1f}")
+
+            for site in checkpoint["sites"]:
+                print(f"    {site['size'] / _MEGABYTE:>8.1f} MB {site['count']:>9} blocks  "
+                      f"{site['site']}")
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _get_top_sites(snapshot: tracemalloc.Snapshot, limit: int) -> list[dict]:
+    """ Get the source lines which hold the most allocated memory.
+
+    Args:
+        snapshot (tracemalloc.Snapshot): The snapshot of the allocations.
+        limit (int): The maximum number of sites.
+
+    Returns:
+        list[dict]: The sites with size in bytes and number of memory blocks.
+    """
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, file_name)
+                                       for file_name in _IGNORED_FILES])
+
+    return [{
+        "site": f"{_get_short_path(statistic.traceback[0].filename)}:"
+                f"{statistic.traceback[0].lineno}",
+        "size": statistic.size,
+        "count": statistic.count
+    } for statistic in snapshot.statistics("lineno")[:limit]]
+
+
+def _get_short_path(file_path: str) -> str:
+    """ Get the path relative to the import path it was loaded from,
+        e.g. jira/resources.py instead of the full path to the site-packages.
+
+    Args:
+        file_path (str): The path of the source file.
+
+    Returns:
+        str: The shortest relative path or the unchanged path.
+    """
+    short_path = file_path
+
+    for import_path in sys.path:
+        if import_path and file_path.startswith(os.path.join(import_path, "")):
+            relative_path = os.path.relpath(file_path, import_path)
+
+            if len(relative_path) < len(short_path):
+                short_path = relative_path
+
+    return short_path
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,143 @@
+""" The checkpoint of a migration between two Jira servers. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import os
+import threading
+
+from pyJiraCli.json_serializer import JsonSerializer
+
+################################################################################
+# Variables
+################################################################################
+
+DEFAULT_CHECKPOINT_FILE = "migrate_checkpoint.json"
+
+_ISSUES = "issues"
+
+################################################################################
+# Classes
+################################################################################
+
+
+class MigrationCheckpoint:
+    """ The checkpoint of a migration. It maps the keys of the migrated source
+        issues to the keys of the created target issues, so a restarted migration
+        skips them and the sub-tasks find their parents.
+        The issues can be added by multiple threads.
+    """
+
+    def __init__(self, file_path: str):
+        """ Create an empty checkpoint.
+
+        Args:
+            file_path (str): The path to the checkpoint file.
+        """
+        self._file_path = file_path
+        self._lock = threading.Lock()
+        self._issues = {}
+
+    def load(self) -> None:
+        """ Load the checkpoint file, if it exists.
+
+        Raises:
+            IOError: If the file cannot be read.
+            ValueError: If the file is no valid checkpoint.
+        """
+        if os.path.isfile(self._file_path) is False:
+            return
+
+        with open(self._file_path, 'r', encoding="UTF-8") as checkpoint_file:
+            checkpoint = JsonSerializer.loads(checkpoint_file.read())
+
+        if (isinstance(checkpoint, dict) is False) or \
+                (isinstance(checkpoint.get(_ISSUES), dict) is False):
+            raise ValueError(f"'{self._file_path}' is no valid migration checkpoint.")
+
+        self._issues = checkpoint[_ISSUES]
+
+    def save(self) -> None:
+        """ Write the checkpoint file. A temporary file replaces the old one,
+            so an interrupted migration never leaves a broken checkpoint.
+
+        Raises:
+            IOError: If the file cannot be written.
+        """
+        temp_file_path = self._file_path + ".tmp"
+
+        # Saved by the threads which created the issues.
+        with self._lock:
+            with open(temp_file_path, 'w', encoding="UTF-8") as checkpoint_file:
+                checkpoint_file.write(JsonSerializer.dumps({_ISSUES: self._issues}))
+
+            os.replace(temp_file_path, self._file_path)
+
+    def get_target_key(self, source_key: str) -> str:
+        """ Get the key of the target issue created from a source issue.
+
+        Args:
+            source_key (str): The key of the source issue.
+
+        Returns:
+            str: The key of the target issue or None if not migrated yet.
+        """
+        with self._lock:
+            return self._issues.get(source_key)
+
+    def add(self, source_key: str, target_key: str) -> None:
+        """ Record a migrated issue.
+
+        Args:
+            source_key (str): The key of the source issue.
+            target_key (str): The key of the created target issue.
+        """
+        with self._lock:
+            self._issues[source_key] = target_key
+
+    def get_count(self) -> int:
+        """ Get the number of migrated issues.
+
+        Returns:
+            int: The number of migrated issues.
+        """
+        with self._lock:
+            return len(self._issues)
+
+################################################################################
+# Functions
+################################################################################
+
+################################################################################
+# Main
+################################################################################
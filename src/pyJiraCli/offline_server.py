@@ -0,0 +1,141 @@
+"""Search of the local issue mirror with the interface of the Jira server."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+from pyJiraCli.issue_store import IssueStore, META_FIELDS
+from pyJiraCli.jira_server import Server
+from pyJiraCli.jql import JqlSyntaxError
+from pyJiraCli.ret import Ret
+
+################################################################################
+# Variables
+################################################################################
+
+################################################################################
+# Classes
+################################################################################
+
+
+class OfflineServer(Server):
+    """ Searches the issues of the local mirror instead of the Jira server.
+        The field catalogue stored with the mirror provides the field names and
+        types, so the search command works the same with both servers.
+        There is no Jira handle, requests of extra data like worklogs are not possible.
+    """
+
+    def __init__(self, store: IssueStore, text: str = None):
+        """ Use the issues and the field catalogue of a mirror.
+
+        Args:
+            store (IssueStore): The mirror.
+            text (str): Terms, which every found issue must contain, or None.
+                        The issues are ranked by relevance then.
+        """
+        super().__init__()
+        self._store = store
+        self._text = text
+        self._all_fields = store.get_meta(META_FIELDS, [])
+
+    def search(self,
+               search_str: str,
+               max_results: int,
+               fields: list[str],
+               raw: bool = True) -> Ret.CODE:
+        """ Search for issues in the mirror with a query of the supported JQL subset.
+
+        Args:
+            search_str (str): The query.
+            max_results (int): The maximum number of search results. 0 or None for all.
+            fields (list[str]): The fields of the found issues. Empty for all fields.
+            raw (bool): Ignored, the issues are always plain dicts.
+
+        Returns:
+            Ret.CODE:   Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+        """
+        ret_status = Ret.CODE.RET_OK
+
+        try:
+            self._search_result = list(self.iter_search_raw(search_str, max_results, fields))
+
+        except JqlSyntaxError as e:
+            print(e)
+            ret_status = Ret.CODE.RET_ERROR_INVALID_SEARCH
+
+        return ret_status
+
+    def iter_search_raw(self,
+                        search_str: str,
+                        max_results: int,
+                        fields: list[str],
+                        validate_query: bool = True):
+        """ Search for issues in the mirror with a query of the supported JQL subset.
+
+        Args:
+            search_str (str): The query.
+            max_results (int): The maximum number of search results. 0 or None for all.
+            fields (list[str]): The fields of the found issues. Empty for all fields.
+            validate_query (bool): Ignored, unknown values never match.
+
+        Raises:
+            JqlSyntaxError: The query is invalid or not supported.
+
+        Yields:
+            dict: The raw data of every found issue.
+        """
+        fields, aliases = self._get_search_fields(fields)
+
+        # All stored fields are provided for the special fields like *all.
+        if any(field.startswith("*") for field in fields):
+            fields = []
+
+        for issue in self._store.query(search_str, max_results, self._text):
+            stored_fields = issue.get("fields", {})
+
+            if fields:
+                # Like the server, a requested field without value is null.
+                issue["fields"] = {field_id: stored_fields.get(field_id) for field_id in fields}
+
+            for field_id, field_name in aliases.items():
+                if field_id in issue["fields"]:
+                    issue["fields"][field_name] = issue["fields"][field_id]
+
+            yield issue
+
+################################################################################
+# Functions
+################################################################################
+
+################################################################################
+# Main
+################################################################################
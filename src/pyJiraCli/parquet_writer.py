@@ -0,0 +1,252 @@
+"""Writes the search results as typed columns to a Parquet file."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import datetime
+import json
+
+# The Parquet export is optional. Install it with: pip install pyJiraCli[parquet]
+try:
+    import pyarrow
+    from pyarrow import parquet
+except ImportError:
+    pyarrow = None
+    parquet = None
+
+################################################################################
+# Variables
+################################################################################
+
+KEY_COLUMN = "key"
+
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+DATE_FORMAT = "%Y-%m-%d"
+
+# The attributes tried in this order to get the name of an object, e.g. of a
+# status, a user, an option or an issue.
+NAME_ATTRIBUTES = ["name", "value", "key"]
+
+# The number of issues buffered and written as one row group.
+ROW_GROUP_SIZE = 1000
+
+################################################################################
+# Classes
+################################################################################
+
+
+class ParquetWriter:
+    """ Writes issues as rows to a Parquet file. Every field is a typed column,
+        derived from the schema type of the field in the field catalogue.
+        The issues are buffered and written in row groups, so the memory is
+        bounded by the row group size and not by the number of issues.
+    """
+
+    def __init__(self, file_path: str, columns: list[tuple[str, str, str]],
+                 row_group_size: int = ROW_GROUP_SIZE):
+        """ Open the Parquet file.
+
+        Args:
+            file_path (str): The path to the Parquet file.
+            columns (list[tuple[str, str, str]]): The column name, the key in the
+                fields of the issue and the schema type of the field per column.
+            row_group_size (int): The number of issues per row group.
+
+        Raises:
+            IOError: The file cannot be opened.
+        """
+        self._row_group_size = max(1, row_group_size)
+        self._rows = 0
+        self._field_keys = []
+        self._converters = []
+        schema_fields = [pyarrow.field(KEY_COLUMN, pyarrow.string())]
+
+        for column_name, field_key, field_type in columns:
+            column_type, converter = _get_column_type(field_type)
+            schema_fields.append(pyarrow.field(column_name, column_type))
+            self._field_keys.append(field_key)
+            self._converters.append(converter)
+
+        self._schema = pyarrow.schema(schema_fields)
+        self._buffers = [[] for _ in schema_fields]
+        self._writer = parquet.ParquetWriter(file_path, self._schema)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
+
+    @staticmethod
+    def is_available() -> bool:
+        """ Check whether pyarrow is installed.
+
+        Returns:
+            bool: True if Parquet files can be written, otherwise False.
+        """
+        return pyarrow is not None
+
+    def write_issue(self, issue: dict) -> None:
+        """ Add an issue as row. A row group is written when the buffer is full.
+
+        Args:
+            issue (dict): The raw data of the issue.
+        """
+        fields = issue.get("fields", {})
+        self._buffers[0].append(issue.get("key"))
+
+        for buffer, field_key, converter in zip(self._buffers[1:],
+                                                self._field_keys,
+                                                self._converters):
+            buffer.append(converter(fields.get(field_key)))
+
+        if len(self._buffers[0]) >= self._row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """ Write the buffered issues as row group. """
+        if 0 < len(self._buffers[0]):
+            arrays = [pyarrow.array(buffer, type=field.type)
+                      for buffer, field in zip(self._buffers, self._schema)]
+            self._writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self._schema))
+            self._rows += len(self._buffers[0])
+
+            for buffer in self._buffers:
+                buffer.clear()
+
+    def close(self) -> int:
+        """ Write the remaining issues and close the file.
+
+        Returns:
+            int: The number of issues written.
+        """
+        if self._writer is not None:
+            self.flush()
+            self._writer.close()
+            self._writer = None
+
+        return self._rows
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _get_column_type(field_type: str) -> tuple[any, any]:
+    """ Get the column type and the value converter for a schema type of a field.
+        Fields of unknown types are stored as strings.
+
+    Args:
+        field_type (str): The schema type of the field, e.g. "number" or "datetime".
+
+    Returns:
+        tuple[any, any]: The pyarrow data type and the converter function.
+    """
+    column_type = (pyarrow.string(), _to_string)
+
+    if "number" == field_type:
+        column_type = (pyarrow.float64(), _to_number)
+    elif "datetime" == field_type:
+        column_type = (pyarrow.timestamp("ms", tz="UTC"), _to_datetime)
+    elif "date" == field_type:
+        column_type = (pyarrow.date32(), _to_date)
+    elif "array" == field_type:
+        column_type = (pyarrow.list_(pyarrow.string()), _to_string_list)
+
+    return column_type
+
+
+def _to_string(value: any) -> str:
+    """ Convert a value to a string. Objects are replaced by their name,
+        if they have one, otherwise they are serialized to JSON. """
+    if (value is None) or isinstance(value, str):
+        return value
+
+    if isinstance(value, dict):
+        for attribute in NAME_ATTRIBUTES:
+            if isinstance(value.get(attribute), str):
+                return value[attribute]
+
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _to_number(value: any) -> float:
+    """ Convert a value to a number, None if it is not numeric. """
+    number = None
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        number = float(value)
+
+    return number
+
+
+def _to_datetime(value: any) -> datetime.datetime:
+    """ Convert a Jira timestamp to a datetime, None if it is invalid. """
+    timestamp = None
+
+    if isinstance(value, str):
+        try:
+            timestamp = datetime.datetime.strptime(value, DATETIME_FORMAT)
+        except ValueError:
+            pass
+
+    return timestamp
+
+
+def _to_date(value: any) -> datetime.date:
+    """ Convert a Jira date to a date, None if it is invalid. """
+    date = None
+
+    if isinstance(value, str):
+        try:
+            date = datetime.datetime.strptime(value, DATE_FORMAT).date()
+        except ValueError:
+            pass
+
+    return date
+
+
+def _to_string_list(value: any) -> list[str]:
+    """ Convert an array to a list of strings, see _to_string().
+        A value which is not an array becomes a list with one element. """
+    if value is None:
+        return None
+
+    if not isinstance(value, list):
+        value = [value]
+
+    return [_to_string(element) for element in value]
+
+################################################################################
+# Main
+################################################################################
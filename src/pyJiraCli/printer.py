@@ -74,6 +74,15 @@ class Printer:
         """Set verbose mode for all instances of the class."""
         cls._print_verbose = True
 
+    @classmethod
+    def is_verbose(cls) -> bool:
+        """Check whether infos and warnings are printed.
+
+        Returns:
+            bool: True in verbose mode, otherwise False.
+        """
+        return cls._print_verbose
+
     def print_error(self, err_type: PrintType, error: Ret = Ret.CODE.RET_OK) -> None:
         """ Print the exit error.
     
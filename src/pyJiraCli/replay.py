@@ -0,0 +1,214 @@
+""" Replays HTTP responses recorded in a HAR file, so that commands
+    can be run deterministically without a Jira server. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import base64
+import datetime
+import json
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+from requests.adapters import BaseAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from pyJiraCli.file_helper import FileHelper
+
+################################################################################
+# Variables
+################################################################################
+
+# Headers of the recorded response which don't match the replayed body anymore.
+_SKIPPED_RESPONSE_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+################################################################################
+# Classes
+################################################################################
+
+
+class ReplayAdapter(BaseAdapter):
+    """ Transport adapter which serves the responses recorded in a HAR file
+        instead of sending the requests to the server.
+
+        Requests are matched by method, path, query and body.
+        Identical requests get the recorded responses in the recorded order.
+        If there are more identical requests than recorded, the last response is repeated.
+
+    Args:
+        entries (list[dict]): The HAR entries to replay.
+        latency (float): Latency in milliseconds which is added to every response.
+    """
+
+    def __init__(self, entries: list[dict], latency: float = 0):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._latency = latency
+        self._responses = {}
+        self._served = {}
+
+        for entry in entries:
+            request = entry["request"]
+            key = _get_request_key(request["method"],
+                                   request["url"],
+                                   request.get("postData", {}).get("text"))
+
+            self._responses.setdefault(key, []).append(entry["response"])
+
+    @staticmethod
+    def load(file_path: str, latency: float = 0) -> "ReplayAdapter":
+        """ Create a replay adapter from a HAR file,
+            e.g. one recorded with the --trace-file option.
+
+        Args:
+            file_path (str): The path to the HAR file.
+            latency (float): Latency in milliseconds which is added to every response.
+
+        Returns:
+            ReplayAdapter: The replay adapter.
+
+        Raises:
+            IOError: If the file can't be opened.
+            ValueError: If the file is no HAR file.
+        """
+        with FileHelper.open_file(file_path, 'r') as har_file:
+            har = json.load(har_file)
+
+        if (isinstance(har, dict) is False) or \
+                (isinstance(har.get("log"), dict) is False) or \
+                (isinstance(har["log"].get("entries"), list) is False):
+            raise ValueError(f"'{file_path}' is no HAR file.")
+
+        return ReplayAdapter(har["log"]["entries"], latency)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        # pylint: disable=R0913,R0917
+        body = request.body
+
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
+
+        key = _get_request_key(request.method, request.url, body)
+
+        with self._lock:
+            recorded = self._responses.get(key, [])
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+
+        if 0 < self._latency:
+            time.sleep(self._latency / 1000)
+
+        if 0 == len(recorded):
+            return self._build_response(request, {
+                "status": 404,
+                "statusText": "Not Found",
+                "headers": [{"name": "Content-Type", "value": "application/json"}],
+                "content": {
+                    "text": json.dumps({"errorMessages": [
+                        f"No recorded response for {request.method} {request.url}."]})
+                }
+            })
+
+        return self._build_response(request, recorded[min(index, len(recorded) - 1)])
+
+    def close(self):
+        pass
+
+    def _build_response(self, request, recorded: dict) -> Response:
+        """ Build a response object from a recorded HAR response.
+
+        Args:
+            request (requests.PreparedRequest): The request to respond to.
+            recorded (dict): The recorded HAR response.
+
+        Returns:
+            Response: The response.
+        """
+        content = recorded.get("content", {})
+        body = content.get("text", "")
+
+        if "base64" == content.get("encoding"):
+            body = base64.b64decode(body)
+        else:
+            body = body.encode("utf-8")
+
+        response = Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded.get("statusText", "")
+        response.headers = CaseInsensitiveDict(
+            {header["name"]: header["value"] for header in recorded.get("headers", [])
+             if header["name"].lower() not in _SKIPPED_RESPONSE_HEADERS})
+        response.headers["Content-Length"] = str(len(body))
+        response.encoding = get_encoding_from_headers(response.headers)
+        # pylint: disable=protected-access
+        response._content = body
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = datetime.timedelta(milliseconds=self._latency)
+
+        return response
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _get_request_key(method: str, url: str, body: str) -> tuple[str, str, str]:
+    """ Get the key a request is matched by. The host is ignored, the query
+        parameters are sorted and JSON bodies are normalized.
+
+    Args:
+        method (str): The HTTP method.
+        url (str): The request URL.
+        body (str): The request body or None.
+
+    Returns:
+        tuple[str, str, str]: The method, the path with the sorted query and the body.
+    """
+    parsed_url = urlparse(url)
+    query = urlencode(sorted(parse_qsl(parsed_url.query, keep_blank_values=True)))
+
+    if body:
+        try:
+            body = json.dumps(json.loads(body), sort_keys=True)
+        except ValueError:
+            pass  # Not a JSON body, match as is.
+    else:
+        body = ""
+
+    return method.upper(), f"{parsed_url.path}?{query}", body
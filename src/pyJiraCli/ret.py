@@ -65,6 +65,7 @@ class Ret():
         RET_ERROR_PROFILE_ALREADY_EXISTS = 15
         RET_ERROR_INVALID_PROFILE_TYPE   = 16
         RET_ERROR_MISSING_CREDENTIALS    = 17
+        RET_ERROR_MISSING_DEPENDENCY     = 18
 
     MSG = {
         CODE.RET_OK:                           "Process successful.",
@@ -89,6 +90,7 @@ class Ret():
                                                "Use the 'update' command to update it.",
         CODE.RET_ERROR_INVALID_PROFILE_TYPE:   "The provided profile type is invalid.",
         CODE.RET_ERROR_MISSING_CREDENTIALS:    "Failed to provide server credentials.",
+        CODE.RET_ERROR_MISSING_DEPENDENCY:     "A required optional package is not installed.",
     }
 
 
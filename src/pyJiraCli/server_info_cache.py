@@ -0,0 +1,160 @@
+""" Caches the server info of the Jira servers between the command executions. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import os
+import time
+
+from pyJiraCli.json_serializer import JsonSerializer
+
+################################################################################
+# Variables
+################################################################################
+
+# The cache is shared by all profiles and working directories of the user.
+DEFAULT_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".pyJiraCli", "server_info.json")
+
+# Age in seconds after which the server info is requested again, e.g. after an upgrade.
+CACHE_MAX_AGE = 24 * 60 * 60
+
+_TIME = "time"
+_SERVER_INFO = "serverInfo"
+
+################################################################################
+# Classes
+################################################################################
+
+
+class ServerInfoCache:
+    """ Caches the server info, like the deployment type and the version, per
+        server URL in a JSON file. Every profile of a server shares the entry, so
+        the server info is requested once a day instead of with every login.
+        The cache is optional, a file which cannot be read or written is ignored.
+    """
+
+    def __init__(self, file_path: str = DEFAULT_CACHE_FILE):
+        """ Create a cache, the file is read on first use.
+
+        Args:
+            file_path (str): The path to the cache file.
+        """
+        self._file_path = file_path
+        self._entries = None
+
+    def get(self, server_url: str) -> dict:
+        """ Get the cached server info of a server.
+
+        Args:
+            server_url (str): The URL of the server.
+
+        Returns:
+            dict: The server info or None if not cached or expired.
+        """
+        entry = self._load().get(server_url)
+
+        if (entry is None) or (_is_expired(entry)):
+            return None
+
+        return entry[_SERVER_INFO]
+
+    def set(self, server_url: str, server_info: dict) -> None:
+        """ Cache the server info of a server and write the file.
+            Expired entries of other servers are removed.
+
+        Args:
+            server_url (str): The URL of the server.
+            server_info (dict): The server info as provided by Jira.
+        """
+        entries = {url: entry for url, entry in self._load().items()
+                   if not _is_expired(entry)}
+        entries[server_url] = {_TIME: time.time(), _SERVER_INFO: server_info}
+        self._entries = entries
+
+        # A temporary file replaces the old one, so parallel logins never read a broken file.
+        temp_file_path = f"{self._file_path}.{os.getpid()}.tmp"
+
+        try:
+            os.makedirs(os.path.dirname(self._file_path) or ".", exist_ok=True)
+
+            with open(temp_file_path, 'w', encoding="UTF-8") as cache_file:
+                cache_file.write(JsonSerializer.dumps(entries))
+
+            os.replace(temp_file_path, self._file_path)
+
+        except IOError:
+            pass
+
+    def _load(self) -> dict:
+        """ Read the cache file once.
+
+        Returns:
+            dict: The entries by server URL, empty if the file is missing or invalid.
+        """
+        if self._entries is None:
+            self._entries = {}
+
+            try:
+                with open(self._file_path, 'r', encoding="UTF-8") as cache_file:
+                    entries = JsonSerializer.loads(cache_file.read())
+
+                if isinstance(entries, dict):
+                    self._entries = {url: entry for url, entry in entries.items()
+                                     if isinstance(entry, dict) and
+                                     isinstance(entry.get(_TIME), (int, float)) and
+                                     isinstance(entry.get(_SERVER_INFO), dict)}
+
+            except (IOError, ValueError):
+                pass
+
+        return self._entries
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _is_expired(entry: dict) -> bool:
+    """ Check whether a cache entry is older than the maximum age.
+
+    Args:
+        entry (dict): The cache entry.
+
+    Returns:
+        bool: True if the server info must be requested again.
+    """
+    return CACHE_MAX_AGE < time.time() - entry[_TIME]
+
+################################################################################
+# Main
+################################################################################
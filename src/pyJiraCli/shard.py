@@ -0,0 +1,105 @@
+""" Partitions the work items of a command into shards, which run on different machines. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import hashlib
+import re
+from typing import Optional
+
+################################################################################
+# Variables
+################################################################################
+
+_SHARD_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def parse_shard(value: Optional[str]) -> Optional[tuple[int, int]]:
+    """ Parse a shard argument like 2/8, the second of eight shards.
+
+    Args:
+        value (str): The shard as index/count, the index counts from 1, or None.
+
+    Raises:
+        ValueError: If the value is no valid shard.
+
+    Returns:
+        tuple[int, int]: The index and the count or None if no shard is given.
+    """
+    if value is None:
+        return None
+
+    match = _SHARD_PATTERN.match(value)
+
+    if match is None:
+        raise ValueError(f"Invalid shard '{value}'. Use <index>/<count>, e.g. 1/4.")
+
+    index, count = int(match.group(1)), int(match.group(2))
+
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{value}'. The index must be between 1 and {count}.")
+
+    return index, count
+
+
+def is_in_shard(value: str, shard: Optional[tuple[int, int]]) -> bool:
+    """ Check whether a work item belongs to a shard. The items are partitioned by a
+        hash of their value, which is the same on every machine and Python version,
+        so every shard processes a disjoint part without coordination.
+
+    Args:
+        value (str): The value identifying the item, e.g. the issue key or external ID.
+        shard (tuple[int, int]): The index and the count of the shard or None for all items.
+
+    Returns:
+        bool: True if the item belongs to the shard.
+    """
+    if shard is None:
+        return True
+
+    index, count = shard
+    digest = hashlib.sha256(str(value).encode("utf-8")).digest()
+
+    return index - 1 == int.from_bytes(digest[:8], "big") % count
+
+################################################################################
+# Main
+################################################################################
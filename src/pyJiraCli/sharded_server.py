@@ -0,0 +1,279 @@
+""" Searches the issues of a query in parallel shards of a date field. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import datetime
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from pyJiraCli.issue_store import from_store_datetime, to_store_datetime
+from pyJiraCli.jira_server import Server
+from pyJiraCli.jql import get_window_jqls, strip_order_by, to_jql_datetime
+
+################################################################################
+# Variables
+################################################################################
+
+DEFAULT_SHARDS = 8
+
+# Number of issues passed at once from a shard to the merged result.
+SHARD_BATCH_SIZE = 100
+
+# Number of batches per shard, which are received before the shards wait for the merge.
+QUEUED_BATCHES_PER_SHARD = 2
+
+# Seconds a shard waits for space in the queue before checking whether the search stopped.
+_PUT_TIMEOUT = 0.1
+
+################################################################################
+# Classes
+################################################################################
+
+
+class ShardedServer(Server):
+    """ Searches the issues in parallel shards. The query is split into
+        non-overlapping windows of a date field between its first and last value,
+        which are searched concurrently. The issues are merged in the order they are
+        received and found only once, even if their date changes during the search.
+        The ORDER BY clause of the query only orders the issues within a shard.
+    """
+
+    def __init__(self, shard_by: str, shards: int = DEFAULT_SHARDS, keyset: bool = False):
+        """ Create a server, which shards every raw search.
+
+        Args:
+            shard_by (str): The date field, by which the query is split, e.g. created.
+            shards (int): The number of date windows.
+            keyset (bool): Page the shards by the issue ID instead of the offset.
+        """
+        self._shards = max(1, shards)
+
+        # Every window and the issues without date are searched at once.
+        super().__init__(jobs=self._shards + 1, keyset=keyset)
+        self._shard_by = shard_by
+
+    def iter_search_raw(self,
+                        search_str: str,
+                        max_results: int,
+                        fields: list[str],
+                        validate_query: bool = True):
+        """ Search the issues in parallel shards and yield them as plain dicts.
+
+        Args:
+            search_str (str): The string by which to search issues for.
+            max_results (int): The maximum number of search results. 0 or None for all.
+            fields (list[str]): The fields to search for in the work items.
+                                Empty for the default fields of the server.
+            validate_query (bool): Whether the server rejects a query with unknown values.
+
+        Raises:
+            JIRAError: The search of a shard failed.
+
+        Yields:
+            dict: The raw data of every found issue.
+        """
+        queries = self.get_shard_jqls(search_str)
+        batches = queue.Queue(maxsize=len(queries) * QUEUED_BATCHES_PER_SHARD)
+        stop = threading.Event()
+        keys = set()
+
+        # The field catalogue is loaded once, before the shards use it.
+        self._get_search_fields(fields)
+
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            for jql in queries:
+                executor.submit(self._search_shard, jql, fields, validate_query, batches, stop)
+
+            try:
+                running = len(queries)
+
+                while 0 < running:
+                    batch = batches.get()
+
+                    if batch is None:
+                        running -= 1
+                    elif isinstance(batch, Exception):
+                        raise batch
+                    else:
+                        for issue in batch:
+                            # An issue, whose date changed, may be found by two shards.
+                            if issue["key"] not in keys:
+                                keys.add(issue["key"])
+                                yield issue
+
+                            if max_results and (max_results <= len(keys)):
+                                return
+
+            finally:
+                # The shards stop after their current page, also if the search is aborted.
+                stop.set()
+
+    def get_shard_jqls(self, search_str: str) -> list[str]:
+        """ Get the queries of the shards. The windows split the range between the
+            first and the last date into equal parts, at minute precision of JQL.
+
+        Args:
+            search_str (str): The string by which to search issues for.
+
+        Raises:
+            JIRAError: The search of the first or last date failed.
+
+        Returns:
+            list[str]: The queries of the date windows and of the issues without date.
+        """
+        condition = strip_order_by(search_str)
+        first = self._get_date(condition, "ASC")
+        last = self._get_date(condition, "DESC")
+        boundaries = []
+
+        if (first is not None) and (last is not None) and (first < last):
+            step = (last - first) / self._shards
+            time_zone = self.get_time_zone()
+            boundaries = sorted({to_jql_datetime(first + step * idx, time_zone)
+                                 for idx in range(1, self._shards)})
+
+        return get_window_jqls(search_str, self._shard_by, boundaries)
+
+    def _get_date(self, condition: str, order: str) -> Optional[datetime.datetime]:
+        """ Get the first or last date of the found issues.
+
+        Args:
+            condition (str): The query without ORDER BY clause.
+            order (str): ASC for the first and DESC for the last date.
+
+        Returns:
+            Optional[datetime.datetime]: The date in UTC or None if no issue has a date.
+        """
+        jql = f"{self._shard_by} IS NOT EMPTY ORDER BY {self._shard_by} {order}"
+
+        if condition:
+            jql = f"({condition}) AND {jql}"
+
+        # The resources are used, as keyset pagination would replace the ORDER BY clause.
+        issues = self._jira_obj.search_issues(jql, maxResults=1, fields=[self._shard_by])
+        value = issues[0].raw["fields"].get(self._shard_by) if 0 < len(issues) else None
+
+        return _parse_date(value)
+
+    def _search_shard(self,
+                      jql: str,
+                      fields: list[str],
+                      validate_query: bool,
+                      batches: queue.Queue,
+                      stop: threading.Event) -> None:
+        # pylint: disable=too-many-arguments
+        """ Search the issues of a shard and queue them in batches.
+            The error of a failed search is queued. None is queued at the end.
+
+        Args:
+            jql (str): The query of the shard.
+            fields (list[str]): The fields to search for in the work items.
+            validate_query (bool): Whether the server rejects a query with unknown values.
+            batches (queue.Queue): The queue of the merged result.
+            stop (threading.Event): Set if the search is finished or aborted.
+        """
+        batch = []
+
+        try:
+            for issue in super().iter_search_raw(jql, 0, fields, validate_query):
+                batch.append(issue)
+
+                if SHARD_BATCH_SIZE <= len(batch):
+                    if _put(batches, batch, stop) is False:
+                        return
+
+                    batch = []
+
+            if 0 < len(batch):
+                _put(batches, batch, stop)
+
+        # Every error is passed on, so a shard never ends with missing issues unnoticed.
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            _put(batches, e, stop)
+
+        finally:
+            _put(batches, None, stop)
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _put(batches: queue.Queue, item: any, stop: threading.Event) -> bool:
+    """ Queue an item, waiting while the queue is full.
+
+    Args:
+        batches (queue.Queue): The queue.
+        item (any): The item.
+        stop (threading.Event): Set if the search is finished or aborted.
+
+    Returns:
+        bool: True if queued, False if the search stopped meanwhile.
+    """
+    while stop.is_set() is False:
+        try:
+            batches.put(item, timeout=_PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            pass
+
+    return False
+
+
+def _parse_date(value: str) -> Optional[datetime.datetime]:
+    """ Parse the value of a date or date-time field.
+
+    Args:
+        value (str): The value as provided by Jira, e.g. 2024-01-01T10:00:00.000+0100
+                     or 2024-01-01.
+
+    Returns:
+        Optional[datetime.datetime]: The time in UTC or None if invalid.
+    """
+    timestamp = to_store_datetime(value)
+
+    if timestamp is not None:
+        return from_store_datetime(timestamp)
+
+    try:
+        return datetime.datetime.strptime(value, "%Y-%m-%d").replace(
+            tzinfo=datetime.timezone.utc)
+    except (TypeError, ValueError):
+        return None
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,312 @@
+""" Records the timings of the HTTP requests and the command phases
+    and reports them as summary table or JSON file. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import json
+import math
+import re
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from pyJiraCli.file_helper import FileHelper
+from pyJiraCli.ret import Ret
+
+################################################################################
+# Variables
+################################################################################
+
+KIND_REQUEST = "request"
+KIND_PHASE = "phase"
+
+# Path segments which are replaced by a placeholder to group the endpoints.
+_ISSUE_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
+_ID_PATTERN = re.compile(r"^\d+$")
+
+# Path segments which are followed by the API version, e.g. /rest/api/2.
+_VERSIONED_APIS = ("api", "agile", "auth")
+
+_TABLE_HEADER = ("Kind", "Name", "Count", "p50 [ms]", "p95 [ms]", "Max [ms]", "Bytes")
+
+################################################################################
+# Classes
+################################################################################
+
+
+class Timings:
+    """ Records the latency of every HTTP request and command phase.
+        The records are collected for all instances of the class,
+        but only if the timings are enabled.
+    """
+    _enabled = False
+    _lock = threading.Lock()
+    _records = []
+
+    # Hooks which are called with the name of every outermost phase of the main thread.
+    _phase_hooks = []
+
+    # Nesting depth of the phases per thread.
+    _local = threading.local()
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def enable(cls) -> None:
+        """ Enable recording of the timings for all instances of the class. """
+        cls._enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        """ Disable recording of the timings for all instances of the class. """
+        cls._enabled = False
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """ Check whether the timings are recorded.
+
+        Returns:
+            bool: True if the timings are recorded, otherwise False.
+        """
+        return cls._enabled
+
+    @classmethod
+    def add_phase_hook(cls, hook) -> None:
+        """ Add a hook which is called with the name of a phase when it ends.
+            Only called for the outermost phases of the main thread, not for phases
+            nested in them or running in worker threads, which are part of a phase
+            of the main thread. Called also if the timings are not enabled.
+
+        Args:
+            hook (callable): The hook function, called with the name of the phase.
+        """
+        if hook not in cls._phase_hooks:
+            cls._phase_hooks.append(hook)
+
+    @classmethod
+    def reset(cls) -> None:
+        """ Remove all records. """
+        with cls._lock:
+            cls._records = []
+
+    @classmethod
+    def record_response(cls, response, *_args, **kwargs) -> None:
+        """ Record a HTTP response. Used as response hook of a requests session.
+
+        Args:
+            response (requests.Response): The received response.
+            kwargs: The arguments the request was sent with.
+        """
+        if cls._enabled is False:
+            return
+
+        # Don't consume streamed bodies, their size is taken from the header.
+        if kwargs.get("stream", False) is True:
+            size = int(response.headers.get("Content-Length", 0))
+        else:
+            size = len(response.content)
+
+        cls._add({
+            "kind": KIND_REQUEST,
+            "name": f"{response.request.method} {get_endpoint(response.request.url)}",
+            "method": response.request.method,
+            "endpoint": get_endpoint(response.request.url),
+            "status": response.status_code,
+            "bytes": size,
+            "latency": response.elapsed.total_seconds()
+        })
+
+    @classmethod
+    @contextmanager
+    def phase(cls, name: str):
+        """ Context manager which records the duration of a command phase.
+            Phases can be nested, e.g. a phase per issue in a phase for all issues.
+
+        Args:
+            name (str): The name of the phase.
+        """
+        start = time.perf_counter()
+        cls._local.depth = getattr(cls._local, "depth", 0) + 1
+
+        try:
+            yield
+        finally:
+            cls._local.depth -= 1
+
+            if cls._enabled is True:
+                cls._add({
+                    "kind": KIND_PHASE,
+                    "name": name,
+                    "latency": time.perf_counter() - start
+                })
+
+            if (0 == cls._local.depth) and \
+                    (threading.current_thread() is threading.main_thread()):
+                for hook in cls._phase_hooks:
+                    hook(name)
+
+    @classmethod
+    def get_records(cls) -> list[dict]:
+        """ Get a copy of all records.
+
+        Returns:
+            list[dict]: The recorded requests and phases.
+        """
+        with cls._lock:
+            return list(cls._records)
+
+    @classmethod
+    def get_summary(cls) -> list[dict]:
+        """ Summarize the records per phase and per request endpoint.
+
+        Returns:
+            list[dict]: One entry per phase and endpoint with count,
+                        percentiles, maximum and total of the latency and the total bytes.
+        """
+        groups = {}
+
+        for record in cls.get_records():
+            groups.setdefault((record["kind"], record["name"]), []).append(record)
+
+        summary = []
+
+        for (kind, name), records in groups.items():
+            latencies = sorted(record["latency"] for record in records)
+
+            summary.append({
+                "kind": kind,
+                "name": name,
+                "count": len(records),
+                "p50": _percentile(latencies, 50),
+                "p95": _percentile(latencies, 95),
+                "max": latencies[-1],
+                "total": sum(latencies),
+                "bytes": sum(record.get("bytes", 0) for record in records)
+            })
+
+        return summary
+
+    @classmethod
+    def print_report(cls) -> None:
+        """ Print the summary as a table to the console. """
+        rows = [_TABLE_HEADER]
+
+        for entry in cls.get_summary():
+            rows.append((entry["kind"],
+                         entry["name"],
+                         str(entry["count"]),
+                         f"{entry['p50'] * 1000:.1f}",
+                         f"{entry['p95'] * 1000:.1f}",
+                         f"{entry['max'] * 1000:.1f}",
+                         str(entry["bytes"]) if entry["kind"] == KIND_REQUEST else "-"))
+
+        widths = [max(len(row[idx]) for row in rows) for idx in range(len(_TABLE_HEADER))]
+
+        for row in rows:
+            print("  ".join(f"{value:<{widths[idx]}}" for idx, value in enumerate(row)).rstrip())
+
+    @classmethod
+    def save_report(cls, file_path: str) -> Ret.CODE:
+        """ Save the summary and all single records to a JSON file.
+
+        Args:
+            file_path (str): The path to the JSON file.
+
+        Returns:
+            Ret.CODE: Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+        """
+        ret_status = Ret.CODE.RET_OK
+
+        try:
+            with FileHelper.open_file(file_path, 'w') as report_file:
+                report_file.write(json.dumps({
+                    "summary": cls.get_summary(),
+                    "records": cls.get_records()
+                }, indent=4))
+
+        except IOError:
+            ret_status = Ret.CODE.RET_ERROR_FILEPATH_INVALID
+
+        return ret_status
+
+    @classmethod
+    def _add(cls, record: dict) -> None:
+        """ Add a record thread-safe. """
+        with cls._lock:
+            cls._records.append(record)
+
+################################################################################
+# Functions
+################################################################################
+
+
+def get_endpoint(url: str) -> str:
+    """ Get the endpoint of a URL, which is the path without the query.
+        Issue keys and numerical IDs in the path are replaced by placeholders,
+        so that the requests to the same endpoint are grouped together.
+
+    Args:
+        url (str): The request URL.
+
+    Returns:
+        str: The endpoint, e.g. /rest/api/2/issue/{key}/worklog.
+    """
+    segments = []
+
+    for segment in urlparse(url).path.split("/"):
+        if _ISSUE_KEY_PATTERN.match(segment):
+            segment = "{key}"
+        elif _ID_PATTERN.match(segment) and \
+                ((0 == len(segments)) or (segments[-1] not in _VERSIONED_APIS)):
+            segment = "{id}"
+
+        segments.append(segment)
+
+    return "/".join(segments)
+
+
+def _percentile(sorted_values: list[float], percent: int) -> float:
+    """ Get the percentile of sorted values by the nearest-rank method.
+
+    Args:
+        sorted_values (list[float]): The values in ascending order. Must not be empty.
+        percent (int): The percentile in the range 1 to 100.
+
+    Returns:
+        float: The percentile value.
+    """
+    rank = math.ceil(percent / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
@@ -0,0 +1,279 @@
+""" Records all HTTP traffic of the server sessions and saves it
+    as HAR (HTTP Archive) trace file for offline analysis. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import base64
+import datetime
+import json
+import threading
+import time
+from urllib.parse import parse_qsl, urlparse
+
+from pyJiraCli.file_helper import FileHelper
+from pyJiraCli.ret import Ret
+from pyJiraCli.version import __version__
+
+################################################################################
+# Variables
+################################################################################
+
+HAR_VERSION = "1.2"
+
+# Headers whose values are never written to the trace file.
+REDACTED_HEADERS = ("authorization", "proxy-authorization", "cookie", "set-cookie")
+REDACTED_VALUE = "REDACTED"
+
+################################################################################
+# Classes
+################################################################################
+
+
+class TraceFile:
+    """ Records all HTTP requests and responses in the HAR (HTTP Archive) format.
+        The entries are collected for all instances of the class,
+        but only if the trace is enabled.
+    """
+    _enabled = False
+    _lock = threading.Lock()
+    _entries = []
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def enable(cls) -> None:
+        """ Enable recording of the trace for all instances of the class. """
+        cls._enabled = True
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """ Check whether the trace is recorded.
+
+        Returns:
+            bool: True if the trace is recorded, otherwise False.
+        """
+        return cls._enabled
+
+    @classmethod
+    def reset(cls) -> None:
+        """ Remove all entries. """
+        with cls._lock:
+            cls._entries = []
+
+    @classmethod
+    def record_response(cls, response, *_args, **kwargs) -> None:
+        """ Record a HTTP request and its response as HAR entry.
+            Used as response hook of a requests session.
+
+        Args:
+            response (requests.Response): The received response.
+            kwargs: The arguments the request was sent with.
+        """
+        if cls._enabled is False:
+            return
+
+        wait = response.elapsed.total_seconds() * 1000
+        started = datetime.datetime.now(datetime.timezone.utc) - response.elapsed
+
+        # Reading the body is measured as receive time. Streamed bodies are not consumed.
+        receive = 0.0
+        content = None
+
+        if kwargs.get("stream", False) is False:
+            start = time.perf_counter()
+            content = response.content
+            receive = (time.perf_counter() - start) * 1000
+
+        entry = {
+            "startedDateTime": started.isoformat(),
+            "time": wait + receive,
+            "request": _get_har_request(response.request),
+            "response": _get_har_response(response, content),
+            "cache": {},
+            "timings": {
+                "blocked": -1,
+                "dns": -1,
+                "connect": -1,
+                "ssl": -1,
+                "send": 0,
+                "wait": wait,
+                "receive": receive
+            }
+        }
+
+        with cls._lock:
+            cls._entries.append(entry)
+
+    @classmethod
+    def get_har(cls) -> dict:
+        """ Get the recorded entries as HAR log.
+
+        Returns:
+            dict: The HAR log.
+        """
+        with cls._lock:
+            entries = list(cls._entries)
+
+        return {
+            "log": {
+                "version": HAR_VERSION,
+                "creator": {
+                    "name": "pyJiraCli",
+                    "version": __version__
+                },
+                "pages": [],
+                "entries": entries
+            }
+        }
+
+    @classmethod
+    def save(cls, file_path: str) -> Ret.CODE:
+        """ Save the recorded entries to a HAR file.
+
+        Args:
+            file_path (str): The path to the HAR file.
+
+        Returns:
+            Ret.CODE: Returns Ret.CODE.RET_OK if successful or else the corresponding error code.
+        """
+        ret_status = Ret.CODE.RET_OK
+
+        try:
+            with FileHelper.open_file(file_path, 'w') as trace_file:
+                trace_file.write(json.dumps(cls.get_har(), indent=4, ensure_ascii=False))
+
+        except IOError:
+            ret_status = Ret.CODE.RET_ERROR_FILEPATH_INVALID
+
+        return ret_status
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _get_har_headers(headers) -> list[dict]:
+    """ Convert the headers to HAR headers and redact the credentials.
+
+    Args:
+        headers (dict): The HTTP headers.
+
+    Returns:
+        list[dict]: The HAR headers.
+    """
+    har_headers = []
+
+    for name, value in headers.items():
+        if name.lower() in REDACTED_HEADERS:
+            value = REDACTED_VALUE
+
+        har_headers.append({"name": name, "value": value})
+
+    return har_headers
+
+
+def _get_har_request(request) -> dict:
+    """ Convert a prepared request to a HAR request.
+
+    Args:
+        request (requests.PreparedRequest): The sent request.
+
+    Returns:
+        dict: The HAR request.
+    """
+    body = request.body
+
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+
+    har_request = {
+        "method": request.method,
+        "url": request.url,
+        "httpVersion": "HTTP/1.1",
+        "cookies": [],
+        "headers": _get_har_headers(request.headers),
+        "queryString": [{"name": name, "value": value}
+                        for name, value in parse_qsl(urlparse(request.url).query,
+                                                     keep_blank_values=True)],
+        "headersSize": -1,
+        "bodySize": len(body) if isinstance(body, str) else 0
+    }
+
+    if isinstance(body, str):
+        har_request["postData"] = {
+            "mimeType": request.headers.get("Content-Type", ""),
+            "text": body
+        }
+
+    return har_request
+
+
+def _get_har_response(response, content: bytes) -> dict:
+    """ Convert a response to a HAR response.
+
+    Args:
+        response (requests.Response): The received response.
+        content (bytes): The response body or None if it was streamed.
+
+    Returns:
+        dict: The HAR response.
+    """
+    har_content = {
+        "size": int(response.headers.get("Content-Length", 0)),
+        "mimeType": response.headers.get("Content-Type", "")
+    }
+
+    if content is not None:
+        har_content["size"] = len(content)
+
+        try:
+            har_content["text"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            har_content["text"] = base64.b64encode(content).decode("ascii")
+            har_content["encoding"] = "base64"
+    else:
+        har_content["comment"] = "Streamed body, not recorded."
+
+    return {
+        "status": response.status_code,
+        "statusText": response.reason or "",
+        "httpVersion": "HTTP/1.1",
+        "cookies": [],
+        "headers": _get_har_headers(response.headers),
+        "content": har_content,
+        "redirectURL": response.headers.get("Location", ""),
+        "headersSize": -1,
+        "bodySize": har_content["size"]
+    }
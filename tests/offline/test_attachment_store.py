@@ -0,0 +1,106 @@
+"""
+Tests for the content-addressed store of attachments.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import hashlib
+import json
+import os
+
+from pyJiraCli.attachment_store import AttachmentStore, INDEX_FILE, OBJECTS_DIR
+from pyJiraCli.jira_server import Server
+from pyJiraCli.ret import Ret
+from tests.tools.jira_stub_server import JiraStubDataset, JiraStubServer, ATTACHMENT_FILES
+
+################################################################################
+# Variables
+################################################################################
+
+NUMBER_OF_ISSUES = 20
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_download(tmp_path):
+    """ Every file content is stored once and downloaded attachments are skipped. """
+    stub = JiraStubServer(JiraStubDataset(issues=NUMBER_OF_ISSUES, custom_fields=0,
+                                          attachments=2))
+    stub.start()
+
+    try:
+        server = Server(jobs=4)
+        assert Ret.CODE.RET_OK == server.login(None, stub.url, "DummyToken", None, None)
+        issues = list(server.iter_search_raw("project = STUB", 0, ["attachment"]))
+
+        store = AttachmentStore(str(tmp_path))
+        store.load()
+
+        for issue in issues:
+            store.add_issue(issue)
+
+        assert (Ret.CODE.RET_OK, 2 * NUMBER_OF_ISSUES) == store.download(server)
+        store.save()
+
+        files = [os.path.join(directory, file_name)
+                 for directory, _, file_names in os.walk(tmp_path / OBJECTS_DIR)
+                 for file_name in file_names]
+        assert len(files) <= len(ATTACHMENT_FILES)
+
+        for file_path in files:
+            with open(file_path, "rb") as file:
+                assert os.path.basename(file_path) == hashlib.sha256(file.read()).hexdigest()
+
+        with open(tmp_path / INDEX_FILE, "r", encoding="utf-8") as index_file:
+            assert 2 * NUMBER_OF_ISSUES == len(json.load(index_file))
+
+        # A second run downloads nothing.
+        requests_before = stub.request_count
+        store = AttachmentStore(str(tmp_path))
+        store.load()
+
+        for issue in issues:
+            store.add_issue(issue)
+
+        assert (Ret.CODE.RET_OK, 0) == store.download(server)
+        assert requests_before == stub.request_count
+
+    finally:
+        stub.stop()
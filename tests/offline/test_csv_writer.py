@@ -0,0 +1,96 @@
+"""
+Tests for the CSV writer.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import os
+
+from pyJiraCli.csv_writer import CsvWriter, compile_field_path
+
+################################################################################
+# Variables
+################################################################################
+
+FIELDS = {
+    "summary": "Summary",
+    "assignee": {"name": "dave", "displayName": "Dave"},
+    "components": [{"name": "Backend"}, {"name": "Frontend"}],
+    "labels": ["api", "db"],
+    "customfield_10000": {"id": "1", "value": "Red"},
+    "customfield_10001": 5.0,
+    "parent": None
+}
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_compile_field_path():
+    """ The paths select fields, attributes and array elements. """
+    assert compile_field_path("summary")(FIELDS) == "Summary"
+    assert compile_field_path("assignee.displayName")(FIELDS) == "Dave"
+    assert compile_field_path("components.name")(FIELDS) == ["Backend", "Frontend"]
+    assert compile_field_path("components.1.name")(FIELDS) == "Frontend"
+    assert compile_field_path("components.2.name")(FIELDS) is None
+    assert compile_field_path("parent.key")(FIELDS) is None
+    assert compile_field_path("unknown.value")(FIELDS) is None
+
+
+def test_get_search_fields():
+    """ Only the fields of the paths are requested, once per field. """
+    assert CsvWriter.get_search_fields(["assignee.name", "assignee.displayName", "labels"]) == \
+        ["assignee", "labels"]
+
+
+def test_write_issues(tmp_path):
+    """ The issues are written as rows with a header. """
+    file_path = os.path.join(tmp_path, "search.csv")
+    paths = ["assignee", "components.name", "labels", "customfield_10000.value",
+             "customfield_10001", "parent"]
+
+    with CsvWriter(file_path, paths) as writer:
+        writer.write_issue({"key": "STUB-1", "fields": FIELDS})
+
+    with open(file_path, encoding="UTF-8") as file:
+        lines = file.read().splitlines()
+
+    assert lines == ["key,assignee,components.name,labels,customfield_10000.value,"
+                     "customfield_10001,parent",
+                     "STUB-1,dave,Backend;Frontend,api;db,Red,5.0,"]
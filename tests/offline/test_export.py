@@ -0,0 +1,104 @@
+"""
+Tests for the export of issues.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import json
+import os
+
+from pyJiraCli.__main__ import add_parser
+from pyJiraCli.export_manifest import ExportManifest
+from pyJiraCli.issue_store import to_store_datetime
+from pyJiraCli.jira_server import Server
+from pyJiraCli.ret import Ret
+from tests.tools.jira_stub_server import MAX_RESULTS_LIMIT, JiraStubDataset, JiraStubServer
+
+################################################################################
+# Variables
+################################################################################
+
+NUMBER_OF_ISSUES = 250
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_incremental_update_during_search(tmp_path):
+    """ An issue updated between the pages of the search shifts no other issue out of
+        the search, and is exported again by the next incremental export. """
+    stub = JiraStubServer(JiraStubDataset(issues=NUMBER_OF_ISSUES, custom_fields=0))
+    changed = min(stub.dataset.issues, key=lambda issue: issue["fields"]["updated"])
+    pages = []
+
+    def update_after_first_page(response, *_args, **_kwargs):
+        if "/search" in response.url:
+            pages.append(response.url)
+
+            if 1 == len(pages):
+                with stub.lock:
+                    stub.dataset.update_issue(changed, {"summary": "Changed"})
+
+    stub.start()
+    Server.add_response_hook(update_after_first_page)
+
+    try:
+        args = add_parser().parse_args(["export", "--server", stub.url, "--token", "Token",
+                                        "--dir", str(tmp_path), "--incremental",
+                                        "--jql", "project = STUB"])
+
+        assert Ret.CODE.RET_OK == args.func(args)
+        assert NUMBER_OF_ISSUES // MAX_RESULTS_LIMIT < len(pages)
+
+        for issue in stub.dataset.issues:
+            assert os.path.isfile(tmp_path / f"{issue['key']}.json")
+
+        manifest = ExportManifest(str(tmp_path))
+        manifest.load()
+        assert manifest.get_last_updated("project = STUB") < \
+            to_store_datetime(changed["fields"]["updated"])
+
+        assert Ret.CODE.RET_OK == args.func(args)
+
+        with open(tmp_path / f"{changed['key']}.json", "r", encoding="utf-8") as file:
+            assert "Changed" == json.load(file)["fields"]["summary"]
+
+    finally:
+        Server._response_hooks.remove(update_after_first_page)  # pylint: disable=protected-access
+        stub.stop()
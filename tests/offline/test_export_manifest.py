@@ -0,0 +1,104 @@
+"""
+Tests for the manifest of an incremental directory export.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import pytest
+
+from pyJiraCli.export_manifest import ExportManifest, MANIFEST_FILE, get_content_hash
+
+################################################################################
+# Variables
+################################################################################
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_manifest(tmp_path):
+    """ The issues and the high-water marks are saved and loaded again. """
+    manifest = ExportManifest(str(tmp_path))
+    manifest.load()
+
+    assert manifest.get_last_updated("project = A") is None
+    assert manifest.is_unchanged("A-1", get_content_hash("{}")) is False
+
+    manifest.set_issue("A-1", "2024-01-01T10:00:00.000+0100", get_content_hash("{}"))
+    manifest.set_last_updated("project = A", "2024-01-01 09:00:00")
+    manifest.set_last_updated("project = A", "2023-12-31 09:00:00")
+    manifest.set_last_updated("project = A", None)
+    manifest.save()
+
+    loaded = ExportManifest(str(tmp_path))
+    loaded.load()
+
+    assert loaded.get_last_updated("project = A") == "2024-01-01 09:00:00"
+    assert loaded.is_unchanged("A-1", get_content_hash("{}")) is True
+    assert loaded.is_unchanged("A-1", get_content_hash('{"key": "A-1"}')) is False
+    assert [path.name for path in tmp_path.iterdir()] == [MANIFEST_FILE]
+
+
+def test_manifest_invalid(tmp_path):
+    """ A file which is no manifest is rejected. """
+    (tmp_path / MANIFEST_FILE).write_text("[]", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        ExportManifest(str(tmp_path)).load()
+
+
+def test_manifest_merge(tmp_path):
+    """ The merged manifest has the issues of all shards and the earliest
+        high-water mark of the queries exported by every shard. """
+    shards = []
+
+    for index, last_updated in enumerate(["2024-01-02 09:00:00", "2024-01-01 09:00:00"]):
+        shard = ExportManifest(str(tmp_path))
+        shard.set_issue(f"A-{index}", "2024-01-01T10:00:00.000+0100", get_content_hash("{}"))
+        shard.set_last_updated("project = A", last_updated)
+        shard.set_last_updated(f"project = B{index}", last_updated)
+        shards.append(shard)
+
+    manifest = ExportManifest(str(tmp_path))
+    manifest.merge(shards)
+
+    assert manifest.get_last_updated("project = A") == "2024-01-01 09:00:00"
+    assert manifest.get_last_updated("project = B0") is None
+    assert manifest.is_unchanged("A-0", get_content_hash("{}")) is True
+    assert manifest.is_unchanged("A-1", get_content_hash("{}")) is True
@@ -0,0 +1,107 @@
+"""
+Tests for the file helper.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import gzip
+import os
+
+import pytest
+
+from pyJiraCli.file_helper import FileHelper
+from pyJiraCli.ret import Ret
+
+################################################################################
+# Variables
+################################################################################
+
+CONTENT = '{"key": "STUB-1", "summary": "Äpfel"}\n' * 100
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_process_file_argument_keeps_compression():
+    """ The compression extension is kept and a wrong inner extension is replaced. """
+    assert FileHelper.process_file_argument("STUB-1", "out.json.gz") == \
+        (Ret.CODE.RET_OK, "out.json.gz")
+    assert FileHelper.process_file_argument("STUB-1", "out.txt.zst") == \
+        (Ret.CODE.RET_OK, "out.json.zst")
+    assert FileHelper.process_file_argument("STUB-1", "out.txt") == \
+        (Ret.CODE.RET_OK, "out.json")
+
+
+def test_is_json_file():
+    """ Plain and compressed JSON files are accepted. """
+    assert FileHelper.is_json_file("issues.json")
+    assert FileHelper.is_json_file("issues.json.gz")
+    assert FileHelper.is_json_file("issues.json.zst")
+    assert not FileHelper.is_json_file("issues.gz")
+    assert not FileHelper.is_json_file("issues.txt")
+
+
+def test_open_file_gzip(tmp_path):
+    """ A .gz file is compressed while writing and decompressed while reading. """
+    file_path = os.path.join(tmp_path, "issues.json.gz")
+
+    with FileHelper.open_file(file_path, "w") as file:
+        file.write(CONTENT)
+
+    with gzip.open(file_path, "rt", encoding="UTF-8") as file:
+        assert file.read() == CONTENT
+
+    with FileHelper.open_file(file_path, "r") as file:
+        assert file.read() == CONTENT
+
+    assert os.path.getsize(file_path) < len(CONTENT)
+
+
+def test_open_file_zstd(tmp_path):
+    """ A .zst file is compressed while writing and decompressed while reading. """
+    pytest.importorskip("zstandard")
+    file_path = os.path.join(tmp_path, "issues.json.zst")
+
+    with FileHelper.open_file(file_path, "w") as file:
+        file.write(CONTENT)
+
+    with FileHelper.open_file(file_path, "r") as file:
+        assert file.read() == CONTENT
+
+    assert os.path.getsize(file_path) < len(CONTENT)
@@ -0,0 +1,176 @@
+"""
+Tests for the local issue mirror.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import os
+
+import pytest
+
+from pyJiraCli.issue_store import IssueStore, META_FIELDS, META_TIME_ZONE, to_store_datetime
+from pyJiraCli.jql import JqlSyntaxError
+
+################################################################################
+# Variables
+################################################################################
+
+JQL = "project = STUB"
+
+FIELDS = [
+    {"id": "status", "name": "Status", "clauseNames": ["status"], "schema": {"type": "status"}},
+    {"id": "labels", "name": "Labels", "clauseNames": ["labels"], "schema": {"type": "array"}},
+    {"id": "customfield_10100", "name": "Story Points", "clauseNames": ["cf[10100]"],
+     "schema": {"type": "number"}}
+]
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _get_issue(key: str, summary: str, updated: str, **fields) -> dict:
+    """ Get the raw data of an issue. """
+    return {"id": key.split("-")[1], "key": key,
+            "fields": {"project": {"key": "STUB"}, "summary": summary, "updated": updated,
+                       **fields}}
+
+
+def test_to_store_datetime():
+    """ The Jira timestamps are converted to UTC. """
+    assert to_store_datetime("2024-01-01T10:00:00.000+0100") == "2024-01-01 09:00:00"
+    assert to_store_datetime("invalid") is None
+    assert to_store_datetime(None) is None
+
+
+def test_upsert_issues(tmp_path):
+    """ Changed issues are replaced and the high-water mark only advances
+        when a synchronization completes. """
+    file_path = os.path.join(tmp_path, "issues.sqlite")
+
+    with IssueStore(file_path) as store:
+        assert store.get_last_updated(JQL) is None
+
+        store.upsert_issues([_get_issue("STUB-1", "First", "2024-01-02T00:00:00.000+0000"),
+                             _get_issue("STUB-2", "Second", "2024-01-01T00:00:00.000+0000")])
+
+        assert store.get_last_updated(JQL) is None
+
+        store.set_synced(JQL, "2024-01-02 00:00:00")
+
+        assert store.get_last_updated(JQL) == "2024-01-02 00:00:00"
+
+        store.upsert_issues([_get_issue("STUB-2", "Changed", "2024-01-01T12:00:00.000+0000")])
+        store.set_synced(JQL, "2024-01-01 12:00:00")
+        store.set_synced(JQL, None)
+
+        assert store.get_last_updated(JQL) == "2024-01-02 00:00:00"
+        assert store.get_issue_count() == 2
+
+    # The data is kept after reopening.
+    with IssueStore(file_path) as store:
+        assert store.get_last_updated(JQL) == "2024-01-02 00:00:00"
+        assert store.get_last_updated("project = OTHER") is None
+        assert store.get_issue_count() == 2
+
+
+def test_query(tmp_path):
+    """ The JQL subset is evaluated with the field catalogue and the time zone of the user. """
+    with IssueStore(os.path.join(tmp_path, "issues.sqlite")) as store:
+        store.upsert_issues([
+            _get_issue("STUB-1", "Login fails", "2024-01-01T23:30:00.000+0000",
+                       status={"name": "Open"}, labels=["api"], customfield_10100=3),
+            _get_issue("STUB-2", "Export is slow", "2024-01-02T10:00:00.000+0000",
+                       status={"name": "Done"}, labels=[], customfield_10100=8),
+            _get_issue("STUB-10", "Login is slow", "2024-01-03T10:00:00.000+0000",
+                       status={"name": "Open"}, labels=["api", "ui"], customfield_10100=None)])
+        store.set_meta(META_FIELDS, FIELDS)
+        store.set_meta(META_TIME_ZONE, "Europe/Berlin")
+
+        def query(jql: str) -> list[str]:
+            return [issue["key"] for issue in store.query(jql)]
+
+        assert query("") == ["STUB-1", "STUB-2", "STUB-10"]
+        assert query("status = open ORDER BY key DESC") == ["STUB-10", "STUB-1"]
+        assert query("labels = API AND summary ~ login") == ["STUB-1", "STUB-10"]
+        assert query("labels not in (ui)") == ["STUB-1"]
+        assert query("labels is empty OR \"Story Points\" > 5") == ["STUB-2"]
+        assert query("cf[10100] is empty") == ["STUB-10"]
+        assert query("key > STUB-1 AND NOT status = done") == ["STUB-10"]
+
+        # 23:30 UTC is already the next day in Berlin.
+        assert query('updated >= "2024/01/02"') == ["STUB-1", "STUB-2", "STUB-10"]
+        assert query('updated <= "2024-01-02 11:00" ORDER BY updated DESC') == ["STUB-2", "STUB-1"]
+        assert [issue["key"] for issue in store.query("status = open", 1)] == ["STUB-1"]
+
+        with pytest.raises(JqlSyntaxError):
+            query("unknown = 1")
+
+        with pytest.raises(JqlSyntaxError):
+            query("cf[10100] = many")
+
+
+def test_text_index(tmp_path):
+    """ The text index is filled with the stored issues and follows replaced issues. """
+    with IssueStore(os.path.join(tmp_path, "issues.sqlite")) as store:
+        store.upsert_issues([
+            _get_issue("STUB-1", "Login fails", "2024-01-01T00:00:00.000+0000",
+                       description="Timeout of the login after 30 s."),
+            _get_issue("STUB-2", "Export is slow", "2024-01-01T00:00:00.000+0000",
+                       comment={"comments": [{"body": "Maybe the login-timeout?"}]})])
+
+        with pytest.raises(JqlSyntaxError):
+            list(store.query("", text="login"))
+
+        store.enable_text_index()
+
+        def query(jql: str, text: str) -> list[str]:
+            return [issue["key"] for issue in store.query(jql, text=text)]
+
+        # Matches in the summary rank higher.
+        assert query("", "LOGIN timeout") == ["STUB-1", "STUB-2"]
+        assert query("summary ~ slow", "time*") == ["STUB-2"]
+
+        store.upsert_issues([_get_issue("STUB-1", "Logout fails",
+                                        "2024-01-02T00:00:00.000+0000")])
+
+        assert query("", "login") == ["STUB-2"]
+        assert query("", "logout") == ["STUB-1"]
+
+    with IssueStore(os.path.join(tmp_path, "issues.sqlite")) as store:
+        assert store.has_text_index() is True
@@ -0,0 +1,119 @@
+"""
+Tests for the parser of the JQL subset.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import datetime
+
+import pytest
+
+from pyJiraCli.jql import parse, JqlSyntaxError, EMPTY, get_keyset_jql, get_updated_since_jql, \
+    get_window_jqls, to_jql_datetime
+
+################################################################################
+# Variables
+################################################################################
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_parse():
+    """ AND binds stronger than OR, the operators and keywords are not case sensitive. """
+    condition, order_by = parse('project = STUB and (status IN (Open, "In Progress") '
+                                'or assignee is not empty) Order By updated desc, key')
+
+    assert condition == ("and", ("clause", "project", "=", "STUB"),
+                         ("or", ("clause", "status", "in", ["Open", "In Progress"]),
+                          ("clause", "assignee", "is not", EMPTY)))
+    assert order_by == [("updated", True), ("key", False)]
+
+    assert parse('NOT summary ~ "say \\"hi\\""') == \
+        (("not", ("clause", "summary", "~", 'say "hi"')), [])
+    assert parse("ORDER BY key") == (None, [("key", False)])
+    assert parse("labels not in (a, b)")[0] == ("clause", "labels", "not in", ["a", "b"])
+
+
+@pytest.mark.parametrize("jql", [
+    "assignee = currentUser()",
+    "status was Open",
+    "status = ",
+    "(status = Open",
+    "status = Open)",
+    "status is Open",
+    "ORDER key"
+])
+def test_parse_errors(jql):
+    """ Invalid and unsupported queries are rejected. """
+    with pytest.raises(JqlSyntaxError):
+        parse(jql)
+
+
+def test_updated_since():
+    """ The ORDER BY clause is replaced and the time is converted to the user's time zone. """
+    timestamp = datetime.datetime(2024, 1, 1, 23, 30, tzinfo=datetime.timezone.utc)
+
+    assert to_jql_datetime(timestamp, "Europe/Berlin") == "2024/01/02 00:30"
+    assert to_jql_datetime(timestamp, None) == "2024/01/01 09:30"
+    assert get_updated_since_jql('summary ~ "order by" ORDER BY key', "2024/01/02 00:30") == \
+        '(summary ~ "order by") AND updated >= "2024/01/02 00:30" ORDER BY updated ASC'
+    assert get_updated_since_jql("ORDER BY key", None) == "ORDER BY updated ASC"
+
+
+def test_keyset():
+    """ Every page continues after the last ID of the previous page, ordered by the ID. """
+    assert get_keyset_jql("project = STUB ORDER BY key DESC", None) == \
+        "project = STUB ORDER BY id ASC"
+    assert get_keyset_jql("project = STUB OR type = Bug", "10042") == \
+        "(project = STUB OR type = Bug) AND id > 10042 ORDER BY id ASC"
+    assert get_keyset_jql("", "10042") == "id > 10042 ORDER BY id ASC"
+
+
+def test_windows():
+    """ The windows do not overlap and cover the dates before, between and after
+        the boundaries and the issues without date. The ORDER BY clause is kept. """
+    assert get_window_jqls("project = STUB ORDER BY key", "created",
+                           ["2024/01/01 00:00", "2024/02/01 00:00"]) == [
+        '(project = STUB) AND created < "2024/01/01 00:00" ORDER BY key',
+        '(project = STUB) AND created >= "2024/01/01 00:00" AND created < "2024/02/01 00:00" '
+        'ORDER BY key',
+        '(project = STUB) AND created >= "2024/02/01 00:00" ORDER BY key',
+        "(project = STUB) AND created IS EMPTY ORDER BY key"]
+    assert get_window_jqls("", "resolved", []) == ["resolved IS NOT EMPTY", "resolved IS EMPTY"]
@@ -0,0 +1,92 @@
+"""
+Tests for the JSON serializer.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import io
+import json
+
+from pyJiraCli.json_serializer import JsonSerializer
+
+################################################################################
+# Variables
+################################################################################
+
+DATA = {
+    "key": "STUB-1",
+    "fields": {"summary": "Äpfel & Birnen", "customfield_10000": 1.5, "labels": [], "parent": None},
+    "issues": [{"key": "STUB-2"}, {"key": "STUB-3"}],
+    1: "non string key"
+}
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_dumps_indented():
+    """ The indented output is identical to the standard library. """
+    assert JsonSerializer.dumps(DATA) == json.dumps(DATA, indent=4, ensure_ascii=False)
+
+
+def test_dumps_compact():
+    """ The compact output has no whitespace and parses to the same data. """
+    text = JsonSerializer.dumps(DATA, compact=True)
+
+    assert "\n" not in text
+    assert ": " not in text
+    assert json.loads(text) == json.loads(json.dumps(DATA))
+
+
+def test_dump_load_roundtrip():
+    """ Writing to and reading from a file object keeps the data. """
+    file = io.StringIO()
+    JsonSerializer.dump(DATA, file)
+    file.seek(0)
+
+    assert JsonSerializer.load(file) == json.loads(json.dumps(DATA))
+
+
+def test_loads_invalid():
+    """ Invalid JSON raises a ValueError with every backend. """
+    try:
+        JsonSerializer.loads("{invalid")
+        assert False
+    except ValueError:
+        pass
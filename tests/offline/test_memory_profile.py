@@ -0,0 +1,124 @@
+"""
+Tests for the memory profile at the command phases.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from pyJiraCli.memory_profile import MemoryProfile
+from pyJiraCli.timings import Timings
+
+################################################################################
+# Variables
+################################################################################
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_memory_profile():
+    """ Test the checkpoints at the end of the outermost phases. """
+    MemoryProfile.reset()
+    MemoryProfile.enable()
+    Timings.add_phase_hook(MemoryProfile.record_phase)
+
+    try:
+        with Timings.phase("enrich"):
+            retained = [bytearray(1024 * 1024)]
+
+            for _ in range(3):
+                with Timings.phase("worklogs"):
+                    retained.append(bytearray(1024 * 1024))
+
+        checkpoints = MemoryProfile.get_checkpoints()
+
+        # Nested phases are no checkpoints.
+        assert ["enrich"] == [checkpoint["name"] for checkpoint in checkpoints]
+        assert checkpoints[0]["retained"] >= 4 * 1024 * 1024
+        assert checkpoints[0]["peak"] >= checkpoints[0]["retained"]
+
+        # The allocations of this test are the top site.
+        assert "test_memory_profile.py" in checkpoints[0]["sites"][0]["site"]
+        assert len(retained) == 4
+
+    finally:
+        MemoryProfile.disable()
+
+
+def test_memory_profile_workers():
+    """ Test that the phases of worker threads are no checkpoints. """
+    MemoryProfile.reset()
+    MemoryProfile.enable()
+    Timings.add_phase_hook(MemoryProfile.record_phase)
+
+    def _work(_index):
+        with Timings.phase("serialize"):
+            return bytearray(1024)
+
+    try:
+        with Timings.phase("export"):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                assert 8 == len(list(executor.map(_work, range(8))))
+
+        assert ["export"] == [checkpoint["name"] for checkpoint in MemoryProfile.get_checkpoints()]
+
+    finally:
+        MemoryProfile.disable()
+
+def test_memory_profile_pages():
+    """ Test the checkpoints of the search pages of Jira Server and Jira Cloud. """
+    MemoryProfile.reset()
+    MemoryProfile.enable()
+
+    try:
+        for endpoint in ["search", "search/jql", "issue/STUB-1"]:
+            url = f"http://localhost:2990/jira/rest/api/2/{endpoint}?jql=project%20%3D%20STUB"
+            MemoryProfile.record_response(SimpleNamespace(request=SimpleNamespace(url=url)))
+
+        assert ["search page 1", "search page 2"] == \
+            [checkpoint["name"] for checkpoint in MemoryProfile.get_checkpoints()]
+
+    finally:
+        MemoryProfile.disable()
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,157 @@
+"""
+Tests for the migration between two Jira servers.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import json
+
+from pyJiraCli.__main__ import add_parser
+from pyJiraCli.cmd_migrate import get_field_map
+from pyJiraCli.ret import Ret
+from tests.tools.jira_stub_server import JiraStubDataset, JiraStubServer
+
+################################################################################
+# Variables
+################################################################################
+
+NUMBER_OF_ISSUES = 120
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_field_map():
+    """ Custom fields are mapped by name, system fields by ID, read-only fields are skipped. """
+    source_fields = [{"id": "summary", "name": "Summary", "custom": False},
+                     {"id": "issuetype", "name": "Issue Type", "custom": False},
+                     {"id": "status", "name": "Status", "custom": False},
+                     {"id": "labels", "name": "Labels", "custom": False},
+                     {"id": "customfield_1", "name": "Team", "custom": True},
+                     {"id": "customfield_2", "name": "Legacy", "custom": True}]
+    target_fields = [{"id": "summary", "name": "Summary", "custom": False},
+                     {"id": "issuetype", "name": "Issue Type", "custom": False},
+                     {"id": "status", "name": "Status", "custom": False},
+                     {"id": "labels", "name": "Labels", "custom": False},
+                     {"id": "customfield_9", "name": "team", "custom": True}]
+
+    assert get_field_map(source_fields, target_fields, None) == {
+        "summary": "summary", "issuetype": "issuetype", "labels": "labels",
+        "customfield_1": "customfield_9"}
+    assert get_field_map(source_fields, target_fields, ["Team"]) == {
+        "summary": "summary", "issuetype": "issuetype", "customfield_1": "customfield_9"}
+
+
+def test_migrate(tmp_path):
+    """ All issues are created on the target, the sub-tasks with their migrated parents.
+        The fields which are not on the create screen, like the rank, are skipped.
+        A restarted migration skips the migrated issues. """
+    source = JiraStubServer(JiraStubDataset(issues=NUMBER_OF_ISSUES, custom_fields=4,
+                                            agile_fields=True))
+    target = JiraStubServer(JiraStubDataset(issues=0, custom_fields=4, agile_fields=True))
+    checkpoint_file = str(tmp_path / "checkpoint.json")
+    source.start()
+    target.start()
+
+    try:
+        args = add_parser().parse_args(["migrate",
+                                        "--from-server", source.url, "--from-token", "Token",
+                                        "--to-server", target.url, "--to-token", "Token",
+                                        "--jql", "project = STUB ORDER BY key DESC",
+                                        "--checkpoint", checkpoint_file, "--jobs", "3"])
+
+        assert Ret.CODE.RET_OK == args.func(args)
+
+        with open(checkpoint_file, "r", encoding="utf-8") as file:
+            keys = json.load(file)["issues"]
+
+        assert NUMBER_OF_ISSUES == len(keys)
+        assert NUMBER_OF_ISSUES == len(target.dataset.issues)
+
+        for issue in source.dataset.issues:
+            created = target.dataset.get_issue(keys[issue["key"]])
+            assert issue["fields"]["summary"] == created["fields"]["summary"]
+            assert issue["fields"]["customfield_10102"]["value"] == \
+                created["fields"]["customfield_10102"]["value"]
+            assert issue["fields"]["customfield_10000"][-1]["id"] == \
+                created["fields"]["customfield_10000"]
+
+            if "parent" in issue["fields"]:
+                assert keys[issue["fields"]["parent"]["key"]] == \
+                    created["fields"]["parent"]["key"]
+
+        assert Ret.CODE.RET_OK == args.func(args)
+        assert NUMBER_OF_ISSUES == len(target.dataset.issues)
+
+    finally:
+        source.stop()
+        target.stop()
+
+
+def test_migrate_nested(tmp_path):
+    """ The deferred issues are searched again, until their parents are created.
+        The issues, whose parents are not migrated at all, fail. """
+    dataset = JiraStubDataset(issues=0, custom_fields=0)
+    epic = dataset.create_issue({"summary": "Epic", "issuetype": {"id": "10001"}})
+    story = dataset.create_issue({"summary": "Story", "issuetype": {"id": "10001"},
+                                  "parent": {"key": epic["key"]}})
+    dataset.create_issue({"summary": "Sub-task", "issuetype": {"id": "10003"},
+                          "parent": {"key": story["key"]}})
+    source = JiraStubServer(dataset)
+    target = JiraStubServer(JiraStubDataset(issues=0, custom_fields=0))
+    source.start()
+    target.start()
+
+    try:
+        args = add_parser().parse_args(["migrate",
+                                        "--from-server", source.url, "--from-token", "Token",
+                                        "--to-server", target.url, "--to-token", "Token",
+                                        "--jql", f"key != {epic['key']} ORDER BY key DESC",
+                                        "--checkpoint", str(tmp_path / "checkpoint.json")])
+
+        assert Ret.CODE.RET_ERROR_CREATING_TICKET_FAILED == args.func(args)
+        assert 0 == len(target.dataset.issues)
+
+        args.jql = "project = STUB ORDER BY key DESC"
+        assert Ret.CODE.RET_OK == args.func(args)
+        assert 3 == len(target.dataset.issues)
+
+    finally:
+        source.stop()
+        target.stop()
@@ -0,0 +1,117 @@
+"""
+Tests for the Parquet writer.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import datetime
+import os
+
+import pytest
+
+from pyJiraCli.parquet_writer import ParquetWriter
+
+parquet = pytest.importorskip("pyarrow.parquet")
+
+################################################################################
+# Variables
+################################################################################
+
+COLUMNS = [
+    ("summary", "summary", "string"),
+    ("created", "created", "datetime"),
+    ("due", "customfield_10000", "date"),
+    ("points", "customfield_10001", "number"),
+    ("status", "status", "status"),
+    ("labels", "labels", "array"),
+    ("unknown", "customfield_10002", None)
+]
+
+ISSUE = {
+    "key": "STUB-1",
+    "fields": {
+        "summary": "Summary",
+        "created": "2024-01-02T03:04:05.000+0100",
+        "customfield_10000": "2024-02-03",
+        "customfield_10001": 5,
+        "status": {"id": "1", "name": "Open"},
+        "labels": ["api", "ui"],
+        "customfield_10002": {"id": "2"}
+    }
+}
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_typed_columns(tmp_path):
+    """ The fields are converted to the column types of their schema types. """
+    file_path = os.path.join(tmp_path, "search.parquet")
+
+    with ParquetWriter(file_path, COLUMNS) as writer:
+        writer.write_issue(ISSUE)
+        writer.write_issue({"key": "STUB-2", "fields": {"customfield_10001": "invalid"}})
+
+    rows = parquet.read_table(file_path).to_pylist()
+
+    assert rows[0]["key"] == "STUB-1"
+    assert rows[0]["created"] == datetime.datetime(2024, 1, 2, 2, 4, 5,
+                                                   tzinfo=datetime.timezone.utc)
+    assert rows[0]["due"] == datetime.date(2024, 2, 3)
+    assert rows[0]["points"] == 5.0
+    assert rows[0]["status"] == "Open"
+    assert rows[0]["labels"] == ["api", "ui"]
+    assert rows[0]["unknown"] == '{"id": "2"}'
+    assert rows[1] == {"key": "STUB-2", "summary": None, "created": None, "due": None,
+                       "points": None, "status": None, "labels": None, "unknown": None}
+
+
+def test_row_groups(tmp_path):
+    """ The issues are written in row groups of the given size. """
+    file_path = os.path.join(tmp_path, "search.parquet")
+
+    with ParquetWriter(file_path, COLUMNS, row_group_size=2) as writer:
+        for _ in range(5):
+            writer.write_issue(ISSUE)
+
+    metadata = parquet.ParquetFile(file_path).metadata
+
+    assert writer.close() == 5
+    assert metadata.num_rows == 5
+    assert metadata.num_row_groups == 3
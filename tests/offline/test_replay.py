@@ -0,0 +1,115 @@
+"""
+Tests for the replay of recorded HTTP responses.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import pytest
+import requests
+
+from pyJiraCli.replay import ReplayAdapter
+
+################################################################################
+# Variables
+################################################################################
+
+SERVER_URL = "http://localhost:2990/jira"
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _get_entry(method: str, url: str, status: int, text: str, body: str = None) -> dict:
+    """ Get a HAR entry with a JSON response. """
+    request = {"method": method, "url": url}
+
+    if body is not None:
+        request["postData"] = {"mimeType": "application/json", "text": body}
+
+    return {
+        "request": request,
+        "response": {
+            "status": status,
+            "statusText": "",
+            "headers": [{"name": "Content-Type", "value": "application/json"},
+                        {"name": "Content-Encoding", "value": "gzip"}],
+            "content": {"text": text}
+        }
+    }
+
+
+def test_replay():
+    """ Test that the recorded responses are served in the recorded order. """
+    session = requests.Session()
+    session.mount("http://", ReplayAdapter([
+        _get_entry("GET", f"{SERVER_URL}/rest/api/2/myself?a=1&b=2", 200, '{"name": "first"}'),
+        _get_entry("GET", f"{SERVER_URL}/rest/api/2/myself?a=1&b=2", 200, '{"name": "second"}'),
+        _get_entry("POST", f"{SERVER_URL}/rest/api/2/search", 200, '{"total": 3}',
+                   body='{"jql": "project = TESTPROJ", "maxResults": 50}')
+    ]))
+
+    # The host and the order of the query parameters are not relevant.
+    assert "first" == session.get("http://other/jira/rest/api/2/myself?b=2&a=1").json()["name"]
+    assert "second" == session.get(f"{SERVER_URL}/rest/api/2/myself?a=1&b=2").json()["name"]
+
+    # The last response is repeated.
+    assert "second" == session.get(f"{SERVER_URL}/rest/api/2/myself?a=1&b=2").json()["name"]
+
+    # JSON bodies are compared independent of the key order.
+    response = session.post(f"{SERVER_URL}/rest/api/2/search",
+                            json={"maxResults": 50, "jql": "project = TESTPROJ"})
+    assert 3 == response.json()["total"]
+
+    # Requests which were not recorded fail.
+    assert 404 == session.get(f"{SERVER_URL}/rest/api/2/serverInfo").status_code
+
+
+def test_replay_invalid(tmp_path):
+    """ A JSON file which is no HAR object is rejected. """
+    har_file = tmp_path / "trace.har"
+
+    for text in ["[]", '{"log": []}', '{"log": {"entries": {}}}']:
+        har_file.write_text(text, encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            ReplayAdapter.load(str(har_file))
+
+################################################################################
+# Main
+################################################################################
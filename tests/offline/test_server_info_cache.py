@@ -0,0 +1,110 @@
+"""
+The server info cache and the search of Jira Cloud.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import json
+import time
+
+from pyJiraCli import server_info_cache
+from pyJiraCli.jira_server import Server
+from pyJiraCli.ret import Ret
+from pyJiraCli.server_info_cache import ServerInfoCache
+from tests.tools.jira_stub_server import JiraStubDataset, JiraStubServer
+
+################################################################################
+# Variables
+################################################################################
+
+NUMBER_OF_ISSUES = 250
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_server_info_cache(tmp_path):
+    """ The server info is read from the file until it expires. An invalid file is ignored. """
+    cache_file = tmp_path / "cache" / "server_info.json"
+    server_info = {"versionNumbers": [9, 12, 0], "deploymentType": "Server"}
+
+    ServerInfoCache(str(cache_file)).set("https://jira.example.com", server_info)
+    assert server_info == ServerInfoCache(str(cache_file)).get("https://jira.example.com")
+    assert ServerInfoCache(str(cache_file)).get("https://other.example.com") is None
+
+    with open(cache_file, "r", encoding="utf-8") as file:
+        entries = json.load(file)
+
+    entries["https://jira.example.com"]["time"] = time.time() - \
+        server_info_cache.CACHE_MAX_AGE - 1
+
+    with open(cache_file, "w", encoding="utf-8") as file:
+        json.dump(entries, file)
+
+    assert ServerInfoCache(str(cache_file)).get("https://jira.example.com") is None
+
+    cache_file.write_text("no JSON", encoding="utf-8")
+    assert ServerInfoCache(str(cache_file)).get("https://jira.example.com") is None
+
+
+def test_cloud_search(tmp_path):
+    """ Jira Cloud is detected once and searched with the page tokens. """
+    stub = JiraStubServer(JiraStubDataset(issues=NUMBER_OF_ISSUES, custom_fields=4), cloud=True)
+    Server.set_server_info_cache(ServerInfoCache(str(tmp_path / "server_info.json")))
+    stub.start()
+
+    try:
+        for _ in range(2):
+            server = Server()
+            assert Ret.CODE.RET_OK == server.login(None, stub.url, "Token", None, None)
+            assert server.is_cloud() is True
+
+        # The server info was only requested by the first login, the user by both.
+        assert 3 == stub.request_count
+
+        issues = list(server.iter_search_raw("project = STUB ORDER BY key DESC", 0, ["summary"]))
+
+        assert NUMBER_OF_ISSUES == len(issues)
+        assert f"STUB-{NUMBER_OF_ISSUES}" == issues[0]["key"]
+        assert len({issue["key"] for issue in issues}) == NUMBER_OF_ISSUES
+        assert NUMBER_OF_ISSUES == server.get_approximate_count("project = STUB ORDER BY key")
+
+    finally:
+        Server.set_server_info_cache(ServerInfoCache())
+        stub.stop()
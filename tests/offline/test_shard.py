@@ -0,0 +1,112 @@
+"""
+Tests for the sharding of the work items across machines.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import os
+
+import pytest
+
+from pyJiraCli.__main__ import add_parser
+from pyJiraCli.export_manifest import MANIFEST_FILE
+from pyJiraCli.ret import Ret
+from pyJiraCli.shard import is_in_shard, parse_shard
+from tests.tools.jira_stub_server import JiraStubDataset, JiraStubServer
+
+################################################################################
+# Variables
+################################################################################
+
+NUMBER_OF_ISSUES = 60
+NUMBER_OF_SHARDS = 3
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_parse_shard():
+    """ The shard is parsed as index and count, invalid shards are rejected. """
+    assert parse_shard(None) is None
+    assert parse_shard("2/4") == (2, 4)
+    assert parse_shard(" 1 / 1 ") == (1, 1)
+
+    for value in ["0/4", "5/4", "0/0", "2", "a/b", "-1/4"]:
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+
+def test_partition():
+    """ Every item is in exactly one shard and all items are in the shard without a shard. """
+    keys = [f"STUB-{number}" for number in range(1000)]
+    shards = [[key for key in keys if is_in_shard(key, (index, NUMBER_OF_SHARDS))]
+              for index in range(1, NUMBER_OF_SHARDS + 1)]
+
+    assert sorted(sum(shards, [])) == sorted(keys)
+    assert all(200 < len(shard) for shard in shards)
+    assert all(is_in_shard(key, None) for key in keys)
+
+
+def test_export_shards(tmp_path):
+    """ The shards export disjoint issues, which are merged with their manifests. """
+    stub = JiraStubServer(JiraStubDataset(issues=NUMBER_OF_ISSUES))
+    stub.start()
+
+    try:
+        shard_dirs = [str(tmp_path / f"shard{index}") for index in range(1, NUMBER_OF_SHARDS + 1)]
+        shard_files = []
+
+        for index, shard_dir in enumerate(shard_dirs, start=1):
+            args = add_parser().parse_args(["export", "--server", stub.url, "--token", "Token",
+                                            "--jql", "project = STUB", "--dir", shard_dir,
+                                            "--incremental",
+                                            "--shard", f"{index}/{NUMBER_OF_SHARDS}"])
+            assert Ret.CODE.RET_OK == args.func(args)
+            shard_files.append(set(os.listdir(shard_dir)) - {MANIFEST_FILE})
+
+        assert NUMBER_OF_ISSUES == len(set.union(*shard_files))
+        assert NUMBER_OF_ISSUES == sum(len(files) for files in shard_files)
+
+        merged_dir = str(tmp_path / "merged")
+        args = add_parser().parse_args(["export", "--dir", merged_dir, "--merge"] + shard_dirs)
+        assert Ret.CODE.RET_OK == args.func(args)
+        assert set(os.listdir(merged_dir)) == set.union(*shard_files) | {MANIFEST_FILE}
+
+    finally:
+        stub.stop()
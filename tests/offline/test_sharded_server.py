@@ -0,0 +1,86 @@
+"""
+Tests for the search in parallel shards of a date field.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+from pyJiraCli.jira_server import Server
+from pyJiraCli.ret import Ret
+from pyJiraCli.server_info_cache import ServerInfoCache
+from pyJiraCli.sharded_server import ShardedServer
+from tests.tools.jira_stub_server import JiraStubDataset, JiraStubServer
+
+################################################################################
+# Variables
+################################################################################
+
+NUMBER_OF_ISSUES = 400
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_sharded_search(tmp_path):
+    """ The shards find the same issues as the unsharded search, every issue once. """
+    stub = JiraStubServer(JiraStubDataset(issues=NUMBER_OF_ISSUES, custom_fields=4))
+    Server.set_server_info_cache(ServerInfoCache(str(tmp_path / "server_info.json")))
+    stub.start()
+
+    try:
+        server = Server()
+        sharded_server = ShardedServer("created", 6)
+
+        for login_server in (server, sharded_server):
+            assert Ret.CODE.RET_OK == login_server.login(None, stub.url, "Token", None, None)
+
+        jql = "type = Task ORDER BY key"
+        expected = [issue["key"] for issue in server.iter_search_raw(jql, 0, ["summary"])]
+        found = [issue["key"] for issue in sharded_server.iter_search_raw(jql, 0, ["summary"])]
+
+        # The windows and the issues without date.
+        assert 7 == len(sharded_server.get_shard_jqls(jql))
+        assert sorted(expected) == sorted(found)
+        assert len(found) == len(set(found))
+
+        # The search stops at the maximum.
+        assert 25 == len(list(sharded_server.iter_search_raw(jql, 25, ["summary"])))
+
+    finally:
+        Server.set_server_info_cache(ServerInfoCache())
+        stub.stop()
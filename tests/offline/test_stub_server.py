@@ -0,0 +1,88 @@
+"""
+Tests for the Jira REST API stub server.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+from jira import JIRA
+
+from tests.tools.jira_stub_server import JiraStubDataset, JiraStubServer
+
+################################################################################
+# Variables
+################################################################################
+
+NUMBER_OF_ISSUES = 250
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_stub_server():
+    """ Test the search, create and edit endpoints of the stub server. """
+    stub = JiraStubServer(JiraStubDataset(issues=NUMBER_OF_ISSUES, custom_fields=8))
+    stub.start()
+
+    try:
+        jira = JIRA(stub.url, token_auth="DummyToken", max_retries=0)
+
+        # All issues are found over multiple pages.
+        issues = jira.search_issues("project = STUB ORDER BY key DESC",
+                                    maxResults=0, fields=["summary"])
+        assert NUMBER_OF_ISSUES == len(issues)
+        assert f"STUB-{NUMBER_OF_ISSUES}" == issues[0].key
+        assert ["summary"] == list(issues[0].raw["fields"].keys())
+
+        # Conditions are combined.
+        issues = jira.search_issues("key in (STUB-1, STUB-2, STUB-3) AND type = Sub-task")
+        assert ["STUB-2", "STUB-3"] == sorted(issue.key for issue in issues)
+
+        # Created issues can be edited.
+        issue = jira.create_issue({"project": {"key": "STUB"},
+                                   "summary": "Created",
+                                   "issuetype": {"name": "Task"}})
+        issue.update(fields={"summary": "Edited"})
+        assert "Edited" == jira.issue(issue.key).fields.summary
+
+    finally:
+        stub.stop()
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,89 @@
+"""
+Tests for the timings of the HTTP requests and command phases.
+"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+from pyJiraCli.timings import Timings, get_endpoint
+
+################################################################################
+# Variables
+################################################################################
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def test_get_endpoint():
+    """ Test that issue keys and IDs are replaced, but API versions are kept. """
+    assert "/jira/rest/api/2/issue/{key}/worklog/{id}" == \
+        get_endpoint("http://localhost:2990/jira/rest/api/2/issue/TESTPROJ-12/worklog/10001")
+    assert "/rest/agile/1.0/board/{id}/sprint" == \
+        get_endpoint("http://localhost/rest/agile/1.0/board/3/sprint?startAt=50")
+
+
+def test_phase_summary():
+    """ Test the summary of the recorded phases. """
+    Timings.reset()
+
+    # Nothing is recorded as long as the timings are disabled.
+    with Timings.phase("login"):
+        pass
+    assert [] == Timings.get_summary()
+
+    Timings.enable()
+
+    try:
+        for _ in range(3):
+            with Timings.phase("login"):
+                pass
+
+        summary = Timings.get_summary()
+        assert 1 == len(summary)
+        assert "login" == summary[0]["name"]
+        assert 3 == summary[0]["count"]
+        assert summary[0]["p50"] <= summary[0]["p95"] <= summary[0]["max"]
+
+    finally:
+        Timings.disable()
+        Timings.reset()
+
+################################################################################
+# Main
+################################################################################
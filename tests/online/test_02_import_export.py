@@ -37,6 +37,7 @@ Requires a Jira instance to be running.
 ################################################################################
 
 import json
+import os
 from pyJiraCli.ret import Ret
 from tests.conftest import Helpers
 
@@ -46,6 +47,8 @@ from tests.conftest import Helpers
 
 ISSUE_KEY = "TESTPROJ-1"
 OUTPUT_FILE_NAME = "export.json"
+OUTPUT_DIR = "export"
+FOLLOW_OUTPUT_DIR = "export_follow"
 
 ################################################################################
 # Classes
@@ -94,6 +97,32 @@ def test_import_export(helpers: Helpers):
 
     assert original_summary == exported_summary
 
+    # Export multiple issues, one file per issue.
+    ret = helpers.run_pyjiracli(
+        ["export"] + credentials + ["--dir", OUTPUT_DIR, ISSUE_KEY, "TESTPROJ-2"])
+
+    assert Ret.CODE.RET_OK == ret.returncode
+
+    with open(os.path.join(OUTPUT_DIR, f"{ISSUE_KEY}.json"), "r", encoding="UTF-8") as file:
+        assert exported == json.load(file)
+
+    assert os.path.isfile(os.path.join(OUTPUT_DIR, "TESTPROJ-2.json"))
+
+    # Export the sub-issues with their parents.
+    ret = helpers.run_pyjiracli(
+        ["export"] + credentials + ["--dir", FOLLOW_OUTPUT_DIR,
+                                    "--jql", "project = TESTPROJ AND issuetype = Sub-task",
+                                    "--follow", "parent"])
+
+    assert Ret.CODE.RET_OK == ret.returncode
+
+    for file_name in os.listdir(FOLLOW_OUTPUT_DIR):
+        with open(os.path.join(FOLLOW_OUTPUT_DIR, file_name), "r", encoding="UTF-8") as file:
+            parent = json.load(file)["fields"].get("parent")
+
+        if parent is not None:
+            assert os.path.isfile(os.path.join(FOLLOW_OUTPUT_DIR, f"{parent['key']}.json"))
+
 ################################################################################
 # Main
 ################################################################################
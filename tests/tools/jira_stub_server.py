@@ -0,0 +1,1028 @@
+""" Lightweight Jira REST API stub server with a synthetic dataset,
+    for offline end-to-end and performance tests without a Jira server. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import argparse
+import datetime
+import functools
+import json
+import random
+import re
+import threading
+import time
+import zoneinfo
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+################################################################################
+# Variables
+################################################################################
+
+STUB_CONTEXT_PATH = "/jira"
+STUB_PROJECT_KEY = "STUB"
+STUB_PROJECT_ID = "10000"
+STUB_BOARD_NAME = "STUB_BOARD"
+STUB_USER = "stub_user"
+
+# Time zone of the user, dates in JQL queries without a time zone are in this time zone.
+STUB_TIME_ZONE = "Europe/Berlin"
+STUB_VERSION = [8, 17, 1]
+
+# Maximum number of issues returned per search page, same as on a Jira server.
+MAX_RESULTS_LIMIT = 100
+
+# Start of the timestamps of the generated issues.
+DATASET_START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+JIRA_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.000%z"
+
+ISSUE_TYPES = [
+    {"id": "10001", "name": "Task", "description": "A task.", "subtask": False},
+    {"id": "10002", "name": "Bug", "description": "A problem.", "subtask": False},
+    {"id": "10003", "name": "Sub-task", "description": "A sub-task.", "subtask": True}
+]
+STATUSES = ["Open", "In Progress", "Done"]
+PRIORITIES = ["High", "Medium", "Low"]
+USERS = ["alice", "bob", "carol", "dave"]
+
+# Types of the generated custom fields, rotated over the number of custom fields.
+CUSTOM_FIELD_TYPES = ["string", "number", "option", "date"]
+
+# The custom fields of Jira Software, generated on request.
+SPRINT_FIELD = {"id": "customfield_10000", "name": "Sprint", "custom": True, "navigable": True,
+                "clauseNames": ["cf[10000]", "Sprint"],
+                "schema": {"type": "array", "items": "json", "customId": 10000,
+                           "custom": "com.pyxis.greenhopper.jira:gh-sprint"}}
+RANK_FIELD = {"id": "customfield_10001", "name": "Rank", "custom": True, "navigable": True,
+              "clauseNames": ["cf[10001]", "Rank"],
+              "schema": {"type": "any", "customId": 10001,
+                         "custom": "com.pyxis.greenhopper.jira:gh-lexo-rank"}}
+
+# The fields which are not on the create screen and are rejected by a create request.
+NOT_ON_CREATE_SCREEN = ["created", "updated", "creator", "status", "subtasks", "issuelinks",
+                        "attachment", "comment", "worklog", RANK_FIELD["id"]]
+
+# File names and sizes of the generated attachments. Every file has the same content
+# on all issues, like a template or a logo attached many times.
+ATTACHMENT_FILES = [("screenshot.png", 256 * 1024), ("build.log", 64 * 1024),
+                    ("spec.pdf", 1024 * 1024)]
+
+_JQL_TOKEN_PATTERN = re.compile(
+    r'\s*(?:(?P<string>"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')'
+    r'|(?P<op>!=|>=|<=|!~|=|>|<|~|\(|\)|,)'
+    r'|(?P<word>[^\s=!<>~(),"\']+))')
+
+_ISSUE_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
+
+################################################################################
+# Classes
+################################################################################
+
+
+class JiraStubDataset:  # pylint: disable=too-many-instance-attributes
+    """ Synthetic Jira project with issues, custom fields, worklogs, sub-tasks,
+        issue links, attachments, components, a board and sprints.
+        The same arguments always generate the same dataset.
+
+    Args:
+        issues (int): The number of issues, including the sub-tasks.
+        custom_fields (int): The number of custom fields.
+        worklogs (int): The number of worklogs per issue.
+        subtasks (int): The number of sub-tasks per parent issue.
+        seed (int): The seed of the random generator.
+        attachments (int): The number of attachments per issue.
+        agile_fields (bool): Whether to add the Sprint and Rank fields of Jira Software.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, issues: int = 1000, custom_fields: int = 20, worklogs: int = 2,
+                 subtasks: int = 2, seed: int = 0, attachments: int = 0,
+                 agile_fields: bool = False):
+        self._random = random.Random(seed)
+        self.fields = _generate_fields(custom_fields)
+        self.custom_fields = [field for field in self.fields if field["custom"]]
+        self._agile_fields = agile_fields
+
+        if agile_fields is True:
+            self.fields += [SPRINT_FIELD, RANK_FIELD]
+        self.components = [{"id": "10100", "name": "Backend", "description": "Backend."},
+                           {"id": "10101", "name": "Frontend", "description": "Frontend."}]
+        self.sprints = [{"id": idx + 1, "name": f"Sprint {idx + 1}",
+                         "state": "closed" if idx < 2 else "active", "originBoardId": 1}
+                        for idx in range(3)]
+        self.worklogs = {}
+        self.attachments = {}
+        self.issues = []
+        self._attachment_contents = [random.Random(idx).randbytes(size) if 0 < attachments
+                                     else b"" for idx, (_, size) in enumerate(ATTACHMENT_FILES)]
+        self._attachments_per_issue = attachments
+        self._issues_by_key = {}
+        self._worklogs_per_issue = worklogs
+        self._next_number = 1
+        self._next_id = 10000
+
+        while len(self.issues) < issues:
+            parent = self._generate_issue(ISSUE_TYPES[len(self.issues) % 2])
+
+            for _ in range(min(subtasks, issues - len(self.issues))):
+                self._generate_issue(ISSUE_TYPES[2], parent)
+
+        self._generate_links()
+
+    def get_issue(self, key: str) -> dict:
+        """ Get an issue by its key or ID.
+
+        Args:
+            key (str): The issue key or ID.
+
+        Returns:
+            dict: The issue or None if not found.
+        """
+        return self._issues_by_key.get(key)
+
+    def create_issue(self, fields: dict) -> dict:
+        """ Create an issue from the fields of a create request.
+
+        Args:
+            fields (dict): The fields of the issue.
+
+        Returns:
+            dict: The created issue.
+        """
+        issue_type = _find(ISSUE_TYPES, fields.get("issuetype", {})) or ISSUE_TYPES[0]
+        parent = None
+
+        if "parent" in fields:
+            parent = self.get_issue(fields["parent"].get("key") or fields["parent"].get("id"))
+
+        issue = self._generate_issue(issue_type, parent)
+
+        for field_id, value in fields.items():
+            if field_id not in ("project", "issuetype", "parent"):
+                issue["fields"][field_id] = value
+
+        issue["fields"]["created"] = issue["fields"]["updated"] = _now()
+
+        return issue
+
+    def update_issue(self, issue: dict, fields: dict) -> None:
+        """ Update the fields of an issue and its update time.
+
+        Args:
+            issue (dict): The issue.
+            fields (dict): The changed fields.
+        """
+        issue["fields"].update(fields)
+        issue["fields"]["updated"] = _now()
+
+    def _generate_issue(self, issue_type: dict, parent: dict = None) -> dict:
+        """ Generate an issue with random field values and add it to the dataset. """
+        number = self._next_number
+        created = DATASET_START + datetime.timedelta(hours=number * 3,
+                                                     minutes=self._random.randrange(60))
+        updated = created + datetime.timedelta(hours=self._random.randrange(1, 24 * 30))
+        key = f"{STUB_PROJECT_KEY}-{number}"
+
+        fields = {
+            "project": {"id": STUB_PROJECT_ID, "key": STUB_PROJECT_KEY, "name": "Stub Project"},
+            "issuetype": dict(issue_type),
+            "summary": f"Issue {number} {self._random.choice(['login', 'export', 'search'])}",
+            "description": f"Description of issue {number}. " * self._random.randrange(1, 10),
+            "created": created.strftime(JIRA_DATE_FORMAT),
+            "updated": updated.strftime(JIRA_DATE_FORMAT),
+            "creator": _get_user(self._random.choice(USERS)),
+            "reporter": _get_user(self._random.choice(USERS)),
+            "assignee": _get_user(self._random.choice(USERS)),
+            "status": {"name": self._random.choice(STATUSES)},
+            "priority": {"name": self._random.choice(PRIORITIES)},
+            "labels": self._random.sample(["perf", "ui", "api", "db"], 2),
+            "components": [self._random.choice(self.components)],
+            "subtasks": [],
+            "issuelinks": [],
+            "attachment": [],
+            "comment": {"comments": [], "total": 0},
+            "worklog": {"startAt": 0, "maxResults": 20, "total": 0, "worklogs": []}
+        }
+
+        for field in self.custom_fields:
+            fields[field["id"]] = self._generate_custom_value(field, created)
+
+        if self._agile_fields is True:
+            fields[SPRINT_FIELD["id"]] = [dict(self.sprints[number % len(self.sprints)],
+                                               boardId=1)]
+            fields[RANK_FIELD["id"]] = f"0|i{number:05x}:"
+
+        if parent is not None:
+            fields["parent"] = {"id": parent["id"], "key": parent["key"]}
+            parent["fields"]["subtasks"].append({"id": str(self._next_id), "key": key})
+
+        issue = {"id": str(self._next_id), "key": key, "fields": fields}
+
+        self.worklogs[key] = [{
+            "id": str(self._next_id * 100 + idx),
+            "author": _get_user(self._random.choice(USERS)),
+            "started": (created + datetime.timedelta(hours=idx + 1)).strftime(JIRA_DATE_FORMAT),
+            "timeSpentSeconds": 900 * self._random.randrange(1, 16),
+            "comment": f"Work {idx + 1} on {key}."
+        } for idx in range(self._worklogs_per_issue)]
+        fields["worklog"]["total"] = len(self.worklogs[key])
+
+        for _ in range(self._attachments_per_issue):
+            fields["attachment"].append(self._generate_attachment(created))
+
+        self.issues.append(issue)
+        self._issues_by_key[issue["key"]] = issue
+        self._issues_by_key[issue["id"]] = issue
+        self._next_number += 1
+        self._next_id += 1
+
+        return issue
+
+    def _generate_attachment(self, created: datetime.datetime) -> dict:
+        """ Generate an attachment with one of the shared file contents.
+            The content URL is relative to the base URL of the server. """
+        file_idx = self._random.randrange(len(ATTACHMENT_FILES))
+        attachment_id = str(30000 + len(self.attachments))
+        filename = ATTACHMENT_FILES[file_idx][0]
+        self.attachments[attachment_id] = self._attachment_contents[file_idx]
+
+        return {
+            "id": attachment_id,
+            "filename": filename,
+            "author": _get_user(self._random.choice(USERS)),
+            "created": created.strftime(JIRA_DATE_FORMAT),
+            "size": len(self._attachment_contents[file_idx]),
+            "mimeType": "application/octet-stream",
+            "content": f"secure/attachment/{attachment_id}/{filename}"
+        }
+
+    def _generate_custom_value(self, field: dict, created: datetime.datetime) -> any:
+        """ Generate a random value matching the type of a custom field. """
+        field_type = field["schema"]["type"]
+        value = None
+
+        if "number" == field_type:
+            value = float(self._random.randrange(100))
+        elif "option" == field_type:
+            value = {"id": str(self._random.randrange(3)),
+                     "value": self._random.choice(["Red", "Green", "Blue"])}
+        elif "date" == field_type:
+            value = (created + datetime.timedelta(days=self._random.randrange(60))).strftime(
+                "%Y-%m-%d")
+        else:
+            value = f"Text {self._random.randrange(1000)}"
+
+        return value
+
+    def _generate_links(self) -> None:
+        """ Link every tenth issue to one of its predecessors. """
+        for idx in range(10, len(self.issues), 10):
+            inward = self.issues[idx]
+            outward = self.issues[self._random.randrange(idx)]
+            link_type = {"name": "Relates", "inward": "relates to", "outward": "relates to"}
+
+            inward["fields"]["issuelinks"].append({
+                "id": str(20000 + idx),
+                "type": link_type,
+                "outwardIssue": {"id": outward["id"], "key": outward["key"]}
+            })
+            outward["fields"]["issuelinks"].append({
+                "id": str(20000 + idx),
+                "type": link_type,
+                "inwardIssue": {"id": inward["id"], "key": inward["key"]}
+            })
+
+
+class JiraStubServer:  # pylint: disable=too-many-instance-attributes
+    """ Lightweight HTTP server implementing the subset of the Jira REST API
+        used by pyJiraCli on top of a synthetic dataset.
+
+    Args:
+        dataset (JiraStubDataset): The dataset served.
+        port (int): The port to listen on. 0 selects a free port.
+        latency (float): Latency in milliseconds added to every response.
+        error_rate (float): Probability in the range 0 to 1 of answering a request
+                            with a server error.
+        seed (int): The seed of the random generator for the error injection.
+        cloud (bool): Behave like Jira Cloud, which only pages the search with tokens.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, dataset: JiraStubDataset, port: int = 0, latency: float = 0,
+                 error_rate: float = 0, seed: int = 0, cloud: bool = False):
+        self.dataset = dataset
+        self.cloud = cloud
+        self.latency = latency
+        self.error_rate = error_rate
+        self.lock = threading.Lock()
+        self.random = random.Random(seed)
+        self.request_count = 0
+        self._http_server = ThreadingHTTPServer(("127.0.0.1", port), _RequestHandler)
+        self._http_server.daemon_threads = True
+        self._http_server.stub = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """ The URL of the stub server, including the context path. """
+        return f"http://127.0.0.1:{self._http_server.server_port}{STUB_CONTEXT_PATH}"
+
+    def start(self) -> None:
+        """ Serve the requests in a background thread. """
+        self._thread = threading.Thread(target=self._http_server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """ Stop serving and close the socket. """
+        self._http_server.shutdown()
+        self._http_server.server_close()
+
+    def serve_forever(self) -> None:
+        """ Serve the requests in the current thread until interrupted. """
+        self._http_server.serve_forever()
+
+    def inject_error(self) -> bool:
+        """ Count the request and decide whether it shall fail.
+
+        Returns:
+            bool: True if a server error shall be returned.
+        """
+        with self.lock:
+            self.request_count += 1
+            return self.random.random() < self.error_rate
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """ Handles the HTTP requests of the stub server. """
+    protocol_version = "HTTP/1.1"
+
+    # Headers and body are written separately. Without this, the body waits for the
+    # delayed acknowledgement of the headers and adds about 40 ms to every response.
+    disable_nagle_algorithm = True
+
+    # pylint: disable=invalid-name
+    def do_GET(self):
+        """ Handle a GET request. """
+        self._handle("GET")
+
+    def do_POST(self):
+        """ Handle a POST request. """
+        self._handle("POST")
+
+    def do_PUT(self):
+        """ Handle a PUT request. """
+        self._handle("PUT")
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def _handle(self, method: str) -> None:
+        """ Dispatch the request to the matching endpoint. """
+        stub = self.server.stub
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        request = {
+            "method": method,
+            "path": url.path,
+            # Repeated parameters like fields=a&fields=b are joined to fields=a,b.
+            "query": {name: ",".join(values) for name, values in parse_qs(url.query).items()},
+            "body": json.loads(self.rfile.read(length)) if 0 < length else None,
+            "base_url": f"http://{self.headers.get('Host')}{STUB_CONTEXT_PATH}",
+            "cloud": stub.cloud
+        }
+
+        if request["path"].startswith(STUB_CONTEXT_PATH):
+            request["path"] = request["path"][len(STUB_CONTEXT_PATH):]
+
+        if 0 < stub.latency:
+            time.sleep(stub.latency / 1000)
+
+        if "Authorization" not in self.headers:
+            self._send(401, {"errorMessages": ["You are not authenticated."]})
+        elif stub.inject_error():
+            self._send(503, {"errorMessages": ["Injected server error."]})
+        else:
+            with stub.lock:
+                status, response = _dispatch(stub.dataset, request)
+            self._send(status, response)
+
+    def _send(self, status: int, response: any) -> None:
+        """ Send a JSON response or the content of a file. """
+        content_type = "application/json;charset=UTF-8"
+
+        if isinstance(response, bytes):
+            data = response
+            content_type = "application/octet-stream"
+        else:
+            data = json.dumps(response).encode("utf-8") if response is not None else b""
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _now() -> str:
+    """ Get the current time as Jira timestamp. """
+    return datetime.datetime.now(datetime.timezone.utc).strftime(JIRA_DATE_FORMAT)
+
+
+def _get_time_zone() -> datetime.tzinfo:
+    """ Get the time zone of the user. UTC if the time zone database is not installed. """
+    try:
+        return zoneinfo.ZoneInfo(STUB_TIME_ZONE)
+    except zoneinfo.ZoneInfoNotFoundError:
+        return datetime.timezone.utc
+
+
+def _get_user(name: str) -> dict:
+    """ Get a user object. """
+    return {"name": name, "key": name, "displayName": name.capitalize(),
+            "emailAddress": f"{name}@example.com", "active": True}
+
+
+def _find(elements: list[dict], reference: dict) -> dict:
+    """ Find an element by the ID or name of a reference. """
+    for element in elements:
+        if reference.get("id") == element["id"] or reference.get("name") == element["name"]:
+            return element
+
+    return None
+
+
+def _generate_fields(custom_fields: int) -> list[dict]:
+    """ Generate the field catalogue with the system and the custom fields. """
+    fields = [{"id": field_id, "name": name, "custom": False, "navigable": True,
+               "clauseNames": [field_id], "schema": {"type": field_type, "system": field_id}}
+              for field_id, name, field_type in [
+                  ("summary", "Summary", "string"), ("description", "Description", "string"),
+                  ("project", "Project", "project"), ("issuetype", "Issue Type", "issuetype"),
+                  ("created", "Created", "datetime"), ("updated", "Updated", "datetime"),
+                  ("creator", "Creator", "user"), ("reporter", "Reporter", "user"),
+                  ("assignee", "Assignee", "user"), ("status", "Status", "status"),
+                  ("priority", "Priority", "priority"), ("labels", "Labels", "array"),
+                  ("components", "Component/s", "array"), ("subtasks", "Sub-Tasks", "array"),
+                  ("issuelinks", "Linked Issues", "array"), ("parent", "Parent", "issuelink"),
+                  ("attachment", "Attachment", "array"), ("comment", "Comment", "comments-page"),
+                  ("worklog", "Log Work", "array")]]
+
+    for idx in range(custom_fields):
+        field_type = CUSTOM_FIELD_TYPES[idx % len(CUSTOM_FIELD_TYPES)]
+        fields.append({"id": f"customfield_{10100 + idx}", "name": f"Custom {field_type} {idx}",
+                       "custom": True, "navigable": True,
+                       "clauseNames": [f"cf[{10100 + idx}]", f"Custom {field_type} {idx}"],
+                       "schema": {"type": field_type, "customId": 10100 + idx}})
+
+    return fields
+
+
+def _get_create_errors(fields: dict) -> dict:
+    """ Get the errors of the fields of a create request, like Jira reports them. """
+    errors = {field_id: f"Field '{field_id}' cannot be set. It is not on the appropriate "
+              "screen, or unknown." for field_id in fields if field_id in NOT_ON_CREATE_SCREEN}
+
+    if (SPRINT_FIELD["id"] in fields) and \
+            (isinstance(fields[SPRINT_FIELD["id"]], int) is False):
+        errors[SPRINT_FIELD["id"]] = "Number value expected as the Sprint id."
+
+    return errors
+
+
+def _get_page(values: list, query: dict, key: str = "values") -> dict:
+    """ Get a page of values with the pagination attributes. """
+    start_at = int(query.get("startAt", 0))
+    max_results = min(int(query.get("maxResults", 50)), MAX_RESULTS_LIMIT)
+    page = values[start_at:start_at + max_results]
+
+    return {"startAt": start_at, "maxResults": max_results, "total": len(values),
+            "isLast": start_at + len(page) >= len(values), key: page}
+
+
+# pylint: disable=too-many-return-statements,too-many-branches
+def _dispatch(dataset: JiraStubDataset, request: dict) -> tuple[int, any]:
+    """ Handle a request to an endpoint of the REST API.
+
+    Args:
+        dataset (JiraStubDataset): The dataset.
+        request (dict): The HTTP method, the path without the context path,
+                        the query parameters, the JSON body or None, the base URL
+                        and whether the stub behaves like Jira Cloud.
+
+    Returns:
+        tuple[int, any]: The HTTP status and the JSON response.
+    """
+    method = request["method"]
+    query = request["query"]
+    body = request["body"]
+    base_url = request["base_url"]
+    cloud = request.get("cloud", False)
+    segments = request["path"].strip("/").split("/")
+    api = "/".join(segments[:3])
+    resource = segments[3:]
+
+    if "rest/api/2" == api:
+        if ["serverInfo"] == resource:
+            return 200, {"baseUrl": STUB_CONTEXT_PATH,
+                         "version": ".".join(map(str, STUB_VERSION)),
+                         "versionNumbers": STUB_VERSION,
+                         "deploymentType": "Cloud" if cloud else "Server",
+                         "buildNumber": 817001, "serverTitle": "Jira Stub",
+                         "serverTime": _now()}
+
+        if ["myself"] == resource:
+            return 200, dict(_get_user(STUB_USER), timeZone=STUB_TIME_ZONE, accountId=STUB_USER)
+
+        if ["field"] == resource:
+            return 200, dataset.fields
+
+        if ["issuetype"] == resource:
+            return 200, ISSUE_TYPES
+
+        if ["search"] == resource:
+            if cloud:
+                return 410, {"errorMessages": ["The requested API has been removed. "
+                                               "Please migrate to the /search/jql API."]}
+
+            return _search(dataset, body if "POST" == method else query, base_url)
+
+        if ["search", "jql"] == resource:
+            return _search_jql(dataset, body if "POST" == method else query, base_url)
+
+        if (["search", "approximate-count"] == resource) and ("POST" == method):
+            status, page = _search(dataset, {"jql": body.get("jql", ""), "maxResults": 0},
+                                   base_url)
+            return status, {"count": page["total"]} if 200 == status else page
+
+        if (["issue", "bulk"] == resource) and ("POST" == method):
+            created = []
+            errors = []
+
+            for idx, update in enumerate(body["issueUpdates"]):
+                create_errors = _get_create_errors(update["fields"])
+
+                if create_errors:
+                    errors.append({"status": 400, "failedElementNumber": idx,
+                                   "elementErrors": {"errorMessages": [],
+                                                     "errors": create_errors}})
+                else:
+                    created.append(dataset.create_issue(update["fields"]))
+
+            return 201 if created else 400, {
+                "issues": [_get_reference(issue, base_url) for issue in created],
+                "errors": errors}
+
+        if (["issue"] == resource) and ("POST" == method):
+            create_errors = _get_create_errors(body["fields"])
+
+            if create_errors:
+                return 400, {"errorMessages": [], "errors": create_errors}
+
+            issue = dataset.create_issue(body["fields"])
+            return 201, _get_reference(issue, base_url)
+
+        if (4 <= len(resource)) and (["issue", "createmeta"] == resource[:2]):
+            if 4 == len(resource):
+                return 200, _get_page(ISSUE_TYPES, query)
+
+            return 200, _get_page([{"fieldId": field["id"], "name": field["name"],
+                                    "required": field["id"] in ("summary", "issuetype"),
+                                    "schema": field["schema"]}
+                                   for field in dataset.fields
+                                   if field["id"] not in NOT_ON_CREATE_SCREEN], query)
+
+        if (2 <= len(resource)) and ("issue" == resource[0]):
+            return _issue(dataset, request, resource[1:])
+
+        if (2 <= len(resource)) and ("project" == resource[0]):
+            if resource[1] not in (STUB_PROJECT_KEY, STUB_PROJECT_ID):
+                return 404, {"errorMessages": ["No project could be found."]}
+
+            if ["components"] == resource[2:]:
+                return 200, dataset.components
+
+            return 200, {"id": STUB_PROJECT_ID, "key": STUB_PROJECT_KEY,
+                         "name": "Stub Project", "issueTypes": ISSUE_TYPES}
+
+        if (["component"] == resource) and ("POST" == method):
+            component = {"id": str(10100 + len(dataset.components)), "name": body["name"],
+                         "description": body.get("description", "")}
+            dataset.components.append(component)
+            return 201, component
+
+    elif ["secure", "attachment"] == segments[:2]:
+        if (3 <= len(segments)) and (segments[2] in dataset.attachments):
+            return 200, dataset.attachments[segments[2]]
+
+        return 404, {"errorMessages": ["The attachment does not exist."]}
+
+    elif "rest/agile/1.0" == api:
+        if ["board"] == resource:
+            return 200, _get_page([{"id": 1, "name": STUB_BOARD_NAME, "type": "scrum"}], query)
+
+        if ["board", "1", "sprint"] == resource:
+            return 200, _get_page(dataset.sprints, query)
+
+    return 404, {"errorMessages": [
+        f"Endpoint {method} {request['path']} is not implemented by the stub."]}
+
+
+def _issue(dataset: JiraStubDataset, request: dict, resource: list[str]) -> tuple[int, any]:
+    """ Handle the requests to a single issue and its worklogs. """
+    issue = dataset.get_issue(resource[0])
+
+    if issue is None:
+        return 404, {"errorMessages": ["Issue Does Not Exist"]}
+
+    if ["worklog"] == resource[1:]:
+        worklogs = dataset.worklogs.get(issue["key"], [])
+        return 200, {"startAt": 0, "maxResults": len(worklogs), "total": len(worklogs),
+                     "worklogs": worklogs}
+
+    if "PUT" == request["method"]:
+        dataset.update_issue(issue, request["body"].get("fields", {}))
+        return 204, None
+
+    return 200, _select_fields(issue, request["query"].get("fields", ""), request["base_url"])
+
+
+def _get_reference(issue: dict, base_url: str) -> dict:
+    """ Get the ID, key and URL of an issue. """
+    return {"id": issue["id"], "key": issue["key"],
+            "self": f"{base_url}/rest/api/2/issue/{issue['id']}"}
+
+
+def _select_fields(issue: dict, fields: any, base_url: str) -> dict:
+    """ Get a copy of an issue with only the requested fields. """
+    if isinstance(fields, str):
+        fields = [field for field in fields.split(",") if field]
+
+    if (not fields) or ("*all" in fields) or ("*navigable" in fields):
+        selected = dict(issue["fields"])
+    else:
+        selected = {field: issue["fields"].get(field) for field in fields}
+
+    if selected.get("attachment"):
+        selected["attachment"] = [dict(attachment, content=f"{base_url}/{attachment['content']}")
+                                  for attachment in selected["attachment"]]
+
+    return dict(_get_reference(issue, base_url), fields=selected)
+
+
+def _search(dataset: JiraStubDataset, params: dict, base_url: str) -> tuple[int, any]:
+    """ Search the issues with the JQL subset supported by the stub. """
+    params = params or {}
+
+    try:
+        condition, order_by = _parse_jql(params.get("jql", ""))
+        issues = [issue for issue in dataset.issues if _evaluate(condition, issue)]
+    except ValueError as e:
+        return 400, {"errorMessages": [str(e)], "errors": {}}
+
+    for field, descending in reversed(order_by):
+        issues.sort(key=lambda issue, field=field: _sort_key(_get_value(issue, field)),
+                    reverse=descending)
+
+    page = _get_page(issues, params, "issues")
+    page["issues"] = [_select_fields(issue, params.get("fields", ""), base_url)
+                      for issue in page["issues"]]
+
+    return 200, page
+
+
+def _search_jql(dataset: JiraStubDataset, params: dict, base_url: str) -> tuple[int, any]:
+    """ Search the issues like the enhanced search of Jira Cloud. The pages have
+        no total, but the token of the next page, which is the offset in the stub. """
+    params = dict(params or {}, startAt=(params or {}).get("nextPageToken", 0))
+    status, page = _search(dataset, params, base_url)
+
+    if 200 != status:
+        return status, page
+
+    result = {"issues": page["issues"], "isLast": page["isLast"]}
+
+    if not page["isLast"]:
+        result["nextPageToken"] = str(page["startAt"] + len(page["issues"]))
+
+    return status, result
+
+
+def _tokenize(jql: str) -> list[tuple[str, str]]:
+    """ Split a JQL string into (type, value) tokens. """
+    tokens = []
+    position = 0
+    jql = jql.strip()
+
+    while position < len(jql):
+        match = _JQL_TOKEN_PATTERN.match(jql, position)
+
+        if match is None:
+            raise ValueError(f"Error in the JQL Query: unexpected character at {position}.")
+
+        kind = match.lastgroup
+        value = match.group(kind)
+
+        if "string" == kind:
+            value = value[1:-1]
+
+        tokens.append((kind, value))
+        position = match.end()
+
+    return tokens
+
+
+def _parse_jql(jql: str) -> tuple[any, list[tuple[str, bool]]]:
+    """ Parse the JQL subset of the stub into a condition tree and the order.
+
+    Supported are AND, OR, NOT, parentheses, the operators =, !=, <, <=, >, >=, ~, !~,
+    IN and NOT IN and ORDER BY with ASC and DESC.
+
+    Returns:
+        tuple: The condition tree (None matches everything) and the list of
+               (field, descending) to order by.
+    """
+    tokens = _tokenize(jql)
+    order_by = []
+
+    for idx, (kind, value) in enumerate(tokens):
+        if ("word" == kind) and ("order" == value.lower()) and \
+                (idx + 1 < len(tokens)) and ("by" == tokens[idx + 1][1].lower()):
+            order_tokens = [token[1] for token in tokens[idx + 2:] if "," != token[1]]
+            tokens = tokens[:idx]
+
+            for order_idx, order_value in enumerate(order_tokens):
+                if order_value.lower() not in ("asc", "desc"):
+                    descending = (order_idx + 1 < len(order_tokens)) and \
+                        ("desc" == order_tokens[order_idx + 1].lower())
+                    order_by.append((order_value.lower(), descending))
+            break
+
+    if 0 == len(tokens):
+        return None, order_by
+
+    condition, position = _parse_or(tokens, 0)
+
+    if position != len(tokens):
+        raise ValueError(f"Error in the JQL Query: unexpected '{tokens[position][1]}'.")
+
+    return condition, order_by
+
+
+def _parse_or(tokens: list, position: int) -> tuple[any, int]:
+    """ Parse conditions combined with OR. """
+    left, position = _parse_and(tokens, position)
+
+    while (position < len(tokens)) and ("or" == tokens[position][1].lower()):
+        right, position = _parse_and(tokens, position + 1)
+        left = ("or", left, right)
+
+    return left, position
+
+
+def _parse_and(tokens: list, position: int) -> tuple[any, int]:
+    """ Parse conditions combined with AND. """
+    left, position = _parse_not(tokens, position)
+
+    while (position < len(tokens)) and ("and" == tokens[position][1].lower()):
+        right, position = _parse_not(tokens, position + 1)
+        left = ("and", left, right)
+
+    return left, position
+
+
+def _parse_not(tokens: list, position: int) -> tuple[any, int]:
+    """ Parse a negated condition, a condition in parentheses or a clause. """
+    if position >= len(tokens):
+        raise ValueError("Error in the JQL Query: the query is incomplete.")
+
+    if "not" == tokens[position][1].lower():
+        condition, position = _parse_not(tokens, position + 1)
+        return ("not", condition), position
+
+    if "(" == tokens[position][1]:
+        condition, position = _parse_or(tokens, position + 1)
+
+        if (position >= len(tokens)) or (")" != tokens[position][1]):
+            raise ValueError("Error in the JQL Query: missing ')'.")
+
+        return condition, position + 1
+
+    if position + 1 >= len(tokens):
+        raise ValueError("Error in the JQL Query: the query is incomplete.")
+
+    field = tokens[position][1].lower()
+    operator = tokens[position + 1][1].lower()
+    position += 2
+
+    if ("not" == operator) and (position < len(tokens)) and ("in" == tokens[position][1].lower()):
+        operator = "not in"
+        position += 1
+
+    if ("is" == operator) and (position < len(tokens)) and ("not" == tokens[position][1].lower()):
+        operator = "is not"
+        position += 1
+
+    if operator in ("in", "not in"):
+        values = []
+
+        if (position >= len(tokens)) or ("(" != tokens[position][1]):
+            raise ValueError("Error in the JQL Query: expected '(' after IN.")
+
+        position += 1
+
+        while (position < len(tokens)) and (")" != tokens[position][1]):
+            if "," != tokens[position][1]:
+                values.append(tokens[position][1])
+            position += 1
+
+        return ("clause", field, operator, values), position + 1
+
+    if position >= len(tokens):
+        raise ValueError("Error in the JQL Query: the query is incomplete.")
+
+    return ("clause", field, operator, tokens[position][1]), position + 1
+
+
+def _get_value(issue: dict, field: str) -> any:
+    """ Get the comparable value of an issue field. """
+    value = None
+
+    if field in ("key", "issuekey"):
+        value = issue["key"]
+    elif "id" == field:
+        value = int(issue["id"])
+    elif "type" == field:
+        value = issue["fields"]["issuetype"]["name"]
+    elif "text" == field:
+        value = f"{issue['fields'].get('summary', '')} {issue['fields'].get('description', '')}"
+    else:
+        value = issue["fields"].get(field)
+
+        if isinstance(value, dict):
+            value = value.get("key") or value.get("name") or value.get("value")
+
+    return value
+
+
+def _sort_key(value: any) -> tuple:
+    """ Get a sort key which orders issue keys by their number. """
+    if isinstance(value, str) and _ISSUE_KEY_PATTERN.match(value):
+        project, number = value.rsplit("-", 1)
+        return (0, project, int(number))
+
+    if isinstance(value, (int, float)):
+        return (1, value)
+
+    return (2, str(value)) if value is not None else (3, "")
+
+
+# The dates of all issues are parsed again by every search with a date condition.
+@functools.lru_cache(maxsize=None)
+def _parse_date(value: str) -> datetime.datetime:
+    """ Parse a date of a JQL query or an issue field.
+        Naive dates are in the time zone of the user. """
+    for date_format in (JIRA_DATE_FORMAT, "%Y-%m-%dT%H:%M:%S.%f%z", "%Y/%m/%d %H:%M",
+                        "%Y-%m-%d %H:%M", "%Y/%m/%d", "%Y-%m-%d"):
+        try:
+            date = datetime.datetime.strptime(value, date_format)
+            return date if date.tzinfo is not None else date.replace(tzinfo=_get_time_zone())
+        except ValueError:
+            pass
+
+    raise ValueError(f"Error in the JQL Query: '{value}' is no valid date.")
+
+
+def _compare(actual: any, operator: str, expected: str) -> bool:
+    """ Compare an issue value with a JQL value. """
+    result = False
+
+    if "~" == operator:
+        result = str(expected).lower() in str(actual or "").lower()
+    elif operator in ("is", "is not"):
+        # Only EMPTY and NULL are supported, an empty list is empty as well.
+        result = (actual in (None, [])) == ("is" == operator)
+    elif actual is None:
+        result = ("!=" == operator) and ("empty" != expected.lower())
+    elif isinstance(actual, (int, float)):
+        result = _compare_values(actual, operator, float(expected))
+    elif re.match(r"^\d{4}-\d{2}-\d{2}", str(actual)) and re.match(r"^\d{4}[-/]", expected):
+        result = _compare_values(_parse_date(actual), operator, _parse_date(expected))
+    elif (0 == _sort_key(actual)[0]) and (0 == _sort_key(expected)[0]):
+        result = _compare_values(_sort_key(actual), operator, _sort_key(expected))
+    else:
+        result = _compare_values(str(actual).lower(), operator, expected.lower())
+
+    return result
+
+
+def _compare_values(actual: any, operator: str, expected: any) -> bool:
+    """ Compare two values of the same type. """
+    return {
+        "=": actual == expected,
+        "!=": actual != expected,
+        "<": actual < expected,
+        "<=": actual <= expected,
+        ">": actual > expected,
+        ">=": actual >= expected
+    }.get(operator, False)
+
+
+def _evaluate(condition: any, issue: dict) -> bool:
+    """ Evaluate a condition tree for an issue. """
+    result = True
+
+    if condition is None:
+        result = True
+    elif "and" == condition[0]:
+        result = _evaluate(condition[1], issue) and _evaluate(condition[2], issue)
+    elif "or" == condition[0]:
+        result = _evaluate(condition[1], issue) or _evaluate(condition[2], issue)
+    elif "not" == condition[0]:
+        result = not _evaluate(condition[1], issue)
+    else:
+        _, field, operator, expected = condition
+        actual = _get_value(issue, field)
+
+        if operator in ("in", "not in"):
+            # Exports search many keys at once, which are compared without the JQL parsing.
+            if field in ("key", "issuekey"):
+                matches = actual.upper() in {value.upper() for value in expected}
+            else:
+                matches = any(_compare(actual, "=", value) for value in expected)
+            result = matches if "in" == operator else not matches
+        elif "!~" == operator:
+            result = not _compare(actual, "~", expected)
+        else:
+            result = _compare(actual, operator, expected)
+
+    return result
+
+
+def _main() -> None:
+    """ Run the stub server until interrupted. """
+    parser = argparse.ArgumentParser(description="Jira REST API stub server for offline tests.")
+    parser.add_argument("--port", type=int, default=2990, help="Port to listen on.")
+    parser.add_argument("--issues", type=int, default=1000, help="Number of issues.")
+    parser.add_argument("--custom-fields", type=int, default=20, help="Number of custom fields.")
+    parser.add_argument("--worklogs", type=int, default=2, help="Number of worklogs per issue.")
+    parser.add_argument("--subtasks", type=int, default=2, help="Number of sub-tasks per issue.")
+    parser.add_argument("--attachments", type=int, default=0,
+                        help="Number of attachments per issue.")
+    parser.add_argument("--latency", type=float, default=0, help="Latency in milliseconds.")
+    parser.add_argument("--error-rate", type=float, default=0,
+                        help="Probability of a server error per request.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random generators.")
+    parser.add_argument("--cloud", action="store_true",
+                        help="Behave like Jira Cloud, which only pages the search with tokens.")
+    args = parser.parse_args()
+
+    stub = JiraStubServer(JiraStubDataset(args.issues, args.custom_fields, args.worklogs,
+                                          args.subtasks, args.seed, args.attachments),
+                          args.port, args.latency, args.error_rate, args.seed, args.cloud)
+
+    print(f"Jira stub server running on {stub.url}")
+    stub.serve_forever()
+
+################################################################################
+# Main
+################################################################################
+
+
+if __name__ == "__main__":
+    _main()